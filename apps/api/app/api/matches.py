@@ -1,66 +1,168 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import extract, func, or_, select
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import ColumnElement, and_, false, func, null, or_, select, type_coerce
 from sqlalchemy.orm import Session
 
+from app.core.cache import cached_json_response, response_cache
+from app.core.config import settings
+from app.core.serialization import json_response, row_dicts
 from app.db.models import Match, MatchEvent, MatchStat
-from app.db.session import get_db
+from app.db.session import DbRunner, get_db_runner
 from app.schemas.common import ErrorResponse
-from app.schemas.match import (
-    MatchDetailResponse,
-    MatchEventItem,
-    MatchListItem,
-    MatchListResponse,
-    MatchStatItem,
-)
+from app.schemas.match import MatchDetailResponse, MatchListResponse
 
 router = APIRouter(prefix="/matches", tags=["matches"])
 
+_MATCH_ITEM_COLUMNS = (
+    Match.match_id,
+    Match.round,
+    Match.match_date,
+    Match.home_team_id,
+    Match.away_team_id,
+    Match.home_score,
+    Match.away_score,
+    Match.status,
+)
+_MATCH_ITEM_KEYS = tuple(column.key for column in _MATCH_ITEM_COLUMNS)
+
+
+def _encode_cursor(match_date: datetime, match_id: int) -> str:
+    raw = json.dumps([match_date.isoformat(), match_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        match_date, match_id = json.loads(raw)
+        return datetime.fromisoformat(match_date), int(match_id)
+    except (binascii.Error, TypeError, ValueError):
+        raise HTTPException(status_code=422, detail="invalid cursor") from None
+
+
+def _month_filter(db: Session, month: int, season: int) -> ColumnElement[bool]:
+    """Calendar-month filter as a `match_date` range, so it can seek the `(season, match_date)` index.
+
+    Only calendar years whose month window overlaps the season's first/last kickoff get a range,
+    which for a normal season leaves exactly one.
+    """
+    first, last = response_cache.memo(
+        ("matches.date_bounds", season),
+        lambda: tuple(
+            db.execute(
+                select(func.min(Match.match_date), func.max(Match.match_date)).where(Match.season == season)
+            ).one()
+        ),
+    )
+    if first is None or last is None:
+        return false()
+    windows = [
+        (datetime(year, month, 1), datetime(year + month // 12, month % 12 + 1, 1))
+        for year in range(first.year, last.year + 1)
+    ]
+    return or_(
+        false(),
+        *(
+            and_(Match.match_date >= start, Match.match_date < end)
+            for start, end in windows
+            if start <= last and end > first
+        ),
+    )
+
+
+def _team_filter(team_id: int, season: int) -> ColumnElement[bool]:
+    """Home-or-away filter as a UNION of two index lookups instead of an `OR` across columns."""
+    fixture_ids = (
+        select(Match.match_id)
+        .where(Match.season == season, Match.home_team_id == team_id)
+        .union_all(select(Match.match_id).where(Match.season == season, Match.away_team_id == team_id))
+    )
+    return Match.match_id.in_(fixture_ids)
+
 
 @router.get("", response_model=MatchListResponse)
-def list_matches(
+async def list_matches(
+    request: Request,
+    season: int | None = Query(default=None, ge=1888, le=2100),
     round: int | None = Query(default=None, ge=1, le=38),
     month: int | None = Query(default=None, ge=1, le=12),
     team_id: int | None = Query(default=None, ge=1),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
-) -> MatchListResponse:
-    filters = []
+    cursor: str | None = Query(default=None, max_length=128),
+    include_total: bool = Query(default=True),
+    db: DbRunner = Depends(get_db_runner),
+) -> Response:
+    after = _decode_cursor(cursor) if cursor is not None else None
+    return await db.run(
+        lambda session: cached_json_response(
+            request,
+            session,
+            lambda: _build_match_list(
+                session,
+                season=season if season is not None else settings.active_season(),
+                round=round,
+                month=month,
+                team_id=team_id,
+                limit=limit,
+                offset=offset,
+                after=after,
+                include_total=include_total,
+            ),
+        )
+    )
+
+
+def _build_match_list(
+    db: Session,
+    *,
+    season: int,
+    round: int | None,
+    month: int | None,
+    team_id: int | None,
+    limit: int,
+    offset: int,
+    after: tuple[datetime, int] | None,
+    include_total: bool,
+) -> dict[str, object]:
+    filters = [Match.season == season]
 
     if round is not None:
         filters.append(Match.round == round)
 
     if month is not None:
-        filters.append(extract("month", Match.match_date) == month)
+        filters.append(_month_filter(db, month, season))
 
     if team_id is not None:
-        filters.append(or_(Match.home_team_id == team_id, Match.away_team_id == team_id))
-
-    count_query = select(func.count(Match.match_id))
-    list_query = select(Match).order_by(Match.match_date.desc(), Match.match_id.desc()).limit(limit).offset(offset)
-
-    if filters:
-        count_query = count_query.where(*filters)
-        list_query = list_query.where(*filters)
-
-    total = db.execute(count_query).scalar_one()
-    rows = db.execute(list_query).scalars().all()
-
-    items = [
-        MatchListItem(
-            match_id=row.match_id,
-            round=row.round,
-            match_date=row.match_date,
-            home_team_id=row.home_team_id,
-            away_team_id=row.away_team_id,
-            home_score=row.home_score,
-            away_score=row.away_score,
-            status=row.status,
+        filters.append(_team_filter(team_id, season))
+
+    total = None
+    if include_total:
+        count_query = select(func.count(Match.match_id)).where(*filters)
+        total = response_cache.memo(
+            ("matches.count", season, round, month, team_id),
+            lambda: db.execute(count_query).scalar_one(),
         )
-        for row in rows
-    ]
 
-    return MatchListResponse(total=total, items=items)
+    list_query = select(*_MATCH_ITEM_COLUMNS).where(*filters).order_by(Match.match_date.desc(), Match.match_id.desc())
+    if after is not None:
+        after_date, after_id = after
+        list_query = list_query.where(
+            or_(Match.match_date < after_date, and_(Match.match_date == after_date, Match.match_id < after_id))
+        )
+    elif offset:
+        list_query = list_query.offset(offset)
+
+    rows = db.execute(list_query.limit(limit + 1)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = _encode_cursor(rows[-1].match_date, rows[-1].match_id) if has_more else None
+
+    return {"total": total, "items": row_dicts(rows), "next_cursor": next_cursor}
 
 
 @router.get(
@@ -73,56 +175,96 @@ def list_matches(
         }
     },
 )
-def get_match_detail(match_id: int, db: Session = Depends(get_db)) -> MatchDetailResponse:
-    row = db.execute(select(Match).where(Match.match_id == match_id)).scalar_one_or_none()
-    if row is None:
+async def get_match_detail(match_id: int, db: DbRunner = Depends(get_db_runner)) -> Response:
+    return json_response(await db.run(lambda session: _build_match_detail(session, match_id)))
+
+
+def _build_match_detail(db: Session, match_id: int) -> dict[str, object]:
+    rows = db.execute(_match_detail_query(match_id)).all()
+    if not rows:
         raise HTTPException(status_code=404, detail="match not found")
 
-    events = db.execute(
-        select(MatchEvent)
-        .where(MatchEvent.match_id == match_id)
-        .order_by(MatchEvent.minute.asc(), MatchEvent.event_id.asc())
-    ).scalars().all()
-
-    stats = db.execute(
-        select(MatchStat).where(MatchStat.match_id == match_id).order_by(MatchStat.team_id.asc())
-    ).scalars().all()
-
-    event_items = [
-        MatchEventItem(
-            event_id=event.event_id,
-            minute=event.minute,
-            event_type=event.event_type,
-            team_id=event.team_id,
-            player_name=event.player_name,
-            detail=event.detail,
-        )
-        for event in events
-    ]
+    head = rows[0]
+    events = sorted(
+        (row for row in rows if row.event_event_id is not None),
+        key=lambda row: (row.event_minute, row.event_event_id),
+    )
+    stats = sorted((row for row in rows if row.stat_team_id is not None), key=lambda row: row.stat_team_id)
 
-    stat_items = [
-        MatchStatItem(
-            team_id=stat.team_id,
-            possession=float(stat.possession) if stat.possession is not None else None,
-            shots=stat.shots,
-            shots_on_target=stat.shots_on_target,
-            fouls=stat.fouls,
-            corners=stat.corners,
-        )
-        for stat in stats
-    ]
+    return {
+        "match": dict(zip(_MATCH_ITEM_KEYS, head[: len(_MATCH_ITEM_KEYS)])),
+        "events": [
+            {
+                "event_id": event.event_event_id,
+                "minute": event.event_minute,
+                "event_type": event.event_event_type,
+                "team_id": event.event_team_id,
+                "player_name": event.event_player_name,
+                "detail": event.event_detail,
+            }
+            for event in events
+        ],
+        "stats": [
+            {
+                "team_id": stat.stat_team_id,
+                "possession": float(stat.stat_possession) if stat.stat_possession is not None else None,
+                "shots": stat.stat_shots,
+                "shots_on_target": stat.stat_shots_on_target,
+                "fouls": stat.stat_fouls,
+                "corners": stat.stat_corners,
+            }
+            for stat in stats
+        ],
+    }
 
-    return MatchDetailResponse(
-        match=MatchListItem(
-            match_id=row.match_id,
-            round=row.round,
-            match_date=row.match_date,
-            home_team_id=row.home_team_id,
-            away_team_id=row.away_team_id,
-            home_score=row.home_score,
-            away_score=row.away_score,
-            status=row.status,
-        ),
-        events=event_items,
-        stats=stat_items,
+
+_DETAIL_EVENT_COLUMNS = (
+    MatchEvent.event_id,
+    MatchEvent.minute,
+    MatchEvent.event_type,
+    MatchEvent.team_id,
+    MatchEvent.player_name,
+    MatchEvent.detail,
+)
+_DETAIL_STAT_COLUMNS = (
+    MatchStat.team_id,
+    MatchStat.possession,
+    MatchStat.shots,
+    MatchStat.shots_on_target,
+    MatchStat.fouls,
+    MatchStat.corners,
+)
+
+
+def _labelled(prefix: str, columns: tuple, *, empty: bool = False) -> list:
+    if empty:
+        return [type_coerce(null(), column.type).label(f"{prefix}_{column.key}") for column in columns]
+    return [column.label(f"{prefix}_{column.key}") for column in columns]
+
+
+def _match_detail_query(match_id: int):
+    """Match, events and stats in one round-trip: event rows UNION ALL stat rows, each carrying the match columns.
+
+    The event branch is an outer join, so a match with neither events nor stats still yields one row.
+    """
+    event_rows = (
+        select(
+            *_labelled("match", _MATCH_ITEM_COLUMNS),
+            *_labelled("event", _DETAIL_EVENT_COLUMNS),
+            *_labelled("stat", _DETAIL_STAT_COLUMNS, empty=True),
+        )
+        .select_from(Match)
+        .outerjoin(MatchEvent, MatchEvent.match_id == Match.match_id)
+        .where(Match.match_id == match_id)
+    )
+    stat_rows = (
+        select(
+            *_labelled("match", _MATCH_ITEM_COLUMNS),
+            *_labelled("event", _DETAIL_EVENT_COLUMNS, empty=True),
+            *_labelled("stat", _DETAIL_STAT_COLUMNS),
+        )
+        .select_from(Match)
+        .join(MatchStat, MatchStat.match_id == Match.match_id)
+        .where(Match.match_id == match_id)
     )
+    return event_rows.union_all(stat_rows)
@@ -1,32 +1,45 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.cache import cached_json_response
+from app.core.config import settings
+from app.core.serialization import row_dicts
 from app.db.models import Standing
-from app.db.session import get_db
-from app.schemas.standing import StandingItem, StandingsResponse
+from app.db.session import DbRunner, get_db_runner
+from app.schemas.standing import StandingsResponse
 
 router = APIRouter(prefix="/standings", tags=["standings"])
 
 
 @router.get("", response_model=StandingsResponse)
-def list_standings(db: Session = Depends(get_db)) -> StandingsResponse:
-    rows = db.execute(select(Standing).order_by(Standing.rank.asc(), Standing.team_id.asc())).scalars().all()
+async def list_standings(
+    request: Request,
+    season: int | None = Query(default=None, ge=1888, le=2100),
+    db: DbRunner = Depends(get_db_runner),
+) -> Response:
+    resolved = season if season is not None else settings.active_season()
+    return await db.run(
+        lambda session: cached_json_response(request, session, lambda: _build_standings(session, resolved))
+    )
 
-    items = [
-        StandingItem(
-            team_id=row.team_id,
-            rank=row.rank,
-            played=row.played,
-            won=row.won,
-            drawn=row.drawn,
-            lost=row.lost,
-            goals_for=row.goals_for,
-            goals_against=row.goals_against,
-            goal_diff=row.goal_diff,
-            points=row.points,
-        )
-        for row in rows
-    ]
 
-    return StandingsResponse(total=len(items), items=items)
+def _build_standings(db: Session, season: int) -> dict[str, object]:
+    rows = db.execute(
+        select(
+            Standing.team_id,
+            Standing.rank,
+            Standing.played,
+            Standing.won,
+            Standing.drawn,
+            Standing.lost,
+            Standing.goals_for,
+            Standing.goals_against,
+            Standing.goal_diff,
+            Standing.points,
+        )
+        .where(Standing.season == season)
+        .order_by(Standing.rank.asc(), Standing.team_id.asc())
+    ).all()
+    items = row_dicts(rows)
+    return {"total": len(items), "items": items}
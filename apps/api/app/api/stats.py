@@ -1,46 +1,68 @@
 from typing import Literal
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import desc, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
-from app.db.models import Player, PlayerSeasonStat, Team
-from app.db.session import get_db
-from app.schemas.stats import TopStatItem, TopStatsResponse
+from app.core.cache import cached_json_response
+from app.core.config import settings
+from app.core.leaderboard import leaderboard_index
+from app.db.session import DbRunner, get_db_runner
+from app.schemas.common import ErrorResponse
+from app.schemas.stats import PlayerRankResponse, TopStatsResponse
 
 router = APIRouter(prefix="/stats", tags=["stats"])
 
 
 @router.get("/top", response_model=TopStatsResponse)
-def top_stats(
+async def top_stats(
+    request: Request,
     category: Literal["goals", "assists", "attack_points", "clean_sheets"] = Query(default="goals"),
     limit: int = Query(default=10, ge=1, le=50),
-    db: Session = Depends(get_db),
-) -> TopStatsResponse:
-    metric = getattr(PlayerSeasonStat, category)
-
-    rows = db.execute(
-        select(PlayerSeasonStat, Player, Team)
-        .join(Player, Player.player_id == PlayerSeasonStat.player_id)
-        .join(Team, Team.team_id == Player.team_id)
-        .order_by(desc(metric), Player.player_id.asc())
-        .limit(limit)
-    ).all()
-
-    items = [
-        TopStatItem(
-            player_id=player.player_id,
-            player_name=player.name,
-            team_id=team.team_id,
-            team_name=team.name,
-            team_short_name=team.short_name,
-            value=getattr(stat, category),
-            goals=stat.goals,
-            assists=stat.assists,
-            attack_points=stat.attack_points,
-            clean_sheets=stat.clean_sheets,
+    season: int | None = Query(default=None, ge=1888, le=2100),
+    db: DbRunner = Depends(get_db_runner),
+) -> Response:
+    resolved = season if season is not None else settings.active_season()
+    return await db.run(
+        lambda session: cached_json_response(
+            request, session, lambda: _build_top_stats(session, category, limit, resolved)
         )
-        for stat, player, team in rows
-    ]
+    )
 
-    return TopStatsResponse(category=category, total=len(items), items=items)
+
+def _build_top_stats(db: Session, category: str, limit: int, season: int) -> dict[str, object]:
+    items = leaderboard_index.get(db, season).top(category, limit)
+    return {"category": category, "total": len(items), "items": items}
+
+
+@router.get(
+    "/rank",
+    response_model=PlayerRankResponse,
+    responses={
+        404: {
+            "model": ErrorResponse,
+            "description": "Player has no season stats",
+        }
+    },
+)
+async def player_rank(
+    request: Request,
+    player_id: int = Query(ge=1),
+    category: Literal["goals", "assists", "attack_points", "clean_sheets"] = Query(default="goals"),
+    season: int | None = Query(default=None, ge=1888, le=2100),
+    db: DbRunner = Depends(get_db_runner),
+) -> Response:
+    resolved = season if season is not None else settings.active_season()
+    return await db.run(
+        lambda session: cached_json_response(
+            request, session, lambda: _build_player_rank(session, category, player_id, resolved)
+        )
+    )
+
+
+def _build_player_rank(db: Session, category: str, player_id: int, season: int) -> dict[str, object]:
+    leaderboard = leaderboard_index.get(db, season)
+    ranked = leaderboard.rank_of(category, player_id)
+    if ranked is None:
+        raise HTTPException(status_code=404, detail="player stats not found")
+    rank, item = ranked
+    return {"category": category, "rank": rank, "total": leaderboard.size(category), "item": item}
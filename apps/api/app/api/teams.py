@@ -1,16 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, or_, select
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import Row, func, or_, select
 from sqlalchemy.orm import Session
 
+from app.core.cache import cached_json_response
+from app.core.serialization import json_response, row_dicts
 from app.db.models import Match, Player, Team
-from app.db.session import get_db
+from app.db.session import DbRunner, get_db_runner
 from app.schemas.common import ErrorResponse
-from app.schemas.team import SquadPlayerItem, TeamDetailResponse, TeamItem, TeamListResponse
+from app.schemas.team import TeamDetailResponse, TeamListResponse
 
 router = APIRouter(prefix="/teams", tags=["teams"])
 
 
-def _match_result_for_team(match: Match, team_id: int) -> str:
+_TEAM_ITEM_COLUMNS = (Team.team_id, Team.name, Team.short_name, Team.logo_url, Team.stadium, Team.manager)
+
+
+def _match_result_for_team(match: Row, team_id: int) -> str:
     if match.home_score is None or match.away_score is None:
         return "D"
 
@@ -32,20 +37,14 @@ def _match_result_for_team(match: Match, team_id: int) -> str:
 
 
 @router.get("", response_model=TeamListResponse)
-def list_teams(db: Session = Depends(get_db)) -> TeamListResponse:
-    rows = db.execute(select(Team).order_by(Team.name.asc())).scalars().all()
-    items = [
-        TeamItem(
-            team_id=row.team_id,
-            name=row.name,
-            short_name=row.short_name,
-            logo_url=row.logo_url,
-            stadium=row.stadium,
-            manager=row.manager,
-        )
-        for row in rows
-    ]
-    return TeamListResponse(total=len(items), items=items)
+async def list_teams(request: Request, db: DbRunner = Depends(get_db_runner)) -> Response:
+    return await db.run(lambda session: cached_json_response(request, session, lambda: _build_team_list(session)))
+
+
+def _build_team_list(db: Session) -> dict[str, object]:
+    rows = db.execute(select(*_TEAM_ITEM_COLUMNS).order_by(Team.name.asc())).all()
+    items = row_dicts(rows)
+    return {"total": len(items), "items": items}
 
 
 @router.get(
@@ -58,50 +57,42 @@ def list_teams(db: Session = Depends(get_db)) -> TeamListResponse:
         }
     },
 )
-def get_team_detail(team_id: int, db: Session = Depends(get_db)) -> TeamDetailResponse:
-    team = db.execute(select(Team).where(Team.team_id == team_id)).scalar_one_or_none()
+async def get_team_detail(team_id: int, db: DbRunner = Depends(get_db_runner)) -> Response:
+    return json_response(await db.run(lambda session: _build_team_detail(session, team_id)))
+
+
+def _build_team_detail(db: Session, team_id: int) -> dict[str, object]:
+    team = db.execute(select(*_TEAM_ITEM_COLUMNS).where(Team.team_id == team_id)).one_or_none()
     if team is None:
         raise HTTPException(status_code=404, detail="team not found")
 
     recent_matches = db.execute(
-        select(Match)
+        select(Match.home_team_id, Match.away_team_id, Match.home_score, Match.away_score)
         .where(
             Match.status == "FINISHED",
             or_(Match.home_team_id == team_id, Match.away_team_id == team_id),
         )
         .order_by(Match.match_date.desc(), Match.match_id.desc())
         .limit(5)
-    ).scalars().all()
+    ).all()
 
     recent_form = [_match_result_for_team(match, team_id) for match in recent_matches]
 
     squad_rows = db.execute(
-        select(Player)
+        select(
+            Player.player_id,
+            Player.name,
+            Player.position,
+            Player.jersey_num,
+            Player.nationality,
+            Player.photo_url,
+        )
         .where(Player.team_id == team_id)
         .order_by(Player.position.asc(), func.coalesce(Player.jersey_num, 999).asc(), Player.name.asc())
-    ).scalars().all()
-
-    squad = [
-        SquadPlayerItem(
-            player_id=player.player_id,
-            name=player.name,
-            position=player.position,
-            jersey_num=player.jersey_num,
-            nationality=player.nationality,
-            photo_url=player.photo_url,
-        )
-        for player in squad_rows
-    ]
-
-    return TeamDetailResponse(
-        team=TeamItem(
-            team_id=team.team_id,
-            name=team.name,
-            short_name=team.short_name,
-            logo_url=team.logo_url,
-            stadium=team.stadium,
-            manager=team.manager,
-        ),
-        recent_form=recent_form,
-        squad=squad,
-    )
+    ).all()
+
+    return {
+        "team": row_dicts([team])[0],
+        "recent_form": recent_form,
+        "squad": row_dicts(squad_rows),
+    }
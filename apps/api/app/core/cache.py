@@ -0,0 +1,114 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from fastapi import Request, Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.serialization import dump_json
+from app.db.models import DataVersion
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+
+
+class ResponseCache:
+    """Bounded LRU of serialized JSON bodies, valid for a single data version.
+
+    The crawler bumps `data_version` whenever a batch commits new rows; the first request
+    that observes a new version drops every entry, so responses never outlive the data.
+    `memo` keeps small derived values (e.g. list totals) shared across responses on the same version.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        self._memo: dict[tuple, object] = {}
+        self._version: int | None = None
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey, version: int) -> CachedResponse | None:
+        with self._lock:
+            if self._version != version:
+                self._entries.clear()
+                self._memo.clear()
+                self._version = version
+                return None
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: CacheKey, version: int, body: bytes) -> CachedResponse:
+        entry = _cached_response(body)
+        with self._lock:
+            if self._version != version:
+                return entry
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def memo(self, key: tuple, compute: Callable[[], T]) -> T:
+        with self._lock:
+            version = self._version
+            if version is not None and key in self._memo:
+                return self._memo[key]  # type: ignore[return-value]
+        value = compute()
+        with self._lock:
+            if version is not None and self._version == version:
+                self._memo[key] = value
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._memo.clear()
+            self._version = None
+
+
+response_cache = ResponseCache(max_entries=settings.response_cache_max_entries)
+
+
+def current_data_version(db: Session) -> int:
+    version = db.execute(select(DataVersion.version).where(DataVersion.id == 1)).scalar_one_or_none()
+    return int(version or 0)
+
+
+def cached_json_response(request: Request, db: Session, build: Callable[[], object]) -> Response:
+    if settings.response_cache_enabled:
+        version = current_data_version(db)
+        key: CacheKey = (request.url.path, tuple(sorted(request.query_params.multi_items())))
+        entry = response_cache.get(key, version)
+        if entry is None:
+            entry = response_cache.put(key, version, dump_json(build()))
+    else:
+        entry = _cached_response(dump_json(build()))
+
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+def _cached_response(body: bytes) -> CachedResponse:
+    return CachedResponse(body=body, etag=f'"{hashlib.sha1(body).hexdigest()}"')
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
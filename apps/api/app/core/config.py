@@ -1,9 +1,35 @@
+from datetime import date
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def default_season(today: date | None = None) -> int:
+    """Starting year of the season in progress (2025 = 2025/26); a new season starts in July."""
+    today = today or date.today()
+    return today.year if today.month >= 7 else today.year - 1
+
+
 class Settings(BaseSettings):
     app_name: str = "EPL Information Hub API"
     db_url: str = "sqlite+pysqlite:///./epl.db"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_timeout_ms: int = 0
+    sqlite_journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"] = "WAL"
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    sqlite_mmap_size: int = 268_435_456
+    sqlite_cache_size: int = -65_536
+    response_cache_enabled: bool = True
+    response_cache_max_entries: int = 512
+    current_season: int | None = None
+
+    def active_season(self) -> int:
+        """`CURRENT_SEASON` if pinned, else the season in progress today (so it rolls over in July)."""
+        return self.current_season if self.current_season is not None else default_season()
 
     model_config = SettingsConfigDict(env_prefix="", env_file=".env", extra="ignore")
 
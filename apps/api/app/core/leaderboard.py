@@ -0,0 +1,102 @@
+import threading
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.cache import current_data_version
+from app.core.serialization import row_dicts
+from app.db.models import Player, PlayerSeasonStat, Team
+
+CATEGORIES = ("goals", "assists", "attack_points", "clean_sheets")
+_PLAYER_KEYS = ("player_id", "player_name", "team_id", "team_name", "team_short_name")
+
+
+@dataclass(frozen=True)
+class Leaderboard:
+    """Per-category player rows pre-sorted by (metric desc, player_id asc), plus player_id -> rank maps."""
+
+    ordered: dict[str, list[dict[str, object]]]
+    ranks: dict[str, dict[int, int]]
+
+    @classmethod
+    def build(cls, rows: list[dict[str, object]]) -> "Leaderboard":
+        ordered: dict[str, list[dict[str, object]]] = {}
+        ranks: dict[str, dict[int, int]] = {}
+        for category in CATEGORIES:
+            items = [
+                {
+                    **{key: row[key] for key in _PLAYER_KEYS},
+                    "value": row[category],
+                    **{metric: row[metric] for metric in CATEGORIES},
+                }
+                for row in sorted(rows, key=lambda row: (-int(row[category]), int(row["player_id"])))
+            ]
+            ordered[category] = items
+            ranks[category] = {int(item["player_id"]): position for position, item in enumerate(items, start=1)}
+        return cls(ordered=ordered, ranks=ranks)
+
+    def top(self, category: str, limit: int) -> list[dict[str, object]]:
+        return self.ordered[category][:limit]
+
+    def rank_of(self, category: str, player_id: int) -> tuple[int, dict[str, object]] | None:
+        rank = self.ranks[category].get(player_id)
+        if rank is None:
+            return None
+        return rank, self.ordered[category][rank - 1]
+
+    def size(self, category: str) -> int:
+        return len(self.ordered[category])
+
+
+class LeaderboardIndex:
+    """Holds one `Leaderboard` per season for the current data version; one join query per season per crawler commit."""
+
+    def __init__(self) -> None:
+        self._version: int | None = None
+        self._leaderboards: dict[int, Leaderboard] = {}
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, season: int) -> Leaderboard:
+        version = current_data_version(db)
+        with self._lock:
+            if self._version == version and season in self._leaderboards:
+                return self._leaderboards[season]
+        leaderboard = Leaderboard.build(_load_rows(db, season))
+        with self._lock:
+            # A request that read an older version can finish last; it must not evict newer boards.
+            if self._version is not None and version < self._version:
+                return leaderboard
+            if self._version != version:
+                self._version = version
+                self._leaderboards = {}
+            self._leaderboards[season] = leaderboard
+        return leaderboard
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version = None
+            self._leaderboards = {}
+
+
+leaderboard_index = LeaderboardIndex()
+
+
+def _load_rows(db: Session, season: int) -> list[dict[str, object]]:
+    rows = db.execute(
+        select(
+            Player.player_id,
+            Player.name.label("player_name"),
+            Team.team_id,
+            Team.name.label("team_name"),
+            Team.short_name.label("team_short_name"),
+            PlayerSeasonStat.goals,
+            PlayerSeasonStat.assists,
+            PlayerSeasonStat.attack_points,
+            PlayerSeasonStat.clean_sheets,
+        )
+        .join(Player, Player.player_id == PlayerSeasonStat.player_id)
+        .join(Team, Team.team_id == Player.team_id)
+        .where(PlayerSeasonStat.season == season)
+    ).all()
+    return row_dicts(rows)
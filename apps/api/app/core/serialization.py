@@ -0,0 +1,23 @@
+from collections.abc import Iterable, Sequence
+
+import orjson
+from fastapi import Response
+from sqlalchemy import Row
+
+
+def dump_json(payload: object) -> bytes:
+    """Serialize plain dicts/lists straight to JSON bytes; naive datetimes match Pydantic's ISO output."""
+    return orjson.dumps(payload)
+
+
+def json_response(payload: object) -> Response:
+    return Response(content=dump_json(payload), media_type="application/json")
+
+
+def row_dicts(rows: Iterable[Row], keys: Sequence[str] | None = None) -> list[dict[str, object]]:
+    """Column tuples to response items, without building ORM objects or per-row Pydantic models."""
+    rows = list(rows)
+    if not rows:
+        return []
+    names = tuple(keys) if keys is not None else tuple(rows[0]._fields)
+    return [dict(zip(names, row)) for row in rows]
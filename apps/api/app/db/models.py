@@ -1,8 +1,14 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, Numeric, SmallInteger, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from app.core.config import settings
+
+
+def _current_season() -> int:
+    return settings.active_season()
+
 
 class Base(DeclarativeBase):
     pass
@@ -34,6 +40,7 @@ class Player(Base):
 class PlayerSeasonStat(Base):
     __tablename__ = "player_season_stats"
 
+    season: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=_current_season)
     player_id: Mapped[int] = mapped_column(ForeignKey("players.player_id"), primary_key=True)
     goals: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     assists: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -43,8 +50,14 @@ class PlayerSeasonStat(Base):
 
 class Match(Base):
     __tablename__ = "matches"
+    __table_args__ = (
+        Index("idx_matches_season_date", "season", "match_date"),
+        Index("idx_matches_season_home_team_date", "season", "home_team_id", "match_date"),
+        Index("idx_matches_season_away_team_date", "season", "away_team_id", "match_date"),
+    )
 
     match_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    season: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=_current_season)
     round: Mapped[int] = mapped_column(Integer, nullable=False)
     match_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     home_team_id: Mapped[int] = mapped_column(ForeignKey("teams.team_id"), nullable=False)
@@ -56,18 +69,26 @@ class Match(Base):
 
 class MatchEvent(Base):
     __tablename__ = "match_events"
+    __table_args__ = (
+        Index("idx_match_events_match_id", "match_id"),
+        Index("idx_match_events_player_id", "player_id"),
+        Index("uq_match_events_source", "match_id", "source_event_id", unique=True),
+    )
 
     event_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     match_id: Mapped[int] = mapped_column(ForeignKey("matches.match_id"), nullable=False)
     minute: Mapped[int] = mapped_column(Integer, nullable=False)
     event_type: Mapped[str] = mapped_column(String(20), nullable=False)
     team_id: Mapped[int | None] = mapped_column(ForeignKey("teams.team_id"), nullable=True)
+    player_id: Mapped[int | None] = mapped_column(ForeignKey("players.player_id"), nullable=True)
     player_name: Mapped[str | None] = mapped_column(String(50), nullable=True)
     detail: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    source_event_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
 
 class MatchStat(Base):
     __tablename__ = "match_stats"
+    __table_args__ = (Index("idx_match_stats_match_id", "match_id"),)
 
     stat_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     match_id: Mapped[int] = mapped_column(ForeignKey("matches.match_id"), nullable=False)
@@ -81,7 +102,9 @@ class MatchStat(Base):
 
 class Standing(Base):
     __tablename__ = "standings"
+    __table_args__ = (Index("idx_standings_season_rank", "season", "rank"),)
 
+    season: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=_current_season)
     team_id: Mapped[int] = mapped_column(ForeignKey("teams.team_id"), primary_key=True)
     rank: Mapped[int] = mapped_column(Integer, nullable=False)
     played: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -92,3 +115,10 @@ class Standing(Base):
     goals_against: Mapped[int] = mapped_column(Integer, nullable=False)
     goal_diff: Mapped[int] = mapped_column(Integer, nullable=False)
     points: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class DataVersion(Base):
+    __tablename__ = "data_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
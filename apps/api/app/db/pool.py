@@ -0,0 +1,63 @@
+import threading
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+@dataclass
+class PoolWaitStats:
+    checkouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+
+class _TimedCheckout:
+    """Times every `connect()` so pool starvation shows up as wait time rather than as slow queries."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.wait_stats = PoolWaitStats()
+        super().__init__(*args, **kwargs)
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            self.wait_stats.record(time.perf_counter() - started)
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_stats(pool: Pool) -> dict[str, float | int | str]:
+    stats: dict[str, float | int | str] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+        )
+    wait_stats = getattr(pool, "wait_stats", None)
+    if isinstance(wait_stats, PoolWaitStats):
+        checkouts = wait_stats.checkouts
+        stats.update(
+            checkouts=checkouts,
+            wait_seconds_total=round(wait_stats.total_wait_seconds, 6),
+            wait_ms_avg=round(wait_stats.total_wait_seconds * 1000 / checkouts, 3) if checkouts else 0.0,
+            wait_ms_max=round(wait_stats.max_wait_seconds * 1000, 3),
+        )
+    return stats
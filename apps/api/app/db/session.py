@@ -1,14 +1,89 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Callable, Generator
+from typing import Protocol, TypeVar
 
-from sqlalchemy import create_engine
+from fastapi import Depends
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import Pool
 
-from app.core.config import settings
+from app.core.config import Settings, settings
+from app.db.pool import TimedAsyncAdaptedQueuePool, TimedQueuePool
 
+T = TypeVar("T")
 
-engine = create_engine(settings.db_url, future=True)
+ASYNC_DRIVERS = frozenset({"aiosqlite", "asyncmy", "aiomysql"})
+
+
+def is_async_url(db_url: str) -> bool:
+    return make_url(db_url).get_driver_name() in ASYNC_DRIVERS
+
+
+def engine_options(config: Settings) -> dict[str, object]:
+    """Pool arguments for `create_engine`; in-memory sqlite keeps SQLAlchemy's single-connection pool."""
+    url = make_url(config.db_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool if is_async_url(config.db_url) else TimedQueuePool,
+        "pool_size": config.db_pool_size,
+        "max_overflow": config.db_max_overflow,
+        "pool_timeout": config.db_pool_timeout_seconds,
+        "pool_recycle": config.db_pool_recycle_seconds,
+        "pool_pre_ping": config.db_pool_pre_ping,
+    }
+
+
+def connect_statements(config: Settings) -> list[str]:
+    """Per-connection setup run on every new DBAPI connection."""
+    backend = make_url(config.db_url).get_backend_name()
+    if backend == "sqlite":
+        return [
+            f"PRAGMA journal_mode={config.sqlite_journal_mode}",
+            f"PRAGMA synchronous={config.sqlite_synchronous}",
+            f"PRAGMA mmap_size={int(config.sqlite_mmap_size)}",
+            f"PRAGMA cache_size={int(config.sqlite_cache_size)}",
+        ]
+    if backend == "mysql" and config.db_statement_timeout_ms > 0:
+        return [f"SET SESSION max_execution_time={int(config.db_statement_timeout_ms)}"]
+    return []
+
+
+def install_connect_hooks(target: Engine, config: Settings) -> None:
+    statements = connect_statements(config)
+    if not statements:
+        return
+
+    @event.listens_for(target, "connect")
+    def _on_connect(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def _create_engine(config: Settings) -> Engine:
+    created = create_engine(config.db_url, future=True, **engine_options(config))
+    install_connect_hooks(created, config)
+    return created
+
+
+def _create_async_engine(config: Settings) -> AsyncEngine:
+    created = create_async_engine(config.db_url, future=True, **engine_options(config))
+    install_connect_hooks(created.sync_engine, config)
+    return created
+
+
+engine = None if is_async_url(settings.db_url) else _create_engine(settings)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, class_=Session)
 
+async_engine = _create_async_engine(settings) if is_async_url(settings.db_url) else None
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -16,3 +91,45 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+class DbRunner(Protocol):
+    """Runs a unit of sync ORM work without blocking the event loop."""
+
+    async def run(self, fn: Callable[[Session], T]) -> T: ...
+
+
+class ThreadpoolDbRunner:
+    """Blocking driver: the work runs on a threadpool worker, as sync `def` routes did."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    async def run(self, fn: Callable[[Session], T]) -> T:
+        return await run_in_threadpool(fn, self.session)
+
+
+class AsyncDbRunner:
+    """Async driver: the work runs on the event loop via `run_sync`, pinning no worker thread while it waits."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def run(self, fn: Callable[[Session], T]) -> T:
+        return await self.session.run_sync(fn)
+
+
+async def get_threadpool_db_runner(db: Session = Depends(get_db)) -> ThreadpoolDbRunner:
+    return ThreadpoolDbRunner(db)
+
+
+async def get_async_db_runner() -> AsyncGenerator[AsyncDbRunner, None]:
+    async with AsyncSessionLocal() as session:
+        yield AsyncDbRunner(session)
+
+
+get_db_runner = get_async_db_runner if async_engine is not None else get_threadpool_db_runner
+
+
+def active_pool() -> Pool:
+    return async_engine.sync_engine.pool if async_engine is not None else engine.pool
@@ -2,6 +2,8 @@ from fastapi import FastAPI
 
 from app.api.router import api_router
 from app.core.config import settings
+from app.db.pool import pool_stats
+from app.db.session import active_pool
 
 app = FastAPI(title=settings.app_name)
 app.include_router(api_router)
@@ -10,3 +12,8 @@ app.include_router(api_router)
 @app.get("/health")
 def health() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@app.get("/metrics/db", include_in_schema=False)
+def db_metrics() -> dict[str, float | int | str]:
+    return pool_stats(active_pool())
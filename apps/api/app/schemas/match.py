@@ -15,8 +15,9 @@ class MatchListItem(BaseModel):
 
 
 class MatchListResponse(BaseModel):
-    total: int
+    total: int | None
     items: list[MatchListItem]
+    next_cursor: str | None = None
 
 
 class MatchEventItem(BaseModel):
@@ -18,3 +18,10 @@ class TopStatsResponse(BaseModel):
     category: str
     total: int
     items: list[TopStatItem]
+
+
+class PlayerRankResponse(BaseModel):
+    category: str
+    rank: int
+    total: int
+    item: TopStatItem
@@ -0,0 +1,6 @@
+CREATE TABLE IF NOT EXISTS ingest_fingerprints (
+    dataset VARCHAR(32) NOT NULL,
+    row_key VARCHAR(191) NOT NULL,
+    fingerprint CHAR(40) NOT NULL,
+    PRIMARY KEY (dataset, row_key)
+);
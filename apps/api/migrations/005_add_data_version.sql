@@ -0,0 +1,6 @@
+CREATE TABLE IF NOT EXISTS data_version (
+    id INT PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT IGNORE INTO data_version(id, version) VALUES (1, 0);
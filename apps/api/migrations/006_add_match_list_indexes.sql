@@ -0,0 +1,8 @@
+ALTER TABLE matches
+    ADD INDEX idx_matches_home_team_date (home_team_id, match_date),
+    ADD INDEX idx_matches_away_team_date (away_team_id, match_date);
+
+-- The composite indexes above also serve the team foreign keys.
+ALTER TABLE matches
+    DROP INDEX idx_matches_home_team,
+    DROP INDEX idx_matches_away_team;
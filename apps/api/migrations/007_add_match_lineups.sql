@@ -0,0 +1,15 @@
+ALTER TABLE match_events
+    ADD COLUMN player_id INT NULL AFTER team_id,
+    ADD CONSTRAINT fk_match_events_player FOREIGN KEY (player_id) REFERENCES players(player_id),
+    ADD INDEX idx_match_events_player_id (player_id);
+
+CREATE TABLE IF NOT EXISTS match_lineups (
+    match_id INT NOT NULL,
+    team_id INT NOT NULL,
+    player_id INT NOT NULL,
+    PRIMARY KEY (match_id, player_id),
+    CONSTRAINT fk_match_lineups_match FOREIGN KEY (match_id) REFERENCES matches(match_id),
+    CONSTRAINT fk_match_lineups_team FOREIGN KEY (team_id) REFERENCES teams(team_id),
+    CONSTRAINT fk_match_lineups_player FOREIGN KEY (player_id) REFERENCES players(player_id),
+    INDEX idx_match_lineups_player_id (player_id)
+);
@@ -0,0 +1,3 @@
+ALTER TABLE match_events
+    ADD COLUMN source_event_id VARCHAR(64) NULL,
+    ADD UNIQUE INDEX uq_match_events_source (match_id, source_event_id);
@@ -0,0 +1,64 @@
+-- Seasons are keyed by their starting year (2025 = 2025/26) and roll over in July.
+-- Existing matches get the season of their match_date; standings and player season stats
+-- (one unnamed season before this migration) get the latest match season.
+
+-- InnoDB cannot partition a table that has or is referenced by foreign keys, so the
+-- references into and out of `matches` are dropped; the crawler resolves them on write.
+ALTER TABLE match_events DROP FOREIGN KEY fk_match_events_match;
+ALTER TABLE match_stats DROP FOREIGN KEY fk_match_stats_match;
+ALTER TABLE match_lineups DROP FOREIGN KEY fk_match_lineups_match;
+ALTER TABLE matches
+    DROP FOREIGN KEY fk_matches_home_team,
+    DROP FOREIGN KEY fk_matches_away_team;
+
+-- The partitioning column must be part of every unique key, including the primary key.
+ALTER TABLE matches
+    ADD COLUMN season SMALLINT NOT NULL DEFAULT 2025 AFTER match_id,
+    DROP PRIMARY KEY,
+    ADD PRIMARY KEY (match_id, season),
+    DROP INDEX uq_matches_fixture,
+    ADD UNIQUE KEY uq_matches_fixture (season, round, home_team_id, away_team_id),
+    DROP INDEX idx_matches_round,
+    DROP INDEX idx_matches_date,
+    DROP INDEX idx_matches_home_team_date,
+    DROP INDEX idx_matches_away_team_date,
+    ADD INDEX idx_matches_season_date (season, match_date),
+    ADD INDEX idx_matches_season_home_team_date (season, home_team_id, match_date),
+    ADD INDEX idx_matches_season_away_team_date (season, away_team_id, match_date);
+
+UPDATE matches SET season = YEAR(match_date) - (MONTH(match_date) < 7);
+
+ALTER TABLE matches ALTER COLUMN season DROP DEFAULT;
+
+ALTER TABLE matches
+    PARTITION BY RANGE (season) (
+        PARTITION p_history VALUES LESS THAN (2023),
+        PARTITION p2023 VALUES LESS THAN (2024),
+        PARTITION p2024 VALUES LESS THAN (2025),
+        PARTITION p2025 VALUES LESS THAN (2026),
+        PARTITION p2026 VALUES LESS THAN (2027),
+        PARTITION p_future VALUES LESS THAN MAXVALUE
+    );
+
+-- Small per-season tables keep their foreign keys and lead their primary key with season instead.
+ALTER TABLE standings
+    ADD COLUMN season SMALLINT NOT NULL DEFAULT 2025 FIRST,
+    ADD INDEX idx_standings_team_id (team_id),
+    DROP PRIMARY KEY,
+    ADD PRIMARY KEY (season, team_id),
+    DROP INDEX idx_standings_rank,
+    ADD INDEX idx_standings_season_rank (season, `rank`);
+
+UPDATE standings SET season = COALESCE((SELECT MAX(season) FROM matches), season);
+
+ALTER TABLE standings ALTER COLUMN season DROP DEFAULT;
+
+ALTER TABLE player_season_stats
+    ADD COLUMN season SMALLINT NOT NULL DEFAULT 2025 FIRST,
+    ADD INDEX idx_player_stats_player_id (player_id),
+    DROP PRIMARY KEY,
+    ADD PRIMARY KEY (season, player_id);
+
+UPDATE player_season_stats SET season = COALESCE((SELECT MAX(season) FROM matches), season);
+
+ALTER TABLE player_season_stats ALTER COLUMN season DROP DEFAULT;
@@ -0,0 +1,7 @@
+CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+    season SMALLINT NOT NULL,
+    round INT NOT NULL,
+    matches INT NOT NULL,
+    completed_at DATETIME NOT NULL,
+    PRIMARY KEY (season, round)
+);
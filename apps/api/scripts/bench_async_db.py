@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Concurrency sweep against a local uvicorn: blocking (pysqlite) vs async (aiosqlite) database drivers.
+
+Seeds a temporary sqlite file, starts one uvicorn worker per driver with the response cache off,
+and fires concurrent GET /matches/{id} requests at each concurrency level.
+
+Usage:
+    PYTHONPATH=apps/api python3 apps/api/scripts/bench_async_db.py --levels 1,8,32,128 --requests 2000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import httpx
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.db.models import Base, Match, MatchEvent, Team
+
+TEAM_COUNT = 20
+MATCH_COUNT = 380
+DRIVERS = {"threadpool": "sqlite+pysqlite", "async": "sqlite+aiosqlite"}
+
+
+def _seed(db_path: Path) -> None:
+    engine = create_engine(f"sqlite+pysqlite:///{db_path}", future=True)
+    Base.metadata.create_all(bind=engine)
+    kickoff = datetime(2024, 8, 10, 15, 0)
+    with Session(engine) as session:
+        session.execute(
+            insert(Team),
+            [{"team_id": idx, "name": f"Team {idx}", "short_name": f"T{idx:02d}"} for idx in range(1, TEAM_COUNT + 1)],
+        )
+        session.execute(
+            insert(Match),
+            [
+                {
+                    "match_id": idx,
+                    "round": idx % 38 + 1,
+                    "match_date": kickoff + timedelta(hours=idx),
+                    "home_team_id": idx % TEAM_COUNT + 1,
+                    "away_team_id": (idx + 1) % TEAM_COUNT + 1,
+                    "home_score": idx % 4,
+                    "away_score": idx % 3,
+                    "status": "FINISHED",
+                }
+                for idx in range(1, MATCH_COUNT + 1)
+            ],
+        )
+        session.execute(
+            insert(MatchEvent),
+            [
+                {"match_id": idx, "minute": minute, "event_type": "GOAL", "team_id": idx % TEAM_COUNT + 1}
+                for idx in range(1, MATCH_COUNT + 1)
+                for minute in (12, 56, 90)
+            ],
+        )
+        session.commit()
+    engine.dispose()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _start_server(db_url: str, port: int) -> subprocess.Popen:
+    env = {**os.environ, "DB_URL": db_url, "RESPONSE_CACHE_ENABLED": "false", "PYTHONPATH": str(ROOT)}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+        env=env,
+    )
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=0.5).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    process.terminate()
+    raise SystemExit(f"uvicorn did not start for {db_url}")
+
+
+async def _sweep_level(base_url: str, *, concurrency: int, requests: int) -> dict[str, float]:
+    latencies: list[float] = []
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for idx in range(requests):
+        queue.put_nowait(idx % MATCH_COUNT + 1)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+
+        async def worker() -> None:
+            while not queue.empty():
+                match_id = queue.get_nowait()
+                started = time.perf_counter()
+                response = await client.get(f"/matches/{match_id}")
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests_per_sec": round(requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "p99_ms": round(latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Sweep concurrency against uvicorn for sync vs async DB drivers")
+    parser.add_argument("--levels", default="1,8,32,128", help="Comma-separated concurrency levels.")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per level.")
+    args = parser.parse_args(argv)
+    levels = [int(level) for level in args.levels.split(",") if level.strip()]
+
+    results: dict[str, list[dict[str, float]]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        _seed(db_path)
+        for mode, driver in DRIVERS.items():
+            port = _free_port()
+            server = _start_server(f"{driver}:///{db_path}", port)
+            try:
+                base_url = f"http://127.0.0.1:{port}"
+                results[mode] = [
+                    asyncio.run(_sweep_level(base_url, concurrency=level, requests=args.requests)) for level in levels
+                ]
+            finally:
+                server.terminate()
+                server.wait(timeout=10)
+
+    print(json.dumps(results, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
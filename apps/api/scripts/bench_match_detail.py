@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Load-test GET /matches/{match_id}: legacy three-query fetch vs the single round-trip query.
+
+Both paths run under the same thread pool against the same database and report p50/p99 latency.
+Point `--db-url` at MySQL to include real network round-trips; the default is a temporary sqlite file,
+where `--rtt-ms` adds a simulated per-statement round-trip delay.
+
+Usage:
+    PYTHONPATH=apps/api python3 apps/api/scripts/bench_match_detail.py --concurrency 16 --requests 4000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.matches import _build_match_detail
+from app.db.models import Base, Match, MatchEvent, MatchStat, Team
+from app.schemas.match import MatchDetailResponse, MatchEventItem, MatchListItem, MatchStatItem
+
+TEAM_COUNT = 20
+
+
+def _seed(session: Session, matches: int) -> None:
+    session.execute(
+        insert(Team),
+        [{"team_id": idx, "name": f"Team {idx}", "short_name": f"T{idx:02d}"} for idx in range(1, TEAM_COUNT + 1)],
+    )
+    kickoff = datetime(2024, 8, 10, 15, 0)
+    session.execute(
+        insert(Match),
+        [
+            {
+                "match_id": idx,
+                "round": idx % 38 + 1,
+                "match_date": kickoff + timedelta(hours=idx),
+                "home_team_id": idx % TEAM_COUNT + 1,
+                "away_team_id": (idx + 1) % TEAM_COUNT + 1,
+                "home_score": idx % 4,
+                "away_score": idx % 3,
+                "status": "FINISHED",
+            }
+            for idx in range(1, matches + 1)
+        ],
+    )
+    session.execute(
+        insert(MatchEvent),
+        [
+            {
+                "match_id": idx,
+                "minute": minute,
+                "event_type": "GOAL" if minute % 2 else "YELLOW_CARD",
+                "team_id": idx % TEAM_COUNT + 1,
+                "player_name": f"Player {minute}",
+                "detail": None,
+            }
+            for idx in range(1, matches + 1)
+            for minute in (12, 34, 56, 78, 90)
+        ],
+    )
+    session.execute(
+        insert(MatchStat),
+        [
+            {
+                "match_id": idx,
+                "team_id": team_id,
+                "possession": 50.0,
+                "shots": 10,
+                "shots_on_target": 4,
+                "fouls": 11,
+                "corners": 5,
+            }
+            for idx in range(1, matches + 1)
+            for team_id in (idx % TEAM_COUNT + 1, (idx + 1) % TEAM_COUNT + 1)
+        ],
+    )
+    session.commit()
+
+
+def _legacy_detail(match_id: int, db: Session) -> MatchDetailResponse:
+    row = db.execute(select(Match).where(Match.match_id == match_id)).scalar_one()
+    events = db.execute(
+        select(MatchEvent)
+        .where(MatchEvent.match_id == match_id)
+        .order_by(MatchEvent.minute.asc(), MatchEvent.event_id.asc())
+    ).scalars().all()
+    stats = db.execute(
+        select(MatchStat).where(MatchStat.match_id == match_id).order_by(MatchStat.team_id.asc())
+    ).scalars().all()
+    return MatchDetailResponse(
+        match=MatchListItem.model_validate(row, from_attributes=True),
+        events=[MatchEventItem.model_validate(event, from_attributes=True) for event in events],
+        stats=[
+            MatchStatItem(
+                team_id=stat.team_id,
+                possession=float(stat.possession) if stat.possession is not None else None,
+                shots=stat.shots,
+                shots_on_target=stat.shots_on_target,
+                fouls=stat.fouls,
+                corners=stat.corners,
+            )
+            for stat in stats
+        ],
+    )
+
+
+def _run(factory: sessionmaker, fetch, *, matches: int, requests: int, concurrency: int) -> dict[str, float]:
+    def one(idx: int) -> float:
+        db = factory()
+        try:
+            started = time.perf_counter()
+            fetch(idx % matches + 1, db)
+            return time.perf_counter() - started
+        finally:
+            db.close()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = sorted(pool.map(one, range(requests)))
+    elapsed = time.perf_counter() - started
+    return {
+        "p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 3),
+        "requests_per_sec": round(requests / elapsed, 1),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test the match detail fetch path")
+    parser.add_argument("--db-url", default=None, help="SQLAlchemy URL (default: temporary sqlite file).")
+    parser.add_argument("--matches", type=int, default=380, help="Synthetic matches to seed.")
+    parser.add_argument("--requests", type=int, default=4000, help="Detail fetches per path.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent worker threads.")
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="Simulated network delay per statement.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_url = args.db_url or f"sqlite+pysqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine(db_url, future=True, pool_size=args.concurrency, max_overflow=0)
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        factory = sessionmaker(bind=engine, autoflush=False, class_=Session)
+        with factory() as session:
+            _seed(session, args.matches)
+        if args.rtt_ms:
+            delay = args.rtt_ms / 1000
+            event.listen(engine, "before_cursor_execute", lambda *_: time.sleep(delay))
+
+        options = {"matches": args.matches, "requests": args.requests, "concurrency": args.concurrency}
+        results: dict[str, object] = {
+            "rtt_ms": args.rtt_ms,
+            "legacy_three_queries": _run(factory, _legacy_detail, **options),
+            "single_round_trip": _run(factory, lambda match_id, db: _build_match_detail(db, match_id), **options),
+        }
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+    print(json.dumps(results, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Compare LIMIT/OFFSET with keyset (cursor) paging over a multi-season synthetic matches table.
+
+Usage:
+    PYTHONPATH=apps/api python3 apps/api/scripts/bench_match_pagination.py --seasons 30 --limit 50
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.matches import _build_match_list
+from app.core.config import settings
+from app.db.models import Base, Match, Team
+
+TEAM_COUNT = 20
+ROUNDS_PER_SEASON = 38
+
+
+def _seed(session: Session, seasons: int) -> int:
+    session.execute(
+        insert(Team),
+        [{"team_id": idx, "name": f"Team {idx}", "short_name": f"T{idx:02d}"} for idx in range(1, TEAM_COUNT + 1)],
+    )
+    rows: list[dict[str, object]] = []
+    for season in range(seasons):
+        kickoff = datetime(1990 + season, 8, 10, 15, 0)
+        for round_no in range(1, ROUNDS_PER_SEASON + 1):
+            for slot in range(TEAM_COUNT // 2):
+                home = (round_no + slot) % TEAM_COUNT + 1
+                away = (round_no + TEAM_COUNT - 1 - slot) % TEAM_COUNT + 1
+                rows.append(
+                    {
+                        "round": round_no,
+                        "match_date": kickoff + timedelta(days=7 * (round_no - 1), hours=slot % 3),
+                        "home_team_id": home,
+                        "away_team_id": away,
+                        "home_score": (season + slot) % 4,
+                        "away_score": (round_no + slot) % 3,
+                        "status": "FINISHED",
+                    }
+                )
+    session.execute(insert(Match), rows)
+    session.commit()
+    return len(rows)
+
+
+def _walk(session: Session, *, limit: int, pages: int, keyset: bool) -> tuple[float, float]:
+    """Return (total seconds, last page seconds) for reading `pages` consecutive pages."""
+    after = None
+    last_page = 0.0
+    started = time.perf_counter()
+    for page in range(pages):
+        page_started = time.perf_counter()
+        response = _build_match_list(
+            session,
+            season=settings.current_season,
+            round=None,
+            month=None,
+            team_id=None,
+            limit=limit,
+            offset=0 if keyset else page * limit,
+            after=after,
+            include_total=False,
+        )
+        last_page = time.perf_counter() - page_started
+        if keyset:
+            if not response["items"]:
+                break
+            tail = response["items"][-1]
+            after = (tail["match_date"], tail["match_id"])
+    return time.perf_counter() - started, last_page
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark offset vs keyset paging on GET /matches")
+    parser.add_argument("--seasons", type=int, default=30, help="Synthetic seasons of 380 fixtures each.")
+    parser.add_argument("--limit", type=int, default=50, help="Page size.")
+    parser.add_argument("--pages", type=int, default=0, help="Pages to walk (default: the whole table).")
+    args = parser.parse_args(argv)
+
+    engine = create_engine("sqlite+pysqlite://", future=True, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine, class_=Session)()
+    try:
+        rows = _seed(session, args.seasons)
+        pages = args.pages or -(-rows // args.limit)
+        offset_total, offset_last = _walk(session, limit=args.limit, pages=pages, keyset=False)
+        keyset_total, keyset_last = _walk(session, limit=args.limit, pages=pages, keyset=True)
+    finally:
+        session.close()
+        engine.dispose()
+
+    print(
+        json.dumps(
+            {
+                "rows": rows,
+                "pages": pages,
+                "offset_seconds": round(offset_total, 4),
+                "offset_last_page_ms": round(offset_last * 1000, 3),
+                "keyset_seconds": round(keyset_total, 4),
+                "keyset_last_page_ms": round(keyset_last * 1000, 3),
+                "speedup": round(offset_total / keyset_total, 1) if keyset_total else None,
+            },
+            ensure_ascii=False,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Per-request CPU for a 200-row GET /matches page: ORM + per-row Pydantic vs column tuples + orjson.
+
+Both paths query the same in-memory sqlite table and produce JSON bytes; the response cache is bypassed.
+
+Usage:
+    PYTHONPATH=apps/api python3 apps/api/scripts/bench_serialization.py --rows 200 --iterations 500
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.matches import _build_match_list
+from app.core.config import settings
+from app.core.serialization import dump_json
+from app.db.models import Base, Match, Team
+from app.schemas.match import MatchListItem, MatchListResponse
+
+TEAM_COUNT = 20
+
+
+def _seed(session: Session, rows: int) -> None:
+    session.execute(
+        insert(Team),
+        [{"team_id": idx, "name": f"Team {idx}", "short_name": f"T{idx:02d}"} for idx in range(1, TEAM_COUNT + 1)],
+    )
+    kickoff = datetime(2024, 8, 10, 15, 0)
+    session.execute(
+        insert(Match),
+        [
+            {
+                "round": idx % 38 + 1,
+                "match_date": kickoff + timedelta(hours=idx),
+                "home_team_id": idx % TEAM_COUNT + 1,
+                "away_team_id": (idx + 1) % TEAM_COUNT + 1,
+                "home_score": idx % 4,
+                "away_score": idx % 3,
+                "status": "FINISHED",
+            }
+            for idx in range(rows)
+        ],
+    )
+    session.commit()
+
+
+def _legacy_page(session: Session, limit: int) -> bytes:
+    """The pre-fast-path pipeline: ORM entities, one Pydantic model per row, then FastAPI-style encoding."""
+    rows = session.execute(
+        select(Match).order_by(Match.match_date.desc(), Match.match_id.desc()).limit(limit)
+    ).scalars().all()
+    response = MatchListResponse(
+        total=len(rows),
+        items=[
+            MatchListItem(
+                match_id=row.match_id,
+                round=row.round,
+                match_date=row.match_date,
+                home_team_id=row.home_team_id,
+                away_team_id=row.away_team_id,
+                home_score=row.home_score,
+                away_score=row.away_score,
+                status=row.status,
+            )
+            for row in rows
+        ],
+    )
+    validated = MatchListResponse.model_validate(response.model_dump())
+    return json.dumps(jsonable_encoder(validated)).encode("utf-8")
+
+
+def _fast_page(session: Session, limit: int) -> bytes:
+    payload = _build_match_list(
+        session, season=settings.current_season, round=None, month=None, team_id=None, limit=limit, offset=0, after=None, include_total=False
+    )
+    return dump_json(payload)
+
+
+def _cpu_per_call(fn, session: Session, limit: int, iterations: int) -> float:
+    for _ in range(min(iterations, 20)):
+        fn(session, limit)
+        session.expunge_all()
+    started = time.process_time()
+    for _ in range(iterations):
+        fn(session, limit)
+        session.expunge_all()
+    return (time.process_time() - started) / iterations
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark /matches serialization CPU per request")
+    parser.add_argument("--rows", type=int, default=200, help="Rows on the page (max 200 via the API).")
+    parser.add_argument("--iterations", type=int, default=500, help="Timed requests per path.")
+    args = parser.parse_args(argv)
+
+    engine = create_engine("sqlite+pysqlite://", future=True, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine, class_=Session)()
+    try:
+        _seed(session, args.rows)
+        legacy = _cpu_per_call(_legacy_page, session, args.rows, args.iterations)
+        fast = _cpu_per_call(_fast_page, session, args.rows, args.iterations)
+    finally:
+        session.close()
+        engine.dispose()
+
+    print(
+        json.dumps(
+            {
+                "rows": args.rows,
+                "legacy_cpu_ms": round(legacy * 1000, 3),
+                "fast_path_cpu_ms": round(fast * 1000, 3),
+                "cpu_saved_ms": round((legacy - fast) * 1000, 3),
+                "speedup": round(legacy / fast, 1) if fast else None,
+            },
+            ensure_ascii=False,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
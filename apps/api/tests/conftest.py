@@ -4,6 +4,8 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from app.core.cache import response_cache
+from app.core.leaderboard import leaderboard_index
 from app.db.models import Base
 from app.db.session import get_db
 from app.main import app
@@ -36,6 +38,8 @@ def client(session_factory):
             db.close()
 
     app.dependency_overrides[get_db] = override_get_db
+    response_cache.clear()
+    leaderboard_index.clear()
 
     with TestClient(app) as test_client:
         yield test_client
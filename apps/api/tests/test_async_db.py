@@ -0,0 +1,73 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.core.cache import response_cache
+from app.core.leaderboard import leaderboard_index
+from app.db.models import Base, Match, MatchEvent, Team
+from app.db.session import AsyncDbRunner, get_db_runner, is_async_url
+from app.main import app
+
+
+@pytest.fixture()
+def async_client(tmp_path):
+    db_path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite+pysqlite:///{db_path}", future=True)
+    Base.metadata.create_all(bind=sync_engine)
+    with Session(sync_engine) as db:
+        db.add_all([Team(team_id=1, name="Arsenal FC", short_name="ARS"), Team(team_id=2, name="Liverpool FC", short_name="LIV")])
+        db.add(
+            Match(
+                match_id=1,
+                round=1,
+                match_date=datetime(2025, 8, 16, 20, 0, 0),
+                home_team_id=1,
+                away_team_id=2,
+                home_score=2,
+                away_score=1,
+                status="FINISHED",
+            )
+        )
+        db.add(MatchEvent(event_id=1, match_id=1, minute=24, event_type="GOAL", team_id=1, player_name="Saka"))
+        db.commit()
+    sync_engine.dispose()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", future=True)
+    session_local = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    async def override_get_db_runner():
+        async with session_local() as session:
+            yield AsyncDbRunner(session)
+
+    app.dependency_overrides[get_db_runner] = override_get_db_runner
+    response_cache.clear()
+    leaderboard_index.clear()
+
+    with TestClient(app) as test_client:
+        yield test_client
+        test_client.portal.call(async_engine.dispose)
+
+    app.dependency_overrides.pop(get_db_runner, None)
+
+
+def test_is_async_url_selects_async_drivers() -> None:
+    assert is_async_url("sqlite+aiosqlite:///./epl.db")
+    assert is_async_url("mysql+asyncmy://user:pw@localhost/epl")
+    assert not is_async_url("sqlite+pysqlite:///./epl.db")
+    assert not is_async_url("mysql+pymysql://user:pw@localhost/epl")
+
+
+def test_routes_run_on_async_session(async_client) -> None:
+    teams = async_client.get("/teams")
+    detail = async_client.get("/matches/1")
+    missing = async_client.get("/matches/999")
+
+    assert teams.status_code == 200
+    assert [item["short_name"] for item in teams.json()["items"]] == ["ARS", "LIV"]
+    assert detail.status_code == 200
+    assert detail.json()["events"][0]["player_name"] == "Saka"
+    assert missing.status_code == 404
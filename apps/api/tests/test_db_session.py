@@ -0,0 +1,48 @@
+from sqlalchemy import text
+
+from app.core.config import Settings
+from app.db.pool import TimedQueuePool, pool_stats
+from app.db.session import _create_engine, connect_statements, engine_options
+
+
+def test_file_sqlite_engine_applies_pool_settings_and_pragmas(tmp_path) -> None:
+    config = Settings(
+        db_url=f"sqlite+pysqlite:///{tmp_path / 'tuned.db'}",
+        db_pool_size=3,
+        db_max_overflow=1,
+        sqlite_synchronous="NORMAL",
+        sqlite_cache_size=-2048,
+    )
+    engine = _create_engine(config)
+    try:
+        with engine.connect() as conn:
+            journal_mode = conn.execute(text("PRAGMA journal_mode")).scalar_one()
+            synchronous = conn.execute(text("PRAGMA synchronous")).scalar_one()
+            cache_size = conn.execute(text("PRAGMA cache_size")).scalar_one()
+            busy = pool_stats(engine.pool)
+        idle = pool_stats(engine.pool)
+    finally:
+        engine.dispose()
+
+    assert isinstance(engine.pool, TimedQueuePool)
+    assert (journal_mode, synchronous, cache_size) == ("wal", 1, -2048)
+    assert busy["size"] == 3
+    assert busy["checked_out"] == 1
+    assert idle["checked_out"] == 0
+    assert idle["checkouts"] == 1
+    assert idle["wait_ms_max"] >= 0
+
+
+def test_engine_options_and_connect_statements_by_backend() -> None:
+    assert engine_options(Settings(db_url="sqlite+pysqlite://")) == {}
+    assert connect_statements(Settings(db_url="mysql+pymysql://u:p@localhost/epl")) == []
+    assert connect_statements(Settings(db_url="mysql+pymysql://u:p@localhost/epl", db_statement_timeout_ms=2500)) == [
+        "SET SESSION max_execution_time=2500"
+    ]
+
+
+def test_db_metrics_endpoint(client) -> None:
+    response = client.get("/metrics/db")
+
+    assert response.status_code == 200
+    assert "pool" in response.json()
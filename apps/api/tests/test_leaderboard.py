@@ -0,0 +1,116 @@
+from sqlalchemy import event
+
+from app.db.models import DataVersion, Player, PlayerSeasonStat, Team
+
+
+def seed_data(session_factory) -> None:
+    db = session_factory()
+    db.add_all(
+        [
+            Team(team_id=1, name="Arsenal FC", short_name="ARS"),
+            Team(team_id=2, name="Liverpool FC", short_name="LIV"),
+        ]
+    )
+    db.add_all(
+        [
+            Player(player_id=10, team_id=1, name="Bukayo Saka", position="FW"),
+            Player(player_id=11, team_id=1, name="Declan Rice", position="MF"),
+            Player(player_id=20, team_id=2, name="Mohamed Salah", position="FW"),
+            Player(player_id=21, team_id=2, name="Alisson", position="GK"),
+        ]
+    )
+    db.add_all(
+        [
+            PlayerSeasonStat(player_id=10, goals=12, assists=9, attack_points=21, clean_sheets=4),
+            PlayerSeasonStat(player_id=11, goals=4, assists=6, attack_points=10, clean_sheets=8),
+            PlayerSeasonStat(player_id=20, goals=15, assists=7, attack_points=22, clean_sheets=3),
+            PlayerSeasonStat(player_id=21, goals=0, assists=1, attack_points=1, clean_sheets=8),
+        ]
+    )
+    db.add(DataVersion(id=1, version=1))
+    db.commit()
+    db.close()
+
+
+def _set_goals(session_factory, *, player_id: int, goals: int, version: int) -> None:
+    db = session_factory()
+    db.query(PlayerSeasonStat).filter(PlayerSeasonStat.player_id == player_id).update({"goals": goals})
+    db.query(DataVersion).filter(DataVersion.id == 1).update({"version": version})
+    db.commit()
+    db.close()
+
+
+def test_top_stats_ties_break_on_player_id(client, session_factory) -> None:
+    seed_data(session_factory)
+
+    data = client.get("/stats/top", params={"category": "clean_sheets", "limit": 3}).json()
+
+    assert [item["player_id"] for item in data["items"]] == [11, 21, 10]
+    assert data["items"][0]["value"] == 8
+    assert data["items"][0]["team_short_name"] == "ARS"
+
+
+def test_player_rank(client, session_factory) -> None:
+    seed_data(session_factory)
+
+    response = client.get("/stats/rank", params={"category": "goals", "player_id": 10})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["rank"] == 2
+    assert data["total"] == 4
+    assert data["item"]["player_name"] == "Bukayo Saka"
+    assert data["item"]["value"] == 12
+
+
+def test_player_rank_not_found(client, session_factory) -> None:
+    seed_data(session_factory)
+
+    response = client.get("/stats/rank", params={"category": "goals", "player_id": 99})
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "player stats not found"}
+
+
+def test_leaderboard_rebuilds_on_data_version_change(client, session_factory) -> None:
+    seed_data(session_factory)
+    assert client.get("/stats/top", params={"limit": 1}).json()["items"][0]["player_id"] == 20
+
+    _set_goals(session_factory, player_id=10, goals=20, version=2)
+
+    assert client.get("/stats/top", params={"limit": 1}).json()["items"][0]["player_id"] == 10
+    assert client.get("/stats/rank", params={"player_id": 20}).json()["rank"] == 2
+
+
+def test_warm_leaderboard_skips_join(client, session_factory) -> None:
+    seed_data(session_factory)
+    client.get("/stats/top", params={"category": "goals"})
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    engine = session_factory.kw["bind"]
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        client.get("/stats/top", params={"category": "assists", "limit": 2})
+        client.get("/stats/rank", params={"category": "attack_points", "player_id": 11})
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert statements
+    assert not any("JOIN" in statement.upper() for statement in statements)
+
+
+def test_index_keeps_newer_boards_when_a_stale_build_finishes_last(monkeypatch) -> None:
+    from app.core import leaderboard as module
+
+    versions = iter([2, 1, 2])
+    monkeypatch.setattr(module, "current_data_version", lambda _db: next(versions))
+    monkeypatch.setattr(module, "_load_rows", lambda _db, _season: [])
+    index = module.LeaderboardIndex()
+
+    newer = index.get(None, 2025)
+    index.get(None, 2025)
+
+    assert index.get(None, 2025) is newer
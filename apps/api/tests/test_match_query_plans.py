@@ -0,0 +1,93 @@
+from datetime import datetime
+
+from sqlalchemy import extract, select
+
+from app.api.matches import _month_filter, _team_filter
+from app.db.models import Match, Team
+
+SEASON = 2024
+
+
+def _kickoff(season: int, month: int) -> datetime:
+    return datetime(season if month >= 7 else season + 1, month, 10, 20, 0, 0)
+
+
+def seed_data(session_factory) -> None:
+    db = session_factory()
+    db.add_all([Team(team_id=1, name="Arsenal FC", short_name="ARS"), Team(team_id=2, name="Liverpool FC", short_name="LIV")])
+    db.add_all(
+        [
+            Match(
+                match_id=idx,
+                season=SEASON - idx % 2,
+                round=idx % 38 + 1,
+                match_date=_kickoff(SEASON - idx % 2, idx % 12 + 1),
+                home_team_id=1 if idx % 2 else 2,
+                away_team_id=2 if idx % 2 else 1,
+                status="FINISHED",
+            )
+            for idx in range(1, 121)
+        ]
+    )
+    db.commit()
+    db.close()
+
+
+def _query_plan(db, stmt) -> str:
+    compiled = stmt.compile(dialect=db.get_bind().dialect)
+    params = compiled.construct_params()
+    values = tuple(
+        value.isoformat(sep=" ") if isinstance(value, datetime) else value
+        for value in (params[name] for name in compiled.positiontup)
+    )
+    rows = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", values).all()
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+def _list_query(*filters):
+    return select(Match).where(Match.season == SEASON, *filters).order_by(Match.match_date.desc(), Match.match_id.desc()).limit(51)
+
+
+def test_month_filter_seeks_date_index(session_factory) -> None:
+    seed_data(session_factory)
+    db = session_factory()
+    try:
+        legacy = _query_plan(db, select(Match).where(extract("month", Match.match_date) == 9))
+        plan = _query_plan(db, _list_query(_month_filter(db, 9, SEASON)))
+        rows = db.execute(_list_query(_month_filter(db, 9, SEASON))).scalars().all()
+    finally:
+        db.close()
+
+    assert "SCAN matches" in legacy
+    assert "SCAN matches" not in plan
+    assert "SEARCH matches USING INDEX idx_matches_season_date (season=? AND match_date>? AND match_date<?)" in plan
+    assert rows and all(row.match_date.month == 9 and row.season == SEASON for row in rows)
+
+
+def test_team_filter_uses_home_and_away_indexes(session_factory) -> None:
+    seed_data(session_factory)
+    db = session_factory()
+    try:
+        plan = _query_plan(db, _list_query(_team_filter(1, SEASON)))
+        count = len(db.execute(_list_query(_team_filter(1, SEASON))).scalars().all())
+    finally:
+        db.close()
+
+    assert "SCAN matches" not in plan
+    assert "COVERING INDEX idx_matches_season_home_team_date (season=? AND home_team_id=?)" in plan
+    assert "COVERING INDEX idx_matches_season_away_team_date (season=? AND away_team_id=?)" in plan
+    assert count == 51
+
+
+def test_season_filter_skips_other_seasons(session_factory) -> None:
+    seed_data(session_factory)
+    db = session_factory()
+    try:
+        plan = _query_plan(db, _list_query())
+        seasons = set(db.execute(select(Match.season).where(Match.season == SEASON)).scalars())
+    finally:
+        db.close()
+
+    assert "SCAN matches" not in plan
+    assert "idx_matches_season_date (season=?)" in plan
+    assert seasons == {SEASON}
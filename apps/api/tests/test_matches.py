@@ -1,5 +1,7 @@
 from datetime import datetime
 
+from sqlalchemy import event
+
 from app.db.models import Match, MatchEvent, MatchStat, Standing, Team
 
 
@@ -160,6 +162,33 @@ def test_list_matches_by_month_and_team(client, session_factory) -> None:
     assert data["items"][0]["match_id"] == 3
 
 
+def test_list_matches_cursor_pages_match_offset_pages(client, session_factory) -> None:
+    seed_data(session_factory)
+    expected = [item["match_id"] for item in client.get("/matches").json()["items"]]
+
+    seen: list[int] = []
+    params: dict[str, object] = {"limit": 2, "include_total": False}
+    while True:
+        response = client.get("/matches", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        seen.extend(item["match_id"] for item in data["items"])
+        if data["next_cursor"] is None:
+            break
+        params = {**params, "cursor": data["next_cursor"]}
+
+    assert seen == expected
+
+
+def test_list_matches_invalid_cursor(client, session_factory) -> None:
+    seed_data(session_factory)
+    response = client.get("/matches", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "invalid cursor"
+
+
 def test_get_match_detail(client, session_factory) -> None:
     seed_data(session_factory)
     response = client.get("/matches/1")
@@ -172,6 +201,36 @@ def test_get_match_detail(client, session_factory) -> None:
     assert len(data["stats"]) == 2
 
 
+def test_get_match_detail_single_round_trip(client, session_factory) -> None:
+    seed_data(session_factory)
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    engine = session_factory.kw["bind"]
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        detail = client.get("/matches/1").json()
+        bare = client.get("/matches/2").json()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert len(statements) == 2
+    assert [item["event_id"] for item in detail["events"]] == [11, 12]
+    assert detail["stats"][0] == {
+        "team_id": 1,
+        "possession": 56.4,
+        "shots": 14,
+        "shots_on_target": 6,
+        "fouls": 10,
+        "corners": 7,
+    }
+    assert bare["match"]["match_id"] == 2
+    assert bare["events"] == []
+    assert bare["stats"] == []
+
+
 def test_get_match_detail_not_found(client, session_factory) -> None:
     seed_data(session_factory)
     response = client.get("/matches/999")
@@ -189,3 +248,55 @@ def test_list_standings(client, session_factory) -> None:
     assert data["total"] == 2
     assert data["items"][0]["rank"] == 1
     assert data["items"][1]["rank"] == 2
+
+
+def test_season_filter_defaults_to_current_season(client, session_factory) -> None:
+    seed_data(session_factory)
+    db = session_factory()
+    db.add(
+        Match(
+            match_id=50,
+            season=2019,
+            round=1,
+            match_date=datetime(2019, 8, 10, 15, 0, 0),
+            home_team_id=1,
+            away_team_id=2,
+            home_score=4,
+            away_score=0,
+            status="FINISHED",
+        )
+    )
+    db.add(
+        Standing(
+            season=2019,
+            team_id=3,
+            rank=1,
+            played=1,
+            won=1,
+            drawn=0,
+            lost=0,
+            goals_for=4,
+            goals_against=0,
+            goal_diff=4,
+            points=3,
+        )
+    )
+    db.commit()
+    db.close()
+
+    current = client.get("/matches").json()
+    history = client.get("/matches", params={"season": 2019, "team_id": 1}).json()
+    standings = client.get("/standings", params={"season": 2019}).json()
+
+    assert 50 not in [item["match_id"] for item in current["items"]]
+    assert [item["match_id"] for item in history["items"]] == [50]
+    assert [item["team_id"] for item in standings["items"]] == [3]
+
+
+def test_current_season_rolls_over_unless_pinned(monkeypatch) -> None:
+    from app.core import config
+
+    monkeypatch.setattr(config, "default_season", lambda today=None: 2031)
+
+    assert config.Settings(current_season=None).active_season() == 2031
+    assert config.Settings(current_season=2019).active_season() == 2019
@@ -52,6 +52,6 @@ def _build_openapi_signature(spec: dict) -> dict:
 def test_openapi_signature_snapshot() -> None:
     signature = _build_openapi_signature(app.openapi())
     if os.getenv("UPDATE_OPENAPI_SNAPSHOT") == "1":
-        SNAPSHOT_PATH.write_text(json.dumps(signature, ensure_ascii=False, indent=2), encoding="utf-8")
+        SNAPSHOT_PATH.write_text(json.dumps(signature, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
     expected = json.loads(SNAPSHOT_PATH.read_text(encoding="utf-8"))
     assert signature == expected
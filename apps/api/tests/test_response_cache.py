@@ -0,0 +1,76 @@
+from app.db.models import DataVersion, Standing, Team
+
+
+def seed_data(session_factory) -> None:
+    db = session_factory()
+    db.query(Standing).delete()
+    db.query(Team).delete()
+    db.query(DataVersion).delete()
+
+    db.add_all(
+        [
+            Team(team_id=1, name="Arsenal FC", short_name="ARS"),
+            Team(team_id=2, name="Liverpool FC", short_name="LIV"),
+        ]
+    )
+    db.add_all(
+        [
+            Standing(team_id=1, rank=1, played=1, won=1, drawn=0, lost=0, goals_for=2, goals_against=1, goal_diff=1, points=3),
+            Standing(team_id=2, rank=2, played=1, won=0, drawn=0, lost=1, goals_for=1, goals_against=2, goal_diff=-1, points=0),
+        ]
+    )
+    db.add(DataVersion(id=1, version=1))
+    db.commit()
+    db.close()
+
+
+def _update_points(session_factory, *, points: int, version: int | None) -> None:
+    db = session_factory()
+    db.query(Standing).filter(Standing.team_id == 1).update({"points": points})
+    if version is not None:
+        db.query(DataVersion).filter(DataVersion.id == 1).update({"version": version})
+    db.commit()
+    db.close()
+
+
+def test_cached_response_served_until_data_version_changes(client, session_factory) -> None:
+    seed_data(session_factory)
+
+    first = client.get("/standings")
+    assert first.status_code == 200
+    assert first.json()["items"][0]["points"] == 3
+
+    _update_points(session_factory, points=6, version=None)
+    cached = client.get("/standings")
+    assert cached.json()["items"][0]["points"] == 3
+    assert cached.headers["etag"] == first.headers["etag"]
+
+    _update_points(session_factory, points=6, version=2)
+    refreshed = client.get("/standings")
+    assert refreshed.json()["items"][0]["points"] == 6
+    assert refreshed.headers["etag"] != first.headers["etag"]
+
+
+def test_cache_key_includes_query_params(client, session_factory) -> None:
+    seed_data(session_factory)
+
+    assert client.get("/teams").json()["total"] == 2
+    assert client.get("/stats/top", params={"limit": 1}).json()["total"] == 0
+    assert client.get("/matches", params={"round": 1}).json()["total"] == 0
+    assert client.get("/matches", params={"round": 2}).json()["total"] == 0
+
+
+def test_if_none_match_returns_not_modified(client, session_factory) -> None:
+    seed_data(session_factory)
+
+    first = client.get("/teams")
+    etag = first.headers["etag"]
+
+    revalidated = client.get("/teams", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+    stale = client.get("/teams", headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.json() == first.json()
@@ -0,0 +1,71 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from app.db.models import Match, MatchEvent, MatchStat, Player, PlayerSeasonStat, Standing, Team
+from app.schemas.match import MatchDetailResponse, MatchListResponse
+from app.schemas.standing import StandingsResponse
+from app.schemas.stats import TopStatsResponse
+from app.schemas.team import TeamDetailResponse, TeamListResponse
+
+
+def seed_data(session_factory) -> None:
+    db = session_factory()
+    db.add_all(
+        [
+            Team(team_id=1, name="Arsenal FC", short_name="ARS", manager="Mikel Arteta"),
+            Team(team_id=2, name="Liverpool FC", short_name="LIV", stadium="Anfield"),
+        ]
+    )
+    db.add(Player(player_id=10, team_id=1, name="Bukayo Saka", position="FW", jersey_num=7, nationality="England"))
+    db.add(PlayerSeasonStat(player_id=10, goals=12, assists=9, attack_points=21, clean_sheets=4))
+    db.add(
+        Match(
+            match_id=1,
+            round=1,
+            match_date=datetime(2025, 8, 16, 20, 0, 0),
+            home_team_id=1,
+            away_team_id=2,
+            home_score=2,
+            away_score=1,
+            status="FINISHED",
+        )
+    )
+    db.add(
+        Match(
+            match_id=2,
+            round=2,
+            match_date=datetime(2025, 8, 23, 12, 30, 15, 250000),
+            home_team_id=2,
+            away_team_id=1,
+            status="SCHEDULED",
+        )
+    )
+    db.add(MatchEvent(event_id=1, match_id=1, minute=24, event_type="GOAL", team_id=1, player_name="Saka"))
+    db.add(MatchStat(stat_id=1, match_id=1, team_id=1, possession=56.4, shots=14, shots_on_target=6, fouls=10, corners=7))
+    db.add(Standing(team_id=1, rank=1, played=1, won=1, drawn=0, lost=0, goals_for=2, goals_against=1, goal_diff=1, points=3))
+    db.commit()
+    db.close()
+
+
+@pytest.mark.parametrize(
+    ("path", "model"),
+    [
+        ("/matches", MatchListResponse),
+        ("/matches/1", MatchDetailResponse),
+        ("/standings", StandingsResponse),
+        ("/stats/top", TopStatsResponse),
+        ("/teams", TeamListResponse),
+        ("/teams/1", TeamDetailResponse),
+    ],
+)
+def test_fast_path_body_matches_pydantic_serialization(client, session_factory, path, model) -> None:
+    seed_data(session_factory)
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body == json.loads(model.model_validate(body).model_dump_json())
+    assert body == json.loads(model.model_validate_json(response.content).model_dump_json())
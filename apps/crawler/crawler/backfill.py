@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from itertools import islice
+
+from crawler.config import BackfillConfig, SourceConfig, load_backfill_config, load_source_config
+from crawler.db import Database
+from crawler.ingest import (
+    UpsertResult,
+    bump_data_version,
+    upsert_match_events,
+    upsert_match_lineups,
+    upsert_match_stats,
+    upsert_matches,
+)
+from crawler.logging_utils import log_event
+from crawler.player_stats import refresh_player_season_stats
+from crawler.sources.premier_league import PremierLeagueDataSource
+from crawler.sources.replay import ReplayDataSource
+from crawler.sources.sample_data import MATCH_EVENTS, MATCH_LINEUPS, MATCH_STATS, MATCHES
+from crawler.sources.types import EventPayload, LineupPayload, MatchPayload, MatchStatPayload
+from crawler.standings import refresh_standings
+
+Shard = tuple[int, int]
+
+_PL_SOURCES = {"pl", "premierleague", "premier_league", "replay"}
+_WRITE_DATASETS = ("matches", "match_stats", "match_events", "match_lineups")
+_DERIVED_DATASETS = ("standings", "player_season_stats")
+
+
+@dataclass
+class ShardResult:
+    season: int
+    round: int
+    matches: list[MatchPayload]
+    match_stats: list[MatchStatPayload]
+    match_events: list[EventPayload]
+    match_lineups: list[LineupPayload]
+
+    @property
+    def rows(self) -> int:
+        return len(self.matches) + len(self.match_stats) + len(self.match_events) + len(self.match_lineups)
+
+
+def parse_range(value: str) -> range:
+    """`"2015-2024"` -> `range(2015, 2025)`; a single number is a one-item range."""
+    start, _, end = value.partition("-")
+    first = int(start)
+    last = int(end) if end else first
+    if last < first:
+        raise ValueError(f"empty range: {value}")
+    return range(first, last + 1)
+
+
+def plan_shards(seasons: range, rounds: range, completed: set[Shard]) -> list[Shard]:
+    """Every `(season, round)` pair in the ranges that has no checkpoint yet, oldest first."""
+    return [(season, round_no) for season in seasons for round_no in rounds if (season, round_no) not in completed]
+
+
+def load_shard(source: SourceConfig, backfill: BackfillConfig, shard: Shard) -> ShardResult:
+    """Fetch and parse one `(season, round)` shard. Runs in a worker process, so it only takes picklable config.
+
+    The shard already has a process of its own, so the source parses in-process (`parse_workers=0`).
+    Every configured dataset runs under the `abort` policy: a page that fails to fetch or parse
+    raises here, so the shard is never checkpointed with that dataset missing.
+    """
+    season, round_no = shard
+    if source.source == "sample":
+        return ShardResult(
+            season=season,
+            round=round_no,
+            matches=[row for row in MATCHES if int(row["round"]) == round_no],
+            match_stats=[row for row in MATCH_STATS if int(row["round"]) == round_no],
+            match_events=[row for row in MATCH_EVENTS if int(row["round"]) == round_no],
+            match_lineups=[row for row in MATCH_LINEUPS if int(row["round"]) == round_no],
+        )
+    if source.source not in _PL_SOURCES:
+        raise ValueError(f"unsupported CRAWLER_DATA_SOURCE: {source.source}")
+    if not backfill.matches_url_template:
+        raise ValueError("PL_BACKFILL_MATCHES_URL is required to backfill the premierleague source")
+
+    def _url(template: str) -> str:
+        return template.format(season=season, round=round_no) if template else ""
+
+    config = replace(
+        source,
+        matches_url=_url(backfill.matches_url_template),
+        match_stats_url=_url(backfill.match_stats_url_template),
+        match_events_url=_url(backfill.match_events_url_template),
+        match_lineups_url=_url(backfill.match_lineups_url_template),
+        dataset_policy_matches="abort",
+        dataset_policy_match_stats="abort",
+        dataset_policy_match_events="abort",
+        dataset_policy_match_lineups="abort",
+        teams_seed_fallback=False,
+        matches_seed_fallback=False,
+        parse_workers=0,
+    )
+    data_source = ReplayDataSource(config) if config.source == "replay" else PremierLeagueDataSource(config)
+    datasets = ["matches"]
+    if config.match_stats_url:
+        datasets.append("match_stats")
+    if config.match_events_url:
+        datasets.append("match_events")
+    if config.match_lineups_url:
+        datasets.append("match_lineups")
+    data_source.prefetch(datasets)
+    return ShardResult(
+        season=season,
+        round=round_no,
+        matches=[row for row in data_source.load_matches() if int(row["round"]) == round_no],
+        match_stats=(
+            [row for row in data_source.load_match_stats() if int(row["round"]) == round_no]
+            if config.match_stats_url
+            else []
+        ),
+        match_events=[row for row in data_source.load_match_events() if int(row["round"]) == round_no],
+        match_lineups=[row for row in data_source.load_match_lineups() if int(row["round"]) == round_no],
+    )
+
+
+def run_backfill(
+    db: Database,
+    seasons: range,
+    rounds: range,
+    *,
+    workers: int | None = None,
+    restart: bool = False,
+    source_config: SourceConfig | None = None,
+    backfill_config: BackfillConfig | None = None,
+) -> dict[str, UpsertResult]:
+    """Load every un-checkpointed `(season, round)` shard and write it through a single writer.
+
+    Shards are fetched and parsed in a process pool of `workers` (`0` parses in-process).
+    Results are buffered per season and upserted in batches; each batch commits together with
+    the checkpoints of the shards it contains, so a killed run resumes after the last commit.
+    Fixtures naming a club missing from `teams` are dropped and their shard is not checkpointed.
+    A batch that writes rows also recomputes its season's standings and player season stats
+    before that commit, so a checkpointed season is never left without them.
+    The returned results carry counts only, not `changed_keys`.
+    """
+    source_config = source_config or load_source_config()
+    backfill_config = backfill_config or load_backfill_config()
+    workers = backfill_config.workers if workers is None else workers
+
+    if restart:
+        _clear_checkpoints(db, seasons, rounds)
+        db.commit()
+    completed = _completed_shards(db, seasons)
+    shards = plan_shards(seasons, rounds, completed)
+    log_event(
+        "INFO",
+        "backfill.start",
+        seasons=f"{seasons.start}-{seasons.stop - 1}",
+        rounds=f"{rounds.start}-{rounds.stop - 1}",
+        shards=len(shards),
+        resumed=len(seasons) * len(rounds) - len(shards),
+        workers=workers,
+    )
+
+    writer = _ShardWriter(db, backfill_config.flush_rows)
+    try:
+        for shard in _load_shards(shards, source_config, backfill_config, workers):
+            writer.add(shard)
+    except BaseException:
+        # Keep the shards parsed so far; a half-written batch (if the writer failed) is rolled back first.
+        db.rollback()
+        writer.flush_all()
+        raise
+    writer.flush_all()
+
+    results = writer.totals
+    log_event(
+        "INFO",
+        "backfill.done",
+        shards=len(shards),
+        seasons_changed=sorted(writer.changed_seasons),
+        **{f"{dataset}_written": result.written for dataset, result in results.items()},
+    )
+    return results
+
+
+def _load_shards(
+    shards: list[Shard], source: SourceConfig, backfill: BackfillConfig, workers: int
+) -> Iterator[ShardResult]:
+    """Yield parsed shards in completion order, keeping at most `2 * workers` in flight."""
+    if workers <= 0:
+        for shard in shards:
+            yield load_shard(source, backfill, shard)
+        return
+
+    queue = iter(shards)
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending: set[Future[ShardResult]] = {
+            pool.submit(load_shard, source, backfill, shard) for shard in islice(queue, workers * 2)
+        }
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                yield future.result()
+                next_shard = next(queue, None)
+                if next_shard is not None:
+                    pending.add(pool.submit(load_shard, source, backfill, next_shard))
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+class _ShardWriter:
+    """Buffers shard payloads per season and writes them with one set of batched upserts per flush.
+
+    A flush that wrote rows refreshes the season's derived tables in the same transaction as the
+    rows and their checkpoints.
+    """
+
+    def __init__(self, db: Database, flush_rows: int) -> None:
+        self.db = db
+        self.flush_rows = flush_rows
+        self.pending: dict[int, list[ShardResult]] = {}
+        self.totals: dict[str, UpsertResult] = {
+            dataset: UpsertResult() for dataset in (*_WRITE_DATASETS, *_DERIVED_DATASETS)
+        }
+        self.changed_seasons: set[int] = set()
+
+    def add(self, shard: ShardResult) -> None:
+        buffered = self.pending.setdefault(shard.season, [])
+        buffered.append(shard)
+        if sum(item.rows for item in buffered) >= self.flush_rows:
+            self.flush(shard.season)
+
+    def flush_all(self) -> None:
+        for season in sorted(self.pending):
+            self.flush(season)
+
+    def flush(self, season: int) -> None:
+        shards = self.pending.pop(season, [])
+        if not shards:
+            return
+        known = {str(short_name) for (short_name,) in self.db.itertuples("SELECT short_name FROM teams")}
+        matches: list[MatchPayload] = []
+        match_stats: list[MatchStatPayload] = []
+        match_events: list[EventPayload] = []
+        match_lineups: list[LineupPayload] = []
+        complete: list[ShardResult] = []
+        for shard in shards:
+            fixtures = {
+                _fixture(row)
+                for row in shard.matches
+                if row["home_team_short_name"] in known and row["away_team_short_name"] in known
+            }
+            kept_matches = [row for row in shard.matches if _fixture(row) in fixtures]
+            kept_stats = [
+                row for row in shard.match_stats if _fixture(row) in fixtures and row["team_short_name"] in known
+            ]
+            kept_events = [row for row in shard.match_events if _fixture(row) in fixtures]
+            kept_lineups = [
+                row for row in shard.match_lineups if _fixture(row) in fixtures and row["team_short_name"] in known
+            ]
+            matches += kept_matches
+            match_stats += kept_stats
+            match_events += kept_events
+            match_lineups += kept_lineups
+            dropped = shard.rows - len(kept_matches) - len(kept_stats) - len(kept_events) - len(kept_lineups)
+            if dropped:
+                # Left without a checkpoint so the shard is retried once the missing clubs are loaded.
+                log_event("WARNING", "backfill.unknown_fixtures", season=season, round=shard.round, rows=dropped)
+            else:
+                complete.append(shard)
+
+        results = {
+            "matches": upsert_matches(self.db, matches, season=season),
+            "match_stats": upsert_match_stats(self.db, match_stats, season=season),
+            "match_events": upsert_match_events(self.db, match_events, season=season),
+            "match_lineups": upsert_match_lineups(self.db, match_lineups, season=season),
+        }
+        changed = any(result.written for result in results.values())
+        if changed:
+            results["standings"] = refresh_standings(self.db, season=season)
+            results["player_season_stats"] = refresh_player_season_stats(self.db, season=season)
+        completed_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        self.db.executemany(
+            _checkpoint_sql(self.db),
+            [(season, shard.round, len(shard.matches), completed_at) for shard in complete],
+        )
+        bump_data_version(self.db, results)
+        self.db.commit()
+
+        for dataset, result in results.items():
+            _accumulate(self.totals[dataset], result)
+        if changed:
+            self.changed_seasons.add(season)
+        log_event(
+            "INFO",
+            "backfill.flush",
+            season=season,
+            rounds=sorted(shard.round for shard in shards),
+            **{f"{dataset}_written": result.written for dataset, result in results.items()},
+        )
+
+
+def _fixture(row: MatchPayload | MatchStatPayload | EventPayload | LineupPayload) -> tuple[int, str, str]:
+    return int(row["round"]), row["home_team_short_name"], row["away_team_short_name"]
+
+
+def _accumulate(total: UpsertResult, result: UpsertResult) -> None:
+    total.written += result.written
+    total.skipped += result.skipped
+
+
+def _completed_shards(db: Database, seasons: range) -> set[Shard]:
+    marker = "?" if db.config.engine == "sqlite" else "%s"
+    rows = db.itertuples(
+        f"SELECT season, round FROM backfill_checkpoints WHERE season BETWEEN {marker} AND {marker}",
+        (seasons.start, seasons.stop - 1),
+    )
+    return {(int(season), int(round_no)) for season, round_no in rows}
+
+
+def _clear_checkpoints(db: Database, seasons: range, rounds: range) -> None:
+    marker = "?" if db.config.engine == "sqlite" else "%s"
+    db.execute(
+        f"""
+        DELETE FROM backfill_checkpoints
+        WHERE season BETWEEN {marker} AND {marker} AND round BETWEEN {marker} AND {marker}
+        """,
+        (seasons.start, seasons.stop - 1, rounds.start, rounds.stop - 1),
+    )
+
+
+def _checkpoint_sql(db: Database) -> str:
+    if db.config.engine == "sqlite":
+        return """
+            INSERT INTO backfill_checkpoints(season, round, matches, completed_at)
+            VALUES(?, ?, ?, ?)
+            ON CONFLICT(season, round) DO UPDATE SET
+              matches=excluded.matches,
+              completed_at=excluded.completed_at
+            """
+    return """
+        INSERT INTO backfill_checkpoints(season, round, matches, completed_at)
+        VALUES(%s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+          matches=VALUES(matches),
+          completed_at=VALUES(completed_at)
+        """
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+import cProfile
 import time
 from collections.abc import Callable
 
 from crawler.alerts import send_failure_alert
-from crawler.config import load_batch_policy_config, load_db_config
+from crawler.config import BatchPolicyConfig, load_batch_policy_config, load_db_config
 from crawler.db import Database
-from crawler.ingest import ingest_all, summary, upsert_matches, upsert_teams
+from crawler.ingest import (
+    UpsertResult,
+    bump_data_version,
+    ingest_all,
+    latest_match_season,
+    summary,
+    timed_upsert,
+    upsert_matches,
+    upsert_teams,
+)
 from crawler.logging_utils import log_event
+from crawler.player_stats import players_touched_by, refresh_player_season_stats
 from crawler.sources import get_data_source
+from crawler.standings import refresh_standings, teams_touched_by
+from crawler.timing import recording, span
 
 
 def daily_update() -> int:
@@ -19,20 +32,45 @@ def weekly_sync() -> int:
     return _run_batch(job_name="weekly_sync", run_fn=_run_weekly)
 
 
-def _run_batch(*, job_name: str, run_fn: Callable[[Database], None]) -> int:
+def _run_batch(*, job_name: str, run_fn: Callable[[Database], dict[str, UpsertResult] | None]) -> int:
     log_event("INFO", "batch.start", job=job_name)
     policy = load_batch_policy_config()
+    if not policy.profile_out:
+        return _run_attempts(job_name, run_fn, policy)
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(_run_attempts, job_name, run_fn, policy)
+    finally:
+        profiler.dump_stats(policy.profile_out)
+        log_event("INFO", "batch.profile", job=job_name, path=policy.profile_out)
+
+
+def _run_attempts(
+    job_name: str, run_fn: Callable[[Database], dict[str, UpsertResult] | None], policy: BatchPolicyConfig
+) -> int:
     last_error: Exception | None = None
 
     for attempt in range(1, policy.retry_count + 1):
         db: Database | None = None
         try:
-            config = load_db_config()
-            db = Database.connect(config)
-            db.bootstrap()
-            run_fn(db)
-            db.commit()
-            log_event("INFO", "batch.success", job=job_name, attempt=attempt, summary=summary(db))
+            with recording() as recorder:
+                config = load_db_config()
+                with span("bootstrap"):
+                    db = Database.connect(config)
+                    db.bootstrap()
+                results = run_fn(db)
+                with span("commit"):
+                    bump_data_version(db, results or {})
+                    db.commit()
+            log_event(
+                "INFO",
+                "batch.success",
+                job=job_name,
+                attempt=attempt,
+                summary=summary(db, results),
+                timings=recorder.summary(),
+            )
             return 0
         except Exception as exc:
             last_error = exc
@@ -55,11 +93,54 @@ def _run_batch(*, job_name: str, run_fn: Callable[[Database], None]) -> int:
     return 1
 
 
-def _run_daily(db: Database) -> None:
-    ingest_all(db)
+def _run_daily(db: Database) -> dict[str, UpsertResult]:
+    results = ingest_all(db)
+    results.update(refresh_derived(db, results))
+    return results
 
 
-def _run_weekly(db: Database) -> None:
+def _run_weekly(db: Database) -> dict[str, UpsertResult]:
     source = get_data_source()
-    upsert_teams(db, source.load_teams())
-    upsert_matches(db, source.load_matches())
+    source.prefetch(["teams", "matches"])
+    results = {
+        "teams": timed_upsert("teams", upsert_teams, db, source.load_teams()),
+        "matches": timed_upsert("matches", upsert_matches, db, source.load_matches()),
+    }
+    results.update(refresh_derived(db, results))
+    return results
+
+
+def refresh_derived(
+    db: Database, results: dict[str, UpsertResult], season: int | None = None
+) -> dict[str, UpsertResult]:
+    """Refresh standings and player season stats for whatever `results` touched.
+
+    Every path that writes matches must call this in the same transaction: the upsert stores
+    the new fingerprints, so a later run would see those matches as unchanged and skip them.
+    Without `season`, every season with a changed fixture is refreshed, plus the latest one.
+    """
+    if season is not None:
+        seasons = {season}
+    else:
+        match_result = results.get("matches")
+        seasons = {int(key[0]) for key in match_result.changed_keys} if match_result is not None else set()
+        seasons.add(latest_match_season(db))
+    team_ids = teams_touched_by(results, db)
+    player_ids = players_touched_by(results, db)
+    derived = {"standings": UpsertResult(), "player_season_stats": UpsertResult()}
+    for refreshed_season in sorted(seasons):
+        with span("derive", dataset="standings", season=refreshed_season) as deriving:
+            standings = refresh_standings(db, team_ids, season=refreshed_season)
+            deriving.rows_written = standings.written
+        with span("derive", dataset="player_season_stats", season=refreshed_season) as deriving:
+            player_stats = refresh_player_season_stats(db, player_ids, season=refreshed_season)
+            deriving.rows_written = player_stats.written
+        _merge(derived["standings"], standings)
+        _merge(derived["player_season_stats"], player_stats)
+    return derived
+
+
+def _merge(total: UpsertResult, result: UpsertResult) -> None:
+    total.written += result.written
+    total.skipped += result.skipped
+    total.changed_keys |= result.changed_keys
@@ -3,18 +3,24 @@ from __future__ import annotations
 import argparse
 import json
 
-from crawler.config import load_db_config
+from crawler.backfill import parse_range, run_backfill
+from crawler.batch_runner import refresh_derived
+from crawler.config import default_season, load_db_config
 from crawler.db import Database
-from crawler.ingest import ingest_all, summary, upsert_matches, upsert_players, upsert_teams
+from crawler.ingest import UpsertResult, bump_data_version, ingest_all, summary, upsert_matches, upsert_players, upsert_teams
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="EPL crawler ingestion CLI")
     parser.add_argument(
         "command",
-        choices=["ingest-all", "ingest-teams", "ingest-players", "ingest-matches", "summary"],
+        choices=["ingest-all", "ingest-teams", "ingest-players", "ingest-matches", "backfill", "summary"],
         help="command to execute",
     )
+    parser.add_argument("--seasons", type=parse_range, help="backfill: season range, e.g. 2015-2024 (default: current)")
+    parser.add_argument("--rounds", type=parse_range, default=range(1, 39), help="backfill: round range (default: 1-38)")
+    parser.add_argument("--workers", type=int, help="backfill: parser processes (default: CRAWLER_BACKFILL_WORKERS)")
+    parser.add_argument("--restart", action="store_true", help="backfill: ignore checkpoints in the given ranges")
 
     args = parser.parse_args()
 
@@ -24,20 +30,28 @@ def main() -> None:
     try:
         db.bootstrap()
 
+        results: dict[str, UpsertResult] = {}
         if args.command == "ingest-all":
-            ingest_all(db)
-            db.commit()
+            results = ingest_all(db)
         elif args.command == "ingest-teams":
-            upsert_teams(db)
-            db.commit()
+            results = {"teams": upsert_teams(db)}
         elif args.command == "ingest-players":
-            upsert_players(db)
-            db.commit()
+            results = {"players": upsert_players(db)}
         elif args.command == "ingest-matches":
-            upsert_matches(db)
+            results = {"matches": upsert_matches(db)}
+        elif args.command == "backfill":
+            # Commits per batch (with its checkpoints) and bumps data_version itself.
+            seasons = args.seasons or range(default_season(), default_season() + 1)
+            results = run_backfill(db, seasons, args.rounds, workers=args.workers, restart=args.restart)
+            print(json.dumps(summary(db, results), ensure_ascii=False))
+            return
+
+        if results:
+            results.update(refresh_derived(db, results))
+            bump_data_version(db, results)
             db.commit()
 
-        print(json.dumps(summary(db), ensure_ascii=False))
+        print(json.dumps(summary(db, results), ensure_ascii=False))
     except Exception:
         db.rollback()
         raise
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from datetime import date
 from urllib.parse import urlparse
 
 
@@ -14,6 +15,7 @@ class DbConfig:
     user: str | None
     password: str | None
     database: str | None
+    batch_size: int = 500
 
 
 @dataclass
@@ -35,12 +37,37 @@ class SourceConfig:
     dataset_policy_match_stats: str
     teams_seed_fallback: bool
     matches_seed_fallback: bool
+    http_cache_dir: str | None = None
+    fetch_concurrency: int = 4
+    match_events_url: str = ""
+    dataset_policy_match_events: str = "skip"
+    parse_workers: int = 0
+    archive_dir: str | None = None
+    match_lineups_url: str = ""
+    dataset_policy_match_lineups: str = "skip"
+
+
+@dataclass
+class IngestConfig:
+    incremental: bool
+    season: int = 0
+
+
+@dataclass
+class BackfillConfig:
+    matches_url_template: str
+    match_stats_url_template: str
+    match_events_url_template: str
+    workers: int
+    flush_rows: int
+    match_lineups_url_template: str = ""
 
 
 @dataclass
 class BatchPolicyConfig:
     retry_count: int
     retry_backoff_seconds: float
+    profile_out: str | None = None
 
 
 @dataclass
@@ -52,6 +79,7 @@ class AlertConfig:
 def load_db_config() -> DbConfig:
     db_url = os.getenv("DB_URL", "sqlite:///./apps/crawler/dev_crawler.db")
     parsed = urlparse(db_url)
+    batch_size = max(int(os.getenv("DB_BATCH_SIZE", "500")), 1)
 
     if parsed.scheme.startswith("sqlite"):
         raw_path = parsed.path or "./apps/crawler/dev_crawler.db"
@@ -73,6 +101,7 @@ def load_db_config() -> DbConfig:
             user=None,
             password=None,
             database=None,
+            batch_size=batch_size,
         )
 
     if parsed.scheme.startswith("mysql"):
@@ -84,6 +113,7 @@ def load_db_config() -> DbConfig:
             user=parsed.username,
             password=parsed.password,
             database=(parsed.path or "").lstrip("/"),
+            batch_size=batch_size,
         )
 
     raise ValueError(f"unsupported DB_URL scheme: {parsed.scheme}")
@@ -95,6 +125,8 @@ def load_source_config() -> SourceConfig:
     ca_file_raw = os.getenv("PL_HTTP_CA_FILE", "").strip()
     teams_seed_fallback_raw = os.getenv("PL_TEAMS_SEED_FALLBACK", "1").strip().lower()
     matches_seed_fallback_raw = os.getenv("PL_MATCHES_SEED_FALLBACK", "1").strip().lower()
+    http_cache_dir_raw = os.getenv("PL_HTTP_CACHE_DIR", "").strip()
+    archive_dir_raw = os.getenv("PL_ARCHIVE_DIR", "").strip()
     return SourceConfig(
         source=os.getenv("CRAWLER_DATA_SOURCE", "sample").strip().lower(),
         teams_url=os.getenv("PL_TEAMS_URL", "https://www.premierleague.com/en/clubs"),
@@ -113,6 +145,48 @@ def load_source_config() -> SourceConfig:
         dataset_policy_match_stats=os.getenv("PL_POLICY_MATCH_STATS", "skip").strip().lower(),
         teams_seed_fallback=teams_seed_fallback_raw in {"1", "true", "yes", "on"},
         matches_seed_fallback=matches_seed_fallback_raw in {"1", "true", "yes", "on"},
+        http_cache_dir=http_cache_dir_raw or None,
+        fetch_concurrency=max(int(os.getenv("PL_HTTP_FETCH_CONCURRENCY", "4")), 1),
+        match_events_url=os.getenv("PL_MATCH_EVENTS_URL", "").strip(),
+        dataset_policy_match_events=os.getenv("PL_POLICY_MATCH_EVENTS", "skip").strip().lower(),
+        parse_workers=max(int(os.getenv("PL_PARSE_WORKERS", "0")), 0),
+        archive_dir=archive_dir_raw or None,
+        match_lineups_url=os.getenv("PL_MATCH_LINEUPS_URL", "").strip(),
+        dataset_policy_match_lineups=os.getenv("PL_POLICY_MATCH_LINEUPS", "skip").strip().lower(),
+    )
+
+
+def default_season(today: date | None = None) -> int:
+    """Starting year of the season in progress (2025 = 2025/26); a new season starts in July."""
+    today = today or date.today()
+    return today.year if today.month >= 7 else today.year - 1
+
+
+def season_of(match_date: str | None) -> int | None:
+    """Season a `YYYY-MM-DD[ HH:MM:SS]` match date falls in (same July rollover), or None if it does not parse."""
+    try:
+        return default_season(date.fromisoformat(str(match_date)[:10]))
+    except ValueError:
+        return None
+
+
+def load_ingest_config() -> IngestConfig:
+    incremental_raw = os.getenv("CRAWLER_INCREMENTAL_INGEST", "1").strip().lower()
+    season_raw = os.getenv("CRAWLER_SEASON", "").strip()
+    return IngestConfig(
+        incremental=incremental_raw in {"1", "true", "yes", "on"},
+        season=int(season_raw) if season_raw else default_season(),
+    )
+
+
+def load_backfill_config() -> BackfillConfig:
+    return BackfillConfig(
+        matches_url_template=os.getenv("PL_BACKFILL_MATCHES_URL", "").strip(),
+        match_stats_url_template=os.getenv("PL_BACKFILL_MATCH_STATS_URL", "").strip(),
+        match_events_url_template=os.getenv("PL_BACKFILL_MATCH_EVENTS_URL", "").strip(),
+        workers=max(int(os.getenv("CRAWLER_BACKFILL_WORKERS", str(os.cpu_count() or 1))), 0),
+        flush_rows=max(int(os.getenv("CRAWLER_BACKFILL_FLUSH_ROWS", "2000")), 1),
+        match_lineups_url_template=os.getenv("PL_BACKFILL_MATCH_LINEUPS_URL", "").strip(),
     )
 
 
@@ -123,6 +197,7 @@ def load_batch_policy_config() -> BatchPolicyConfig:
     return BatchPolicyConfig(
         retry_count=retry_count,
         retry_backoff_seconds=float(os.getenv("BATCH_RETRY_BACKOFF_SECONDS", "1.0")),
+        profile_out=os.getenv("BATCH_PROFILE_OUT", "").strip() or None,
     )
 
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import sqlite3
+from collections.abc import Iterator
 from dataclasses import dataclass
 
-from crawler.config import DbConfig
+from crawler.config import DbConfig, default_season
+from crawler.logging_utils import log_event
 from crawler.schema_sqlite import SCHEMA_SQLITE
 
 
@@ -41,10 +43,68 @@ class Database:
         if self.config.engine != "sqlite":
             return
         statements = [s.strip() for s in SCHEMA_SQLITE.split(";") if s.strip()]
+        self._upgrade_sqlite(statements)
         for stmt in statements:
             self.execute(stmt)
         self.commit()
 
+    def _columns(self, table: str) -> list[str]:
+        return [row["name"] for row in self.fetchall(f"PRAGMA table_info({table})")]
+
+    def _upgrade_sqlite(self, statements: list[str]) -> None:
+        """Bring a file created by an older crawler up to `SCHEMA_SQLITE` in place.
+
+        SQLite cannot add a column to a primary or unique key, so `matches`, `standings` and
+        `player_season_stats` without `season` are rebuilt and copied, keeping their ids. Seasons
+        are filled like MySQL migration 009: a match's from its date (July starts a season), the
+        derived tables' from the latest match season.
+        """
+        rebuild = [
+            table
+            for table in ("matches", "standings", "player_season_stats")
+            if (columns := self._columns(table)) and "season" not in columns
+        ]
+        events = self._columns("match_events")
+        if events and "source_event_id" not in events:
+            self.execute("ALTER TABLE match_events ADD COLUMN source_event_id TEXT")
+        if not rebuild:
+            self.commit()
+            return
+
+        season_sql = {
+            "matches": "CAST(strftime('%Y', match_date) AS INTEGER)"
+            " - (CAST(strftime('%m', match_date) AS INTEGER) < 7)",
+            "standings": "COALESCE((SELECT MAX(season) FROM matches), ?)",
+            "player_season_stats": "COALESCE((SELECT MAX(season) FROM matches), ?)",
+        }
+        self.commit()
+        self.execute("PRAGMA foreign_keys = OFF")
+        try:
+            self.execute("BEGIN")
+            for table in rebuild:
+                prefix = f"CREATE TABLE IF NOT EXISTS {table} ("
+                create = next(stmt for stmt in statements if stmt.startswith(prefix))
+                self.execute(create.replace(prefix, f"CREATE TABLE {table}__upgrade (", 1))
+                columns = ", ".join(self._columns(table))
+                params = () if table == "matches" else (default_season(),)
+                self.execute(
+                    f"INSERT INTO {table}__upgrade (season, {columns}) "
+                    f"SELECT {season_sql[table]}, {columns} FROM {table}",
+                    params,
+                )
+                self.execute(f"DROP TABLE {table}")
+                self.execute(f"ALTER TABLE {table}__upgrade RENAME TO {table}")
+            violations = self.fetchall("PRAGMA foreign_key_check")
+            if violations:
+                raise sqlite3.IntegrityError(f"foreign key check failed after upgrade: {violations[:3]}")
+            self.commit()
+        except Exception:
+            self.rollback()
+            raise
+        finally:
+            self.execute("PRAGMA foreign_keys = ON")
+        log_event("INFO", "db.sqlite_upgraded", tables=rebuild)
+
     def execute(self, sql: str, params: tuple | list | None = None) -> int:
         params = params or ()
         if self.config.engine == "sqlite":
@@ -55,6 +115,27 @@ class Database:
             cursor.execute(sql, params)
             return cursor.rowcount
 
+    def executemany(self, sql: str, rows: list[tuple] | list[list], batch_size: int | None = None) -> int:
+        """Run `sql` once per parameter row, sending rows to the server in chunks.
+
+        pymysql rewrites `INSERT ... VALUES (...)` into a multi-row `VALUES` list per chunk,
+        so a chunk costs a single round-trip instead of one per row.
+        """
+        if not rows:
+            return 0
+        size = batch_size or self.config.batch_size
+        affected = 0
+        for start in range(0, len(rows), size):
+            chunk = rows[start : start + size]
+            if self.config.engine == "sqlite":
+                cursor = self.conn.executemany(sql, chunk)
+                affected += max(cursor.rowcount, 0)
+                continue
+            with self.conn.cursor() as cursor:
+                cursor.executemany(sql, chunk)
+                affected += max(cursor.rowcount, 0)
+        return affected
+
     def fetchall(self, sql: str, params: tuple | list | None = None) -> list[dict]:
         params = params or ()
         if self.config.engine == "sqlite":
@@ -68,8 +149,63 @@ class Database:
             return list(rows)
 
     def fetchone(self, sql: str, params: tuple | list | None = None) -> dict | None:
-        rows = self.fetchall(sql, params)
-        return rows[0] if rows else None
+        params = params or ()
+        if self.config.engine == "sqlite":
+            cursor = self.conn.execute(sql, params)
+            try:
+                row = cursor.fetchone()
+            finally:
+                cursor.close()
+            return dict(row) if row is not None else None
+
+        with self.conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchone()
+
+    def iterfetch(self, sql: str, params: tuple | list | None = None, size: int | None = None) -> Iterator[dict]:
+        """Yield rows as dicts, pulling `size` rows (default `DB_BATCH_SIZE`) from the cursor at a time.
+
+        MySQL rows stream from an unbuffered cursor, so finish iterating before running
+        another statement on the same connection.
+        """
+        if self.config.engine == "sqlite":
+            yield from self._iter_rows(self.conn.execute(sql, params or ()), size, dict)
+            return
+
+        import pymysql
+
+        with self.conn.cursor(pymysql.cursors.SSDictCursor) as cursor:
+            cursor.execute(sql, params or ())
+            yield from self._iter_rows(cursor, size, None)
+
+    def itertuples(self, sql: str, params: tuple | list | None = None, size: int | None = None) -> Iterator[tuple]:
+        """Like `iterfetch` but yields plain tuples in SELECT order, for hot internal lookups."""
+        if self.config.engine == "sqlite":
+            cursor = self.conn.cursor()
+            cursor.row_factory = None
+            yield from self._iter_rows(cursor.execute(sql, params or ()), size, None)
+            return
+
+        import pymysql
+
+        with self.conn.cursor(pymysql.cursors.SSCursor) as cursor:
+            cursor.execute(sql, params or ())
+            yield from self._iter_rows(cursor, size, None)
+
+    def _iter_rows(self, cursor, size: int | None, convert) -> Iterator:
+        chunk_size = size or self.config.batch_size
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                if convert is None:
+                    yield from rows
+                else:
+                    for row in rows:
+                        yield convert(row)
+        finally:
+            cursor.close()
 
     def commit(self) -> None:
         self.conn.commit()
@@ -1,157 +1,212 @@
 from __future__ import annotations
 
+import hashlib
+import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+from crawler.config import load_ingest_config, season_of
 from crawler.db import Database
 from crawler.sources import get_data_source
-from crawler.sources.types import MatchPayload, MatchStatPayload, PlayerPayload, TeamPayload
+from crawler.sources.types import (
+    EventPayload,
+    LineupPayload,
+    MatchPayload,
+    MatchStatPayload,
+    PlayerPayload,
+    TeamPayload,
+)
+from crawler.timing import span
+
+
+@dataclass
+class UpsertResult:
+    written: int = 0
+    skipped: int = 0
+    changed_keys: set[tuple] = field(default_factory=set)
+
+
+def _fingerprint(row: tuple) -> str:
+    encoded = json.dumps(row, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+def _load_fingerprints(db: Database, dataset: str) -> dict[str, str]:
+    if db.config.engine == "sqlite":
+        sql = "SELECT row_key, fingerprint FROM ingest_fingerprints WHERE dataset = ?"
+    else:
+        sql = "SELECT row_key, fingerprint FROM ingest_fingerprints WHERE dataset = %s"
+    return {str(row_key): str(fingerprint) for row_key, fingerprint in db.itertuples(sql, (dataset,))}
+
+
+def _store_fingerprints(db: Database, rows: list[tuple[str, str, str]]) -> None:
+    if db.config.engine == "sqlite":
+        sql = """
+            INSERT INTO ingest_fingerprints(dataset, row_key, fingerprint)
+            VALUES(?, ?, ?)
+            ON CONFLICT(dataset, row_key) DO UPDATE SET
+              fingerprint=excluded.fingerprint
+            """
+    else:
+        sql = """
+            INSERT INTO ingest_fingerprints(dataset, row_key, fingerprint)
+            VALUES(%s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+              fingerprint=VALUES(fingerprint)
+            """
+    db.executemany(sql, rows)
+
+
+def _write_changed(db: Database, *, dataset: str, sql: str, keyed_rows: list[tuple[tuple, tuple]]) -> UpsertResult:
+    """Upsert only rows whose fingerprint differs from the one stored by the previous run."""
+    stored = _load_fingerprints(db, dataset) if load_ingest_config().incremental else {}
+    result = UpsertResult()
+    changed_rows: list[tuple] = []
+    fingerprints: list[tuple[str, str, str]] = []
 
+    for key, row in dict(keyed_rows).items():
+        row_key = "|".join(str(part) for part in key)
+        fingerprint = _fingerprint(row)
+        if stored.get(row_key) == fingerprint:
+            result.skipped += 1
+            continue
+        changed_rows.append(row)
+        fingerprints.append((dataset, row_key, fingerprint))
+        result.changed_keys.add(key)
 
-def upsert_teams(db: Database, teams: list[TeamPayload] | None = None) -> None:
+    db.executemany(sql, changed_rows)
+    _store_fingerprints(db, fingerprints)
+    result.written = len(changed_rows)
+    return result
+
+
+def upsert_teams(db: Database, teams: list[TeamPayload] | None = None) -> UpsertResult:
     if teams is None:
         teams = get_data_source().load_teams()
-    for team in teams:
-        if db.config.engine == "sqlite":
-            db.execute(
-                """
-                INSERT INTO teams(name, short_name, logo_url, stadium, manager)
-                VALUES(?, ?, ?, ?, ?)
-                ON CONFLICT(short_name) DO UPDATE SET
-                  name=excluded.name,
-                  logo_url=excluded.logo_url,
-                  stadium=excluded.stadium,
-                  manager=excluded.manager
-                """,
-                (
-                    team["name"],
-                    team["short_name"],
-                    team["logo_url"],
-                    team["stadium"],
-                    team["manager"],
-                ),
-            )
-        else:
-            db.execute(
-                """
-                INSERT INTO teams(name, short_name, logo_url, stadium, manager)
-                VALUES(%s, %s, %s, %s, %s)
-                ON DUPLICATE KEY UPDATE
-                  name=VALUES(name),
-                  logo_url=VALUES(logo_url),
-                  stadium=VALUES(stadium),
-                  manager=VALUES(manager)
-                """,
-                (
-                    team["name"],
-                    team["short_name"],
-                    team["logo_url"],
-                    team["stadium"],
-                    team["manager"],
-                ),
-            )
+    keyed_rows = [
+        (
+            (team["short_name"],),
+            (
+                team["name"],
+                team["short_name"],
+                team["logo_url"],
+                team["stadium"],
+                team["manager"],
+            ),
+        )
+        for team in teams
+    ]
+
+    if db.config.engine == "sqlite":
+        sql = """
+            INSERT INTO teams(name, short_name, logo_url, stadium, manager)
+            VALUES(?, ?, ?, ?, ?)
+            ON CONFLICT(short_name) DO UPDATE SET
+              name=excluded.name,
+              logo_url=excluded.logo_url,
+              stadium=excluded.stadium,
+              manager=excluded.manager
+            """
+    else:
+        sql = """
+            INSERT INTO teams(name, short_name, logo_url, stadium, manager)
+            VALUES(%s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+              name=VALUES(name),
+              logo_url=VALUES(logo_url),
+              stadium=VALUES(stadium),
+              manager=VALUES(manager)
+            """
+    return _write_changed(db, dataset="teams", sql=sql, keyed_rows=keyed_rows)
 
 
 def _team_id_map(db: Database) -> dict[str, int]:
-    rows = db.fetchall("SELECT team_id, short_name FROM teams")
-    return {str(row["short_name"]): int(row["team_id"]) for row in rows}
+    rows = db.itertuples("SELECT team_id, short_name FROM teams")
+    return {str(short_name): int(team_id) for team_id, short_name in rows}
 
 
-def upsert_players(db: Database, players: list[PlayerPayload] | None = None) -> None:
+def upsert_players(db: Database, players: list[PlayerPayload] | None = None) -> UpsertResult:
     if players is None:
         players = get_data_source().load_players()
     team_map = _team_id_map(db)
+    keyed_rows = [
+        (
+            (player["player_id"],),
+            (
+                player["player_id"],
+                team_map[player["team_short_name"]],
+                player["name"],
+                player["position"],
+                player["jersey_num"],
+                player["nationality"],
+                player["photo_url"],
+            ),
+        )
+        for player in players
+    ]
+
+    if db.config.engine == "sqlite":
+        sql = """
+            INSERT INTO players(player_id, team_id, name, position, jersey_num, nationality, photo_url)
+            VALUES(?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(player_id) DO UPDATE SET
+              team_id=excluded.team_id,
+              name=excluded.name,
+              position=excluded.position,
+              jersey_num=excluded.jersey_num,
+              nationality=excluded.nationality,
+              photo_url=excluded.photo_url
+            """
+    else:
+        sql = """
+            INSERT INTO players(player_id, team_id, name, position, jersey_num, nationality, photo_url)
+            VALUES(%s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+              team_id=VALUES(team_id),
+              name=VALUES(name),
+              position=VALUES(position),
+              jersey_num=VALUES(jersey_num),
+              nationality=VALUES(nationality),
+              photo_url=VALUES(photo_url)
+            """
+    return _write_changed(db, dataset="players", sql=sql, keyed_rows=keyed_rows)
+
+
+def latest_match_season(db: Database) -> int:
+    """Most recent season in `matches`; the configured ingest season while the table is empty."""
+    row = db.fetchone("SELECT MAX(season) AS season FROM matches")
+    if row is None or row["season"] is None:
+        return load_ingest_config().season
+    return int(row["season"])
 
-    for player in players:
-        team_id = team_map[player["team_short_name"]]
-
-        if db.config.engine == "sqlite":
-            db.execute(
-                """
-                INSERT INTO players(player_id, team_id, name, position, jersey_num, nationality, photo_url)
-                VALUES(?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(player_id) DO UPDATE SET
-                  team_id=excluded.team_id,
-                  name=excluded.name,
-                  position=excluded.position,
-                  jersey_num=excluded.jersey_num,
-                  nationality=excluded.nationality,
-                  photo_url=excluded.photo_url
-                """,
-                (
-                    player["player_id"],
-                    team_id,
-                    player["name"],
-                    player["position"],
-                    player["jersey_num"],
-                    player["nationality"],
-                    player["photo_url"],
-                ),
-            )
-        else:
-            db.execute(
-                """
-                INSERT INTO players(player_id, team_id, name, position, jersey_num, nationality, photo_url)
-                VALUES(%s, %s, %s, %s, %s, %s, %s)
-                ON DUPLICATE KEY UPDATE
-                  team_id=VALUES(team_id),
-                  name=VALUES(name),
-                  position=VALUES(position),
-                  jersey_num=VALUES(jersey_num),
-                  nationality=VALUES(nationality),
-                  photo_url=VALUES(photo_url)
-                """,
-                (
-                    player["player_id"],
-                    team_id,
-                    player["name"],
-                    player["position"],
-                    player["jersey_num"],
-                    player["nationality"],
-                    player["photo_url"],
-                ),
-            )
 
+def _resolve_season(db: Database, season: int | None) -> int:
+    return season if season is not None else latest_match_season(db)
 
-def upsert_matches(db: Database, matches: list[MatchPayload] | None = None) -> None:
+
+def upsert_matches(db: Database, matches: list[MatchPayload] | None = None, season: int | None = None) -> UpsertResult:
+    """Upsert fixtures keyed by `(season, round, home_team_id, away_team_id)`.
+
+    Without an explicit `season` each fixture's season comes from its `match_date` (a season
+    starts in July, as in migration 009); the configured ingest season only covers unreadable dates.
+    """
     if matches is None:
         matches = get_data_source().load_matches()
+    fallback = load_ingest_config().season
     team_map = _team_id_map(db)
 
+    keyed_rows: list[tuple[tuple, tuple]] = []
     for match in matches:
         home_team_id = team_map[match["home_team_short_name"]]
         away_team_id = team_map[match["away_team_short_name"]]
-
-        if db.config.engine == "sqlite":
-            db.execute(
-                """
-                INSERT INTO matches(round, match_date, home_team_id, away_team_id, home_score, away_score, status)
-                VALUES(?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(round, home_team_id, away_team_id) DO UPDATE SET
-                  match_date=excluded.match_date,
-                  home_score=excluded.home_score,
-                  away_score=excluded.away_score,
-                  status=excluded.status
-                """,
-                (
-                    match["round"],
-                    match["match_date"],
-                    home_team_id,
-                    away_team_id,
-                    match["home_score"],
-                    match["away_score"],
-                    match["status"],
-                ),
-            )
-        else:
-            db.execute(
-                """
-                INSERT INTO matches(round, match_date, home_team_id, away_team_id, home_score, away_score, status)
-                VALUES(%s, %s, %s, %s, %s, %s, %s)
-                ON DUPLICATE KEY UPDATE
-                  match_date=VALUES(match_date),
-                  home_score=VALUES(home_score),
-                  away_score=VALUES(away_score),
-                  status=VALUES(status)
-                """,
+        match_season = season if season is not None else season_of(match["match_date"])
+        if match_season is None:
+            match_season = fallback
+        keyed_rows.append(
+            (
+                (match_season, int(match["round"]), home_team_id, away_team_id),
                 (
+                    match_season,
                     match["round"],
                     match["match_date"],
                     home_team_id,
@@ -161,38 +216,57 @@ def upsert_matches(db: Database, matches: list[MatchPayload] | None = None) -> N
                     match["status"],
                 ),
             )
+        )
 
+    if db.config.engine == "sqlite":
+        sql = """
+            INSERT INTO matches(season, round, match_date, home_team_id, away_team_id, home_score, away_score, status)
+            VALUES(?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(season, round, home_team_id, away_team_id) DO UPDATE SET
+              match_date=excluded.match_date,
+              home_score=excluded.home_score,
+              away_score=excluded.away_score,
+              status=excluded.status
+            """
+    else:
+        sql = """
+            INSERT INTO matches(season, round, match_date, home_team_id, away_team_id, home_score, away_score, status)
+            VALUES(%s, %s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+              match_date=VALUES(match_date),
+              home_score=VALUES(home_score),
+              away_score=VALUES(away_score),
+              status=VALUES(status)
+            """
+    return _write_changed(db, dataset="matches", sql=sql, keyed_rows=keyed_rows)
 
-def _match_id_map(db: Database) -> dict[tuple[int, int, int], int]:
-    rows = db.fetchall("SELECT match_id, round, home_team_id, away_team_id FROM matches")
-    return {(int(r["round"]), int(r["home_team_id"]), int(r["away_team_id"])): int(r["match_id"]) for r in rows}
 
+def _match_id_map(db: Database, season: int) -> dict[tuple[int, int, int], int]:
+    """`(round, home_team_id, away_team_id) -> match_id` for one season."""
+    marker = "?" if db.config.engine == "sqlite" else "%s"
+    rows = db.itertuples(
+        f"SELECT match_id, round, home_team_id, away_team_id FROM matches WHERE season = {marker}", (season,)
+    )
+    return {(int(round_no), int(home), int(away)): int(match_id) for match_id, round_no, home, away in rows}
 
-def upsert_match_stats(db: Database, match_stats: list[MatchStatPayload] | None = None) -> None:
+
+def upsert_match_stats(
+    db: Database, match_stats: list[MatchStatPayload] | None = None, season: int | None = None
+) -> UpsertResult:
     if match_stats is None:
         match_stats = get_data_source().load_match_stats()
     team_map = _team_id_map(db)
-    match_map = _match_id_map(db)
+    match_map = _match_id_map(db, _resolve_season(db, season))
 
+    keyed_rows: list[tuple[tuple, tuple]] = []
     for stat in match_stats:
         home_team_id = team_map[stat["home_team_short_name"]]
         away_team_id = team_map[stat["away_team_short_name"]]
-        key = (int(stat["round"]), home_team_id, away_team_id)
-        match_id = match_map[key]
+        match_id = match_map[(int(stat["round"]), home_team_id, away_team_id)]
         team_id = team_map[stat["team_short_name"]]
-
-        if db.config.engine == "sqlite":
-            db.execute(
-                """
-                INSERT INTO match_stats(match_id, team_id, possession, shots, shots_on_target, fouls, corners)
-                VALUES(?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(match_id, team_id) DO UPDATE SET
-                  possession=excluded.possession,
-                  shots=excluded.shots,
-                  shots_on_target=excluded.shots_on_target,
-                  fouls=excluded.fouls,
-                  corners=excluded.corners
-                """,
+        keyed_rows.append(
+            (
+                (match_id, team_id),
                 (
                     match_id,
                     team_id,
@@ -203,41 +277,252 @@ def upsert_match_stats(db: Database, match_stats: list[MatchStatPayload] | None
                     stat["corners"],
                 ),
             )
-        else:
-            db.execute(
-                """
-                INSERT INTO match_stats(match_id, team_id, possession, shots, shots_on_target, fouls, corners)
-                VALUES(%s, %s, %s, %s, %s, %s, %s)
-                ON DUPLICATE KEY UPDATE
-                  possession=VALUES(possession),
-                  shots=VALUES(shots),
-                  shots_on_target=VALUES(shots_on_target),
-                  fouls=VALUES(fouls),
-                  corners=VALUES(corners)
-                """,
-                (
-                    match_id,
-                    team_id,
-                    stat["possession"],
-                    stat["shots"],
-                    stat["shots_on_target"],
-                    stat["fouls"],
-                    stat["corners"],
-                ),
+        )
+
+    if db.config.engine == "sqlite":
+        sql = """
+            INSERT INTO match_stats(match_id, team_id, possession, shots, shots_on_target, fouls, corners)
+            VALUES(?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(match_id, team_id) DO UPDATE SET
+              possession=excluded.possession,
+              shots=excluded.shots,
+              shots_on_target=excluded.shots_on_target,
+              fouls=excluded.fouls,
+              corners=excluded.corners
+            """
+    else:
+        sql = """
+            INSERT INTO match_stats(match_id, team_id, possession, shots, shots_on_target, fouls, corners)
+            VALUES(%s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+              possession=VALUES(possession),
+              shots=VALUES(shots),
+              shots_on_target=VALUES(shots_on_target),
+              fouls=VALUES(fouls),
+              corners=VALUES(corners)
+            """
+    return _write_changed(db, dataset="match_stats", sql=sql, keyed_rows=keyed_rows)
+
+
+def upsert_match_lineups(
+    db: Database, lineups: list[LineupPayload] | None = None, season: int | None = None
+) -> UpsertResult:
+    """Upsert `match_lineups` rows keyed by `(match_id, player_id)`; players not in `players` are skipped."""
+    if lineups is None:
+        lineups = get_data_source().load_match_lineups()
+    team_map = _team_id_map(db)
+    match_map = _match_id_map(db, _resolve_season(db, season))
+    known_players = {int(player_id) for (player_id,) in db.itertuples("SELECT player_id FROM players")}
+
+    keyed_rows: list[tuple[tuple, tuple]] = []
+    unknown = 0
+    for lineup in lineups:
+        player_id = int(lineup["player_id"])
+        if player_id not in known_players:
+            unknown += 1
+            continue
+        home_team_id = team_map[lineup["home_team_short_name"]]
+        away_team_id = team_map[lineup["away_team_short_name"]]
+        match_id = match_map[(int(lineup["round"]), home_team_id, away_team_id)]
+        team_id = team_map[lineup["team_short_name"]]
+        keyed_rows.append(((match_id, player_id), (match_id, team_id, player_id)))
+
+    if db.config.engine == "sqlite":
+        sql = """
+            INSERT INTO match_lineups(match_id, team_id, player_id)
+            VALUES(?, ?, ?)
+            ON CONFLICT(match_id, player_id) DO UPDATE SET
+              team_id=excluded.team_id
+            """
+    else:
+        sql = """
+            INSERT INTO match_lineups(match_id, team_id, player_id)
+            VALUES(%s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+              team_id=VALUES(team_id)
+            """
+    result = _write_changed(db, dataset="match_lineups", sql=sql, keyed_rows=keyed_rows)
+    result.skipped += unknown
+    return result
+
+
+def _event_keys(
+    source_event_id: str | None, minute: int, event_type: str, player_name: str | None
+) -> tuple[tuple[tuple, ...], tuple[tuple, ...]]:
+    """Dedupe keys within one match as `(probe, record)`.
+
+    The natural key is `(minute, event_type, player_name)`. An event with a source id is a
+    duplicate of a row with that id or of an id-less row on its natural key; an id-less event is
+    a duplicate of any row on its natural key. Two events with different ids never collide.
+    """
+    natural = (int(minute), str(event_type), player_name or "")
+    if source_event_id:
+        source_id = ("id", str(source_event_id))
+        return (source_id, ("bare", *natural)), (source_id, ("row", *natural))
+    return (("row", *natural),), (("row", *natural), ("bare", *natural))
+
+
+def _stored_event_keys(db: Database, match_id: int) -> set[tuple]:
+    marker = "?" if db.config.engine == "sqlite" else "%s"
+    rows = db.itertuples(
+        f"SELECT source_event_id, minute, event_type, player_name FROM match_events WHERE match_id = {marker}",
+        (match_id,),
+    )
+    keys: set[tuple] = set()
+    for source_event_id, minute, event_type, player_name in rows:
+        keys.update(_event_keys(source_event_id, minute, event_type, player_name)[1])
+    return keys
+
+
+def upsert_match_events(
+    db: Database, events: Iterable[EventPayload] | None = None, season: int | None = None
+) -> UpsertResult:
+    """Stream events into `match_events`, inserting only those not already stored for their match.
+
+    The feed is consumed lazily and flushed every `DB_BATCH_SIZE` rows, so memory holds one
+    batch plus a small key set per match seen rather than the whole feed. Each match's key
+    set is seeded from the rows already stored for it. `changed_keys` holds `(match_id,)`.
+    """
+    if events is None:
+        events = get_data_source().load_match_events()
+    team_map = _team_id_map(db)
+    match_map = _match_id_map(db, _resolve_season(db, season))
+    known_players = {int(player_id) for (player_id,) in db.itertuples("SELECT player_id FROM players")}
+
+    if db.config.engine == "sqlite":
+        sql = """
+            INSERT INTO match_events(match_id, minute, event_type, team_id, player_id, player_name, detail, source_event_id)
+            VALUES(?, ?, ?, ?, ?, ?, ?, ?)
+            """
+    else:
+        sql = """
+            INSERT INTO match_events(match_id, minute, event_type, team_id, player_id, player_name, detail, source_event_id)
+            VALUES(%s, %s, %s, %s, %s, %s, %s, %s)
+            """
+
+    result = UpsertResult()
+    seen: dict[int, set[tuple]] = {}
+    batch: list[tuple] = []
+    for event in events:
+        home_team_id = team_map[event["home_team_short_name"]]
+        away_team_id = team_map[event["away_team_short_name"]]
+        match_id = match_map[(int(event["round"]), home_team_id, away_team_id)]
+        keys = seen.get(match_id)
+        if keys is None:
+            keys = seen[match_id] = _stored_event_keys(db, match_id)
+        probe, record = _event_keys(
+            event.get("source_event_id"), event["minute"], event["event_type"], event.get("player_name")
+        )
+        if not keys.isdisjoint(probe):
+            result.skipped += 1
+            continue
+        keys.update(record)
+
+        team_short_name = event.get("team_short_name")
+        player_id = event.get("player_id")
+        batch.append(
+            (
+                match_id,
+                int(event["minute"]),
+                event["event_type"],
+                team_map.get(team_short_name) if team_short_name else None,
+                player_id if player_id in known_players else None,
+                event.get("player_name"),
+                event.get("detail"),
+                event.get("source_event_id"),
             )
+        )
+        result.changed_keys.add((match_id,))
+        if len(batch) >= db.config.batch_size:
+            db.executemany(sql, batch)
+            result.written += len(batch)
+            batch = []
+
+    db.executemany(sql, batch)
+    result.written += len(batch)
+    return result
+
+
+def _feed_season(matches: list[MatchPayload]) -> int | None:
+    seasons = [season_of(match["match_date"]) for match in matches]
+    return max((season for season in seasons if season is not None), default=None)
 
 
-def ingest_all(db: Database) -> None:
+def ingest_all(db: Database, season: int | None = None) -> dict[str, UpsertResult]:
+    """Load every dataset from the configured source and upsert it.
+
+    Without `season`, fixtures take theirs from `match_date` and per-match rows attach to the
+    latest season in the fixture feed (or in `matches`, if no fixture date parses).
+    """
     source = get_data_source()
-    upsert_teams(db, source.load_teams())
-    upsert_players(db, source.load_players())
-    upsert_matches(db, source.load_matches())
-    upsert_match_stats(db, source.load_match_stats())
+    source.prefetch()
+    results = {
+        "teams": timed_upsert("teams", upsert_teams, db, source.load_teams()),
+        "players": timed_upsert("players", upsert_players, db, source.load_players()),
+    }
+    matches = source.load_matches()
+    results["matches"] = timed_upsert("matches", upsert_matches, db, matches, season=season)
+    if season is None:
+        season = _feed_season(matches)
+    results["match_stats"] = timed_upsert(
+        "match_stats", upsert_match_stats, db, source.load_match_stats(), season=season
+    )
+    results["match_events"] = timed_upsert(
+        "match_events", upsert_match_events, db, source.load_match_events(), season=season
+    )
+    results["match_lineups"] = timed_upsert(
+        "match_lineups", upsert_match_lineups, db, source.load_match_lineups(), season=season
+    )
+    return results
+
+
+def timed_upsert(
+    dataset: str, upsert: Callable[..., UpsertResult], db: Database, rows: object, **kwargs: object
+) -> UpsertResult:
+    """Run one `upsert_*` call inside a `write` timing span."""
+    with span("write", dataset=dataset) as writing:
+        result = upsert(db, rows, **kwargs)
+        writing.rows_written = result.written
+    return result
+
+
+def bump_data_version(db: Database, results: dict[str, UpsertResult]) -> bool:
+    """Advance the `data_version` stamp the API response cache keys on, if anything was written."""
+    if not any(result.written for result in results.values()):
+        return False
+    if db.config.engine == "sqlite":
+        sql = """
+            INSERT INTO data_version(id, version)
+            VALUES(1, 1)
+            ON CONFLICT(id) DO UPDATE SET
+              version=version + 1
+            """
+    else:
+        sql = """
+            INSERT INTO data_version(id, version)
+            VALUES(1, 1)
+            ON DUPLICATE KEY UPDATE
+              version=version + 1
+            """
+    db.execute(sql)
+    return True
 
 
-def summary(db: Database) -> dict[str, int]:
+def summary(db: Database, results: dict[str, UpsertResult] | None = None) -> dict[str, int]:
     counts: dict[str, int] = {}
-    for table in ("teams", "players", "matches", "match_stats"):
+    for table in (
+        "teams",
+        "players",
+        "matches",
+        "match_stats",
+        "match_events",
+        "match_lineups",
+        "standings",
+        "player_season_stats",
+    ):
         row = db.fetchone(f"SELECT COUNT(*) AS cnt FROM {table}")
         counts[table] = int(row["cnt"]) if row else 0
+    for dataset, result in (results or {}).items():
+        counts[f"{dataset}_written"] = result.written
+        counts[f"{dataset}_skipped"] = result.skipped
     return counts
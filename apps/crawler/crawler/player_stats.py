@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from crawler.db import Database
+from crawler.ingest import UpsertResult, latest_match_season
+
+GOAL_EVENT_TYPES = ("GOAL", "PENALTY_GOAL")
+ASSIST_EVENT_TYPE = "ASSIST"
+
+# Datasets whose upsert keys start with `match_id`.
+_MATCH_KEYED_DATASETS = ("match_events", "match_lineups")
+
+_STAT_COLUMNS = ("goals", "assists", "attack_points", "clean_sheets")
+
+
+def players_touched_by(results: dict[str, UpsertResult], db: Database) -> set[int]:
+    """Player ids who appeared in (lineup) or were credited in (events) a match changed by one ingest run."""
+    match_ids: set[int] = set()
+    for dataset in _MATCH_KEYED_DATASETS:
+        result = results.get(dataset)
+        if result is not None:
+            match_ids.update(int(key[0]) for key in result.changed_keys)
+    match_result = results.get("matches")
+    if match_result is not None and match_result.changed_keys:
+        match_ids |= _match_ids_for(db, match_result.changed_keys)
+    if not match_ids:
+        return set()
+
+    placeholders = _placeholders(db, len(match_ids))
+    ordered = sorted(match_ids)
+    rows = db.itertuples(
+        f"""
+        SELECT player_id FROM match_lineups WHERE match_id IN ({placeholders})
+        UNION
+        SELECT player_id FROM match_events WHERE player_id IS NOT NULL AND match_id IN ({placeholders})
+        """,
+        (*ordered, *ordered),
+    )
+    return {int(player_id) for (player_id,) in rows}
+
+
+def refresh_player_season_stats(
+    db: Database, player_ids: Iterable[int] | None = None, season: int | None = None
+) -> UpsertResult:
+    """Recompute one season of `player_season_stats` for `player_ids` from match events and lineups.
+
+    Goals and assists count `match_events` rows credited to the player; clean sheets count
+    FINISHED matches the player was in the lineup for while the opponent scored zero. Only
+    matches of `season` (default: the latest season in `matches`) are counted.
+    `player_ids=None`, or an empty season, recomputes every player. Only rows whose totals
+    actually changed are written.
+    """
+    season = season if season is not None else latest_match_season(db)
+    marker = "?" if db.config.engine == "sqlite" else "%s"
+    known = {int(player_id) for (player_id,) in db.itertuples("SELECT player_id FROM players")}
+    current = {
+        int(row["player_id"]): row
+        for row in db.fetchall(
+            f"SELECT player_id, {', '.join(_STAT_COLUMNS)} FROM player_season_stats WHERE season = {marker}",
+            (season,),
+        )
+    }
+    affected = None if player_ids is None or not current else {int(player_id) for player_id in player_ids} & known
+
+    result = UpsertResult()
+    if affected is not None and not affected:
+        return result
+
+    totals = _aggregate(db, affected, season)
+    candidates = set(totals) | (set(current) if affected is None else affected & set(current))
+    changed_rows: list[tuple] = []
+    for player_id in sorted(candidates & known):
+        stats = totals.get(player_id) or {column: 0 for column in _STAT_COLUMNS}
+        previous = current.get(player_id)
+        if previous is not None and all(int(previous[column]) == stats[column] for column in _STAT_COLUMNS):
+            result.skipped += 1
+            continue
+        changed_rows.append((season, player_id, *(stats[column] for column in _STAT_COLUMNS)))
+        result.changed_keys.add((player_id,))
+    db.executemany(_upsert_stats_sql(db), changed_rows)
+    result.written = len(changed_rows)
+    return result
+
+
+def _aggregate(db: Database, player_ids: set[int] | None, season: int) -> dict[int, dict[str, int]]:
+    params: tuple = ()
+    event_filter = lineup_filter = ""
+    if player_ids is not None:
+        placeholders = _placeholders(db, len(player_ids))
+        event_filter = f"AND e.player_id IN ({placeholders})"
+        lineup_filter = f"AND l.player_id IN ({placeholders})"
+        params = tuple(sorted(player_ids))
+
+    marker = "?" if db.config.engine == "sqlite" else "%s"
+    goal_markers = ", ".join(marker for _ in GOAL_EVENT_TYPES)
+    totals: dict[int, dict[str, int]] = {}
+    event_rows = db.fetchall(
+        f"""
+        SELECT e.player_id,
+               SUM(CASE WHEN e.event_type IN ({goal_markers}) THEN 1 ELSE 0 END) AS goals,
+               SUM(CASE WHEN e.event_type = {marker} THEN 1 ELSE 0 END) AS assists
+        FROM match_events e
+        JOIN matches m ON m.match_id = e.match_id
+        WHERE m.season = {marker} AND e.player_id IS NOT NULL {event_filter}
+        GROUP BY e.player_id
+        """,
+        (*GOAL_EVENT_TYPES, ASSIST_EVENT_TYPE, season, *params),
+    )
+    for row in event_rows:
+        goals, assists = int(row["goals"] or 0), int(row["assists"] or 0)
+        totals[int(row["player_id"])] = {
+            "goals": goals,
+            "assists": assists,
+            "attack_points": goals + assists,
+            "clean_sheets": 0,
+        }
+
+    clean_sheet_rows = db.fetchall(
+        f"""
+        SELECT l.player_id, COUNT(*) AS clean_sheets
+        FROM match_lineups l
+        JOIN matches m ON m.match_id = l.match_id
+        WHERE m.season = {marker} AND m.status = 'FINISHED'
+          AND ((l.team_id = m.home_team_id AND m.away_score = 0)
+            OR (l.team_id = m.away_team_id AND m.home_score = 0))
+          {lineup_filter}
+        GROUP BY l.player_id
+        """,
+        (season, *params),
+    )
+    for row in clean_sheet_rows:
+        stats = totals.setdefault(int(row["player_id"]), {column: 0 for column in _STAT_COLUMNS})
+        stats["clean_sheets"] = int(row["clean_sheets"])
+    return totals
+
+
+def _match_ids_for(db: Database, match_keys: Iterable[tuple]) -> set[int]:
+    """Match ids for `(season, round, home_team_id, away_team_id)` keys, reading only the rounds involved."""
+    wanted: dict[int, set[tuple[int, int, int]]] = {}
+    for season, round_no, home, away in match_keys:
+        wanted.setdefault(int(season), set()).add((int(round_no), int(home), int(away)))
+
+    marker = "?" if db.config.engine == "sqlite" else "%s"
+    match_ids: set[int] = set()
+    for season, fixtures in sorted(wanted.items()):
+        rounds = sorted({round_no for round_no, _home, _away in fixtures})
+        rows = db.itertuples(
+            f"""
+            SELECT match_id, round, home_team_id, away_team_id FROM matches
+            WHERE season = {marker} AND round IN ({_placeholders(db, len(rounds))})
+            """,
+            (season, *rounds),
+        )
+        match_ids.update(
+            int(match_id) for match_id, round_no, home, away in rows if (int(round_no), int(home), int(away)) in fixtures
+        )
+    return match_ids
+
+
+def _placeholders(db: Database, count: int) -> str:
+    marker = "?" if db.config.engine == "sqlite" else "%s"
+    return ", ".join(marker for _ in range(count))
+
+
+def _upsert_stats_sql(db: Database) -> str:
+    if db.config.engine == "sqlite":
+        return """
+            INSERT INTO player_season_stats(season, player_id, goals, assists, attack_points, clean_sheets)
+            VALUES(?, ?, ?, ?, ?, ?)
+            ON CONFLICT(season, player_id) DO UPDATE SET
+              goals=excluded.goals,
+              assists=excluded.assists,
+              attack_points=excluded.attack_points,
+              clean_sheets=excluded.clean_sheets
+            """
+    return """
+        INSERT INTO player_season_stats(season, player_id, goals, assists, attack_points, clean_sheets)
+        VALUES(%s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+          goals=VALUES(goals),
+          assists=VALUES(assists),
+          attack_points=VALUES(attack_points),
+          clean_sheets=VALUES(clean_sheets)
+        """
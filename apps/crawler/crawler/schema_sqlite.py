@@ -21,6 +21,7 @@ CREATE TABLE IF NOT EXISTS players (
 
 CREATE TABLE IF NOT EXISTS matches (
     match_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    season INTEGER NOT NULL,
     round INTEGER NOT NULL,
     match_date TEXT NOT NULL,
     home_team_id INTEGER NOT NULL,
@@ -30,9 +31,13 @@ CREATE TABLE IF NOT EXISTS matches (
     status TEXT NOT NULL,
     FOREIGN KEY (home_team_id) REFERENCES teams(team_id),
     FOREIGN KEY (away_team_id) REFERENCES teams(team_id),
-    UNIQUE(round, home_team_id, away_team_id)
+    UNIQUE(season, round, home_team_id, away_team_id)
 );
 
+CREATE INDEX IF NOT EXISTS idx_matches_season_date ON matches(season, match_date);
+CREATE INDEX IF NOT EXISTS idx_matches_season_home_team_date ON matches(season, home_team_id, match_date);
+CREATE INDEX IF NOT EXISTS idx_matches_season_away_team_date ON matches(season, away_team_id, match_date);
+
 CREATE TABLE IF NOT EXISTS match_stats (
     stat_id INTEGER PRIMARY KEY AUTOINCREMENT,
     match_id INTEGER NOT NULL,
@@ -46,4 +51,84 @@ CREATE TABLE IF NOT EXISTS match_stats (
     FOREIGN KEY (team_id) REFERENCES teams(team_id),
     UNIQUE(match_id, team_id)
 );
+
+CREATE TABLE IF NOT EXISTS match_events (
+    event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    match_id INTEGER NOT NULL,
+    minute INTEGER NOT NULL,
+    event_type TEXT NOT NULL,
+    team_id INTEGER,
+    player_id INTEGER,
+    player_name TEXT,
+    detail TEXT,
+    source_event_id TEXT,
+    FOREIGN KEY (match_id) REFERENCES matches(match_id),
+    FOREIGN KEY (team_id) REFERENCES teams(team_id),
+    FOREIGN KEY (player_id) REFERENCES players(player_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_match_events_match_id ON match_events(match_id);
+CREATE INDEX IF NOT EXISTS idx_match_events_player_id ON match_events(player_id);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_match_events_source ON match_events(match_id, source_event_id);
+
+CREATE TABLE IF NOT EXISTS match_lineups (
+    match_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    PRIMARY KEY (match_id, player_id),
+    FOREIGN KEY (match_id) REFERENCES matches(match_id),
+    FOREIGN KEY (team_id) REFERENCES teams(team_id),
+    FOREIGN KEY (player_id) REFERENCES players(player_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_match_lineups_player_id ON match_lineups(player_id);
+
+CREATE TABLE IF NOT EXISTS player_season_stats (
+    season INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    goals INTEGER NOT NULL DEFAULT 0,
+    assists INTEGER NOT NULL DEFAULT 0,
+    attack_points INTEGER NOT NULL DEFAULT 0,
+    clean_sheets INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (season, player_id),
+    FOREIGN KEY (player_id) REFERENCES players(player_id)
+);
+
+CREATE TABLE IF NOT EXISTS standings (
+    season INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    played INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    drawn INTEGER NOT NULL,
+    lost INTEGER NOT NULL,
+    goals_for INTEGER NOT NULL,
+    goals_against INTEGER NOT NULL,
+    goal_diff INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+    PRIMARY KEY (season, team_id),
+    FOREIGN KEY (team_id) REFERENCES teams(team_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_standings_season_rank ON standings(season, rank);
+
+CREATE TABLE IF NOT EXISTS data_version (
+    id INTEGER PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS ingest_fingerprints (
+    dataset TEXT NOT NULL,
+    row_key TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    PRIMARY KEY (dataset, row_key)
+);
+
+CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+    season INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    matches INTEGER NOT NULL,
+    completed_at TEXT NOT NULL,
+    PRIMARY KEY (season, round)
+);
 """
@@ -4,6 +4,7 @@ from crawler.config import load_source_config
 from crawler.logging_utils import log_event
 from crawler.sources.base import DataSource
 from crawler.sources.premier_league import PremierLeagueDataSource
+from crawler.sources.replay import ReplayDataSource
 from crawler.sources.sample_data import SampleDataSource
 
 
@@ -15,4 +16,7 @@ def get_data_source() -> DataSource:
     if config.source in {"pl", "premierleague", "premier_league"}:
         log_event("INFO", "source.selected", source="premierleague")
         return PremierLeagueDataSource(config)
+    if config.source == "replay":
+        log_event("INFO", "source.selected", source="replay", archive_dir=config.archive_dir)
+        return ReplayDataSource(config)
     raise ValueError(f"unsupported CRAWLER_DATA_SOURCE: {config.source}")
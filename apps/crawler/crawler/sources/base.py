@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Protocol
 
-from crawler.sources.types import MatchPayload, MatchStatPayload, PlayerPayload, TeamPayload
+from crawler.sources.types import (
+    EventPayload,
+    LineupPayload,
+    MatchPayload,
+    MatchStatPayload,
+    PlayerPayload,
+    TeamPayload,
+)
 
 
 class DataSource(Protocol):
+    def prefetch(self, datasets: Iterable[str] | None = None) -> None:
+        ...
+
     def load_teams(self) -> list[TeamPayload]:
         ...
 
@@ -17,3 +28,9 @@ class DataSource(Protocol):
 
     def load_match_stats(self) -> list[MatchStatPayload]:
         ...
+
+    def load_match_events(self) -> Iterable[EventPayload]:
+        ...
+
+    def load_match_lineups(self) -> list[LineupPayload]:
+        ...
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+
+def body_digest(body: str) -> str:
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    etag: str | None
+    last_modified: str | None
+    body_sha256: str
+    body: str
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpResponseCache:
+    """On-disk response cache keyed by URL.
+
+    Each URL keeps a `<key>.json` metadata file (validators + body hash) next to a `<key>.body`
+    file, and optionally one `<key>.<dataset>.parsed.json` holding the payload parsed from that
+    exact body so an unchanged page can skip parsing entirely.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def get(self, url: str) -> CachedResponse | None:
+        key = self._key(url)
+        meta_path = self.root / f"{key}.json"
+        body_path = self.root / f"{key}.body"
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except ValueError:
+            return None
+        return CachedResponse(
+            url=url,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            body_sha256=str(meta.get("body_sha256", "")),
+            body=body_path.read_text(encoding="utf-8"),
+        )
+
+    def put(self, url: str, *, etag: str | None, last_modified: str | None, body: str) -> CachedResponse:
+        key = self._key(url)
+        entry = CachedResponse(
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            body_sha256=body_digest(body),
+            body=body,
+        )
+        (self.root / f"{key}.body").write_text(body, encoding="utf-8")
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body_sha256": entry.body_sha256,
+        }
+        (self.root / f"{key}.json").write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        return entry
+
+    def load_parsed(self, url: str, dataset: str, body_sha256: str) -> dict[str, object] | None:
+        path = self.root / f"{self._key(url)}.{dataset}.parsed.json"
+        if not path.exists():
+            return None
+        try:
+            stored = json.loads(path.read_text(encoding="utf-8"))
+        except ValueError:
+            return None
+        if stored.get("body_sha256") != body_sha256:
+            return None
+        return stored.get("parsed")
+
+    def store_parsed(self, url: str, dataset: str, body_sha256: str, parsed: dict[str, object]) -> None:
+        path = self.root / f"{self._key(url)}.{dataset}.parsed.json"
+        payload = {"body_sha256": body_sha256, "parsed": parsed}
+        path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
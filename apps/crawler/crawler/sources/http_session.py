@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import gzip
+import http.client
+import socket
+import ssl
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from urllib.error import URLError
+from urllib.parse import urljoin, urlsplit
+
+try:  # optional dependency: brotli decoding is only advertised when available
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on environment
+    brotli = None
+
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+_MAX_REDIRECTS = 5
+_CONDITIONAL_HEADERS = {"if-none-match", "if-modified-since"}
+
+PoolKey = tuple[str, str, int]
+
+
+@dataclass
+class HttpResponse:
+    url: str
+    status: int
+    reason: str
+    headers: dict[str, str]
+    body: bytes
+    reused_connection: bool
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+class HttpSession:
+    """Small keep-alive HTTP/1.1 client with one idle connection pool per host.
+
+    Connections are returned to the pool once a response body has been fully read, the SSL
+    context is built once per session, and every request records DNS/connect/TLS/TTFB/body
+    timings in milliseconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout_seconds: float,
+        verify_ssl: bool,
+        ca_file: str | None,
+        user_agent: str,
+        max_idle_per_host: int = 4,
+    ) -> None:
+        self.timeout_seconds = timeout_seconds
+        self.verify_ssl = verify_ssl
+        self.ca_file = ca_file
+        self.user_agent = user_agent
+        self.max_idle_per_host = max_idle_per_host
+        self._ssl_context: ssl.SSLContext | None = None
+        self._idle: dict[PoolKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def accept_encoding(self) -> str:
+        return "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+    def ssl_context(self) -> ssl.SSLContext:
+        with self._lock:
+            if self._ssl_context is None:
+                if self.verify_ssl:
+                    self._ssl_context = ssl.create_default_context(cafile=self.ca_file)
+                else:
+                    self._ssl_context = ssl._create_unverified_context()
+            return self._ssl_context
+
+    def get(self, url: str, headers: dict[str, str] | None = None) -> HttpResponse:
+        current_url = url
+        for _ in range(_MAX_REDIRECTS + 1):
+            # Validators belong to the cached copy of `url`; a different target must not see them.
+            request_headers = headers or {}
+            if current_url != url:
+                request_headers = {
+                    name: value for name, value in request_headers.items() if name.lower() not in _CONDITIONAL_HEADERS
+                }
+            response = self._get_once(current_url, request_headers)
+            location = response.headers.get("location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                return response
+            current_url = urljoin(current_url, location)
+        raise URLError(f"too many redirects: {url}")
+
+    def close(self) -> None:
+        with self._lock:
+            idle = [conn for conns in self._idle.values() for conn in conns]
+            self._idle.clear()
+        for conn in idle:
+            conn.close()
+
+    def _get_once(self, url: str, extra_headers: dict[str, str]) -> HttpResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in {"http", "https"}:
+            raise ValueError(f"unsupported scheme for HttpSession: {scheme}")
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        key: PoolKey = (scheme, host, port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        request_headers = {
+            "User-Agent": self.user_agent,
+            "Accept-Encoding": self.accept_encoding,
+            "Connection": "keep-alive",
+        }
+        request_headers.update(extra_headers)
+
+        conn, reused = self._acquire(key)
+        try:
+            return self._send(conn, key, url, path, request_headers, reused)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if not reused:
+                raise
+            # The server dropped an idle keep-alive connection; retry once on a fresh one.
+            fresh, _ = self._acquire(key, fresh=True)
+            return self._send(fresh, key, url, path, request_headers, False)
+
+    def _send(
+        self,
+        conn: http.client.HTTPConnection,
+        key: PoolKey,
+        url: str,
+        path: str,
+        headers: dict[str, str],
+        reused: bool,
+    ) -> HttpResponse:
+        timings: dict[str, float] = getattr(conn, "_epl_timings", {}) if not reused else {}
+        started = time.perf_counter()
+        try:
+            conn.request("GET", path, headers=headers)
+            raw = conn.getresponse()
+            ttfb_at = time.perf_counter()
+            payload = raw.read()
+            done_at = time.perf_counter()
+        except Exception:
+            conn.close()
+            raise
+
+        response_headers = {name.lower(): value for name, value in raw.getheaders()}
+        if raw.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+
+        timings = {
+            "dns_ms": round(timings.get("dns_ms", 0.0), 3),
+            "connect_ms": round(timings.get("connect_ms", 0.0), 3),
+            "tls_ms": round(timings.get("tls_ms", 0.0), 3),
+            "ttfb_ms": round((ttfb_at - started) * 1000, 3),
+            "body_ms": round((done_at - ttfb_at) * 1000, 3),
+        }
+        timings["total_ms"] = round(sum(timings.values()), 3)
+        return HttpResponse(
+            url=url,
+            status=raw.status,
+            reason=raw.reason,
+            headers=response_headers,
+            body=_decode_content(payload, response_headers.get("content-encoding", "")),
+            reused_connection=reused,
+            timings=timings,
+        )
+
+    def _acquire(self, key: PoolKey, *, fresh: bool = False) -> tuple[http.client.HTTPConnection, bool]:
+        if not fresh:
+            with self._lock:
+                idle = self._idle.get(key)
+                if idle:
+                    return idle.pop(), True
+        return self._connect(key), False
+
+    def _release(self, key: PoolKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _connect(self, key: PoolKey) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        timings: dict[str, float] = {}
+        conn: http.client.HTTPConnection
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=self.timeout_seconds, context=self.ssl_context())
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=self.timeout_seconds)
+        conn._create_connection = _timed_create_connection(timings)  # type: ignore[attr-defined]
+
+        started = time.perf_counter()
+        conn.connect()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if scheme == "https":
+            timings["tls_ms"] = max(elapsed_ms - timings.get("dns_ms", 0.0) - timings.get("connect_ms", 0.0), 0.0)
+        conn._epl_timings = timings  # type: ignore[attr-defined]
+        return conn
+
+
+def _timed_create_connection(timings: dict[str, float]):
+    def create(address: tuple[str, int], timeout: float | None = None, source_address=None) -> socket.socket:
+        host, port = address
+        started = time.perf_counter()
+        infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        resolved_at = time.perf_counter()
+        timings["dns_ms"] = (resolved_at - started) * 1000
+
+        last_error: OSError | None = None
+        for family, socktype, proto, _, sockaddr in infos:
+            sock = socket.socket(family, socktype, proto)
+            try:
+                if timeout is not None:
+                    sock.settimeout(timeout)
+                if source_address:
+                    sock.bind(source_address)
+                sock.connect(sockaddr)
+                timings["connect_ms"] = (time.perf_counter() - resolved_at) * 1000
+                return sock
+            except OSError as exc:
+                last_error = exc
+                sock.close()
+        raise last_error or OSError(f"getaddrinfo returned no addresses for {host}")
+
+    return create
+
+
+def _decode_content(payload: bytes, content_encoding: str) -> bytes:
+    encodings = [item.strip().lower() for item in content_encoding.split(",") if item.strip()]
+    for encoding in reversed(encodings):
+        if encoding in {"gzip", "x-gzip"}:
+            payload = gzip.decompress(payload)
+        elif encoding == "deflate":
+            try:
+                payload = zlib.decompress(payload)
+            except zlib.error:
+                payload = zlib.decompress(payload, -zlib.MAX_WBITS)
+        elif encoding == "br" and brotli is not None:
+            payload = brotli.decompress(payload)
+        elif encoding != "identity":
+            raise ValueError(f"unsupported content-encoding: {encoding}")
+    return payload
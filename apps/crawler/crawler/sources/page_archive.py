@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import threading
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from crawler.sources.http_cache import body_digest
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    url: str
+    sha256: str
+    fetched_at: str
+    bytes: int
+
+
+class PageArchive:
+    """Append-only archive of every fetched page body.
+
+    Bodies are gzip-compressed and content-addressed as `objects/<sha[:2]>/<sha>.gz`, so a page
+    that did not change between crawls is stored once. `manifest.jsonl` records one line per
+    fetch (URL, body hash, UTC timestamp, size); the latest line for a URL is what replay reads.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.root / "manifest.jsonl"
+        self._lock = threading.Lock()
+        self._latest: dict[str, ArchiveEntry] | None = None
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.root / "objects" / sha256[:2] / f"{sha256}.gz"
+
+    def put(self, url: str, body: str, *, fetched_at: str | None = None) -> ArchiveEntry:
+        sha256 = body_digest(body)
+        entry = ArchiveEntry(
+            url=url,
+            sha256=sha256,
+            fetched_at=fetched_at or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            bytes=len(body.encode("utf-8")),
+        )
+        path = self._object_path(sha256)
+        with self._lock:
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp_path.write_bytes(gzip.compress(body.encode("utf-8"), mtime=0))
+                os.replace(tmp_path, path)
+            with self.manifest_path.open("a", encoding="utf-8") as manifest:
+                manifest.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+            if self._latest is not None:
+                self._latest[url] = entry
+        return entry
+
+    def entries(self) -> Iterator[ArchiveEntry]:
+        if not self.manifest_path.exists():
+            return
+        with self.manifest_path.open(encoding="utf-8") as manifest:
+            for line in manifest:
+                try:
+                    raw = json.loads(line)
+                except ValueError:
+                    continue  # a line torn by a killed crawl
+                yield ArchiveEntry(
+                    url=str(raw["url"]),
+                    sha256=str(raw["sha256"]),
+                    fetched_at=str(raw.get("fetched_at", "")),
+                    bytes=int(raw.get("bytes", 0)),
+                )
+
+    def latest(self, url: str) -> ArchiveEntry | None:
+        with self._lock:
+            if self._latest is None:
+                self._latest = {entry.url: entry for entry in self.entries()}
+            return self._latest.get(url)
+
+    def read(self, sha256: str) -> str:
+        return gzip.decompress(self._object_path(sha256).read_bytes()).decode("utf-8")
+
+    def get(self, url: str) -> str | None:
+        entry = self.latest(url)
+        if entry is None:
+            return None
+        return self.read(entry.sha256)
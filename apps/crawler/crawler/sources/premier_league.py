@@ -1,22 +1,42 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
 import re
-import ssl
+import threading
 import time
+from collections import deque
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from html.parser import HTMLParser
+from urllib.error import HTTPError
+from urllib.parse import urlparse
 from urllib.request import Request, urlopen
 
 from crawler.config import SourceConfig
 from crawler.logging_utils import log_event
 from crawler.sources.base import DataSource
+from crawler.sources.http_cache import HttpResponseCache, body_digest
+from crawler.sources.http_session import HttpSession
 from crawler.sources.matches_seed import load_seed_matches
+from crawler.sources.page_archive import PageArchive
 from crawler.sources.teams_seed import load_seed_teams
-from crawler.sources.types import MatchPayload, MatchStatPayload, PlayerPayload, TeamPayload
+from crawler.sources.types import (
+    EventPayload,
+    LineupPayload,
+    MatchPayload,
+    MatchStatPayload,
+    PlayerPayload,
+    TeamPayload,
+)
+from crawler.timing import span
 
 Dataset = str
 
+USER_AGENT = "EPL-Information-Hub-Crawler/1.0"
+
 TEAM_ALIASES: dict[str, list[str]] = {
     "team_id": ["team_id", "id"],
     "name": ["name", "club", "team", "team_name", "club_name"],
@@ -74,16 +94,90 @@ MATCH_STATS_ALIASES: dict[str, list[str]] = {
     "corners": ["corners", "corner_kicks", "corners_won"],
 }
 
+MATCH_EVENT_ALIASES: dict[str, list[str]] = {
+    "source_event_id": ["source_event_id", "event_id"],
+    "round": ["round", "matchweek", "match_week", "week", "gw"],
+    "home_team_short_name": ["home_team_short_name", "home_team_shortname", "home_team", "home_team_code", "home"],
+    "away_team_short_name": ["away_team_short_name", "away_team_shortname", "away_team", "away_team_code", "away"],
+    "minute": ["minute", "clock", "time", "event_minute", "clock_label"],
+    "event_type": ["event_type", "type", "event", "kind"],
+    "team_short_name": ["team_short_name", "team_shortname", "team_code", "team", "club"],
+    "player_id": ["player_id", "person_id"],
+    "player_name": ["player_name", "player", "person_name", "scorer"],
+    "detail": ["detail", "description", "info", "note"],
+}
+
+MATCH_LINEUP_ALIASES: dict[str, list[str]] = {
+    "round": MATCH_EVENT_ALIASES["round"],
+    "home_team_short_name": MATCH_EVENT_ALIASES["home_team_short_name"],
+    "away_team_short_name": MATCH_EVENT_ALIASES["away_team_short_name"],
+    "team_short_name": MATCH_EVENT_ALIASES["team_short_name"],
+    "player_id": MATCH_EVENT_ALIASES["player_id"],
+}
+
+_MINUTE_RE = re.compile(r"(\d+)")
+_CAMEL_BOUNDARY_RE = re.compile(r"([a-z0-9])([A-Z])")
+_KEY_SEPARATOR_RE = re.compile(r"[\s\-\/]+")
+_NON_KEY_CHAR_RE = re.compile(r"[^a-z0-9_]")
+_FC_WORD_RE = re.compile(r"\bfc\b", re.IGNORECASE)
+_NON_ALNUM_SPACE_RE = re.compile(r"[^A-Za-z0-9\s]")
+_SLUG_SEPARATOR_RE = re.compile(r"[-_]+")
+_CLUB_HREF_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"/clubs/\d+/([^/?#]+)/",
+        r"/clubs/\d+/([^/?#]+)$",
+        r"/clubs/([^/?#]+)/",
+        r"/clubs/([^/?#]+)$",
+    )
+)
+
+
+@lru_cache(maxsize=8192)
 def _normalize_key(value: str) -> str:
     normalized = value.strip()
-    normalized = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", normalized)
+    normalized = _CAMEL_BOUNDARY_RE.sub(r"\1_\2", normalized)
     normalized = normalized.lower()
     normalized = normalized.replace("%", "pct")
-    normalized = re.sub(r"[\s\-\/]+", "_", normalized)
-    normalized = re.sub(r"[^a-z0-9_]", "", normalized)
+    normalized = _KEY_SEPARATOR_RE.sub("_", normalized)
+    normalized = _NON_KEY_CHAR_RE.sub("", normalized)
     return normalized
 
 
+@lru_cache(maxsize=8192)
+def _path_tails(path: str) -> tuple[str, str]:
+    """Return the last two and last one `_`-separated segments of a flattened key path."""
+    segments = [segment for segment in path.split("_") if segment]
+    tail_two = "_".join(segments[-2:]) if len(segments) >= 2 else ""
+    tail_one = segments[-1] if segments else ""
+    return tail_two, tail_one
+
+
+@dataclass(frozen=True)
+class _AliasMatcher:
+    """Dataset aliases normalized once: `(canonical, (normalized alias, ...))` in priority order."""
+
+    fields: tuple[tuple[str, tuple[str, ...]], ...]
+
+    @classmethod
+    def compile(cls, aliases: dict[str, list[str]]) -> _AliasMatcher:
+        return cls(
+            fields=tuple(
+                (canonical, tuple(dict.fromkeys(_normalize_key(alias) for alias in candidates)))
+                for canonical, candidates in aliases.items()
+            )
+        )
+
+    def match(self, values: dict[str, object]) -> dict[str, object]:
+        item: dict[str, object] = {}
+        for canonical, keys in self.fields:
+            for key in keys:
+                if key in values:
+                    item[canonical] = values[key]
+                    break
+        return item
+
+
 def _build_seed_short_name_map() -> dict[str, str]:
     seed_map: dict[str, str] = {}
     for team in load_seed_teams():
@@ -92,7 +186,7 @@ def _build_seed_short_name_map() -> dict[str, str]:
         if not raw_name or not short_name:
             continue
         seed_map[_normalize_key(raw_name)] = short_name
-        fc_trimmed = re.sub(r"\bfc\b", "", raw_name, flags=re.IGNORECASE).strip()
+        fc_trimmed = _FC_WORD_RE.sub("", raw_name).strip()
         if fc_trimmed:
             seed_map[_normalize_key(fc_trimmed)] = short_name
     return seed_map
@@ -100,6 +194,27 @@ def _build_seed_short_name_map() -> dict[str, str]:
 
 _SEED_SHORT_NAME_MAP = _build_seed_short_name_map()
 
+_ALIAS_MATCHERS: dict[int, tuple[dict[str, list[str]], _AliasMatcher]] = {
+    id(aliases): (aliases, _AliasMatcher.compile(aliases))
+    for aliases in (
+        TEAM_ALIASES,
+        PLAYER_ALIASES,
+        MATCH_ALIASES,
+        MATCH_STATS_ALIASES,
+        MATCH_EVENT_ALIASES,
+        MATCH_LINEUP_ALIASES,
+    )
+}
+
+
+def _alias_matcher(aliases: dict[str, list[str]]) -> _AliasMatcher:
+    cached = _ALIAS_MATCHERS.get(id(aliases))
+    if cached is not None and cached[0] is aliases:
+        return cached[1]
+    matcher = _AliasMatcher.compile(aliases)
+    _ALIAS_MATCHERS[id(aliases)] = (aliases, matcher)
+    return matcher
+
 
 def _safe_int(value: str) -> int | None:
     try:
@@ -121,12 +236,12 @@ def _derive_short_name(team_name: str) -> str:
     if normalized_name in _SEED_SHORT_NAME_MAP:
         return _SEED_SHORT_NAME_MAP[normalized_name]
 
-    no_fc = re.sub(r"\bfc\b", "", team_name, flags=re.IGNORECASE).strip()
+    no_fc = _FC_WORD_RE.sub("", team_name).strip()
     normalized_no_fc = _normalize_key(no_fc)
     if normalized_no_fc in _SEED_SHORT_NAME_MAP:
         return _SEED_SHORT_NAME_MAP[normalized_no_fc]
 
-    cleaned = re.sub(r"[^A-Za-z0-9\s]", " ", team_name).strip()
+    cleaned = _NON_ALNUM_SPACE_RE.sub(" ", team_name).strip()
     if not cleaned:
         return "UNK"
     parts = [part for part in cleaned.split() if part]
@@ -144,7 +259,21 @@ class _Table:
     rows: list[list[str]]
 
 
-class _SimpleTableParser(HTMLParser):
+@dataclass
+class _ParsedDocument:
+    tables: list[_Table]
+    json_blocks: list[str]
+    script_blocks: list[str]
+    links: list[tuple[str, str]]
+
+
+class _DocumentParser(HTMLParser):
+    """Collect tables, script blocks and anchors in a single streaming pass.
+
+    `feed()` may be called repeatedly with chunks as they arrive; only the extracted pieces are
+    kept, never the raw document.
+    """
+
     def __init__(self) -> None:
         super().__init__()
         self._in_table = False
@@ -156,7 +285,37 @@ class _SimpleTableParser(HTMLParser):
         self._current_text: list[str] = []
         self.tables: list[_Table] = []
 
+        self._script_type: str | None = None
+        self._script_data: list[str] = []
+        self.json_blocks: list[str] = []
+        self.script_blocks: list[str] = []
+
+        self._in_anchor = False
+        self._current_href = ""
+        self._anchor_text: list[str] = []
+        self.links: list[tuple[str, str]] = []
+
+    def document(self) -> _ParsedDocument:
+        self.close()
+        return _ParsedDocument(
+            tables=self.tables,
+            json_blocks=self.json_blocks,
+            script_blocks=self.script_blocks,
+            links=self.links,
+        )
+
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "script":
+            attrs_dict = {k.lower(): (v or "") for k, v in attrs}
+            self._script_type = attrs_dict.get("type", "").lower()
+            self._script_data = []
+            return
+        if tag == "a":
+            attrs_dict = {k.lower(): (v or "") for k, v in attrs}
+            self._current_href = attrs_dict.get("href", "")
+            self._anchor_text = []
+            self._in_anchor = True
+            return
         if tag == "table":
             self._in_table = True
             self._current_headers = []
@@ -177,6 +336,25 @@ class _SimpleTableParser(HTMLParser):
             self._current_row = []
 
     def handle_endtag(self, tag: str) -> None:
+        if tag == "script":
+            payload = "".join(self._script_data).strip()
+            if not payload:
+                return
+            self.script_blocks.append(payload)
+            if "json" in (self._script_type or ""):
+                self.json_blocks.append(payload)
+            self._script_type = None
+            self._script_data = []
+            return
+        if tag == "a":
+            if not self._in_anchor:
+                return
+            text = " ".join("".join(self._anchor_text).split()).strip()
+            self.links.append((self._current_href, text))
+            self._in_anchor = False
+            self._current_href = ""
+            self._anchor_text = []
+            return
         if tag == "table" and self._in_table:
             self._in_table = False
             self.tables.append(_Table(headers=list(self._current_headers), rows=list(self._current_rows)))
@@ -201,76 +379,526 @@ class _SimpleTableParser(HTMLParser):
             self._current_row = []
 
     def handle_data(self, data: str) -> None:
+        if self._script_type is not None:
+            self._script_data.append(data)
+        if self._in_anchor:
+            self._anchor_text.append(data)
         if self._in_header or self._in_cell:
             self._current_text.append(data)
 
 
-class _ScriptJsonParser(HTMLParser):
-    def __init__(self) -> None:
-        super().__init__()
-        self._script_type: str | None = None
-        self._script_data: list[str] = []
-        self.json_blocks: list[str] = []
-        self.script_blocks: list[str] = []
+_JSON_STRUCTURE_RE = re.compile(r'[{}\[\]"\'\\\n]')
 
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        if tag != "script":
-            return
-        attrs_dict = {k.lower(): (v or "") for k, v in attrs}
-        self._script_type = attrs_dict.get("type", "").lower()
-        self._script_data = []
 
-    def handle_endtag(self, tag: str) -> None:
-        if tag != "script":
-            return
-        payload = "".join(self._script_data).strip()
-        if not payload:
-            return
-        self.script_blocks.append(payload)
-        if "json" in (self._script_type or ""):
-            self.json_blocks.append(payload)
-        self._script_type = None
-        self._script_data = []
+@dataclass
+class _JsonSpan:
+    start: int
+    end: int
+    children: list[_JsonSpan]
+
+
+def _scan_json_spans(text: str) -> list[_JsonSpan]:
+    """Find top-level balanced `{...}`/`[...]` spans in one left-to-right pass.
+
+    Only structural characters are visited (via a regex jump). Single- and double-quoted strings
+    are skipped up to their closing quote or the end of the line, and escapes are honoured. Nested
+    spans are kept as children so callers can fall back to them when an outer span is a JS literal
+    rather than JSON. An opener that never closes (at a mismatched closer or at the end of the
+    text) is dropped and its complete children take its place, so the scan stays linear.
+    """
+    roots: list[_JsonSpan] = []
+    stack: list[tuple[int, str, list[_JsonSpan]]] = []
+    open_closers = {"}": 0, "]": 0}
+    quote: str | None = None
+    skip_until = -1
+
+    def drop_unclosed() -> None:
+        _, closer, children = stack.pop()
+        open_closers[closer] -= 1
+        (stack[-1][2] if stack else roots).extend(children)
+
+    for matched in _JSON_STRUCTURE_RE.finditer(text):
+        idx = matched.start()
+        if idx < skip_until:
+            continue
+        char = matched.group()
+        if char == "\\":
+            skip_until = idx + 2
+            continue
+        if quote is not None:
+            if char == quote or char == "\n":
+                quote = None
+            continue
+        if char == '"' or char == "'":
+            quote = char
+            continue
+        if char == "{" or char == "[":
+            closer = "}" if char == "{" else "]"
+            stack.append((idx, closer, []))
+            open_closers[closer] += 1
+            continue
+        if char == "\n" or not open_closers.get(char):
+            continue
+        while stack[-1][1] != char:
+            drop_unclosed()
+        start, _, children = stack.pop()
+        open_closers[char] -= 1
+        (stack[-1][2] if stack else roots).append(_JsonSpan(start=start, end=idx + 1, children=children))
+    while stack:
+        drop_unclosed()
+    roots.sort(key=lambda span: span.start)
+    return roots
+
+
+def parse_document(chunks: Iterable[str]) -> _ParsedDocument:
+    parser = _DocumentParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser.document()
+
+
+@dataclass(frozen=True)
+class ParsedRecords:
+    """Rows extracted from one page by `parse_page`.
+
+    Rows are tuples aligned with `columns` rather than dicts, so a page parsed in a worker
+    process pickles back as little more than its cell strings.
+    """
+
+    strategy: str
+    columns: tuple[str, ...]
+    rows: list[tuple[str, ...]]
+
+    def records(self) -> list[dict[str, str]]:
+        return [dict(zip(self.columns, row)) for row in self.rows]
+
+
+# dataset -> (aliases, required fields, extraction strategies in order)
+_PARSE_SPECS: dict[Dataset, tuple[dict[str, list[str]], tuple[str, ...], tuple[str, ...]]] = {
+    "teams": (TEAM_ALIASES, ("name",), ("table", "json", "links")),
+    "players": (
+        PLAYER_ALIASES,
+        ("player_id", "team_short_name", "name", "position", "jersey_num", "nationality"),
+        ("table", "json"),
+    ),
+    "matches": (MATCH_ALIASES, ("round", "match_date"), ("table", "json")),
+    "match_stats": (
+        MATCH_STATS_ALIASES,
+        (
+            "round",
+            "home_team_short_name",
+            "away_team_short_name",
+            "team_short_name",
+            "possession",
+            "shots",
+            "shots_on_target",
+            "fouls",
+            "corners",
+        ),
+        ("table", "json"),
+    ),
+    "match_events": (
+        MATCH_EVENT_ALIASES,
+        ("round", "home_team_short_name", "away_team_short_name", "minute", "event_type"),
+        ("table", "json"),
+    ),
+    "match_lineups": (
+        MATCH_LINEUP_ALIASES,
+        ("round", "home_team_short_name", "away_team_short_name", "team_short_name", "player_id"),
+        ("table", "json"),
+    ),
+}
 
-    def handle_data(self, data: str) -> None:
-        if self._script_type is not None:
-            self._script_data.append(data)
+_LINK_TEAM_COLUMNS = ("name", "short_name", "logo_url", "stadium", "manager")
 
 
-class _AnchorParser(HTMLParser):
-    def __init__(self) -> None:
-        super().__init__()
-        self._in_anchor = False
-        self._current_href = ""
-        self._current_text: list[str] = []
-        self.links: list[tuple[str, str]] = []
+def parse_page(dataset: Dataset, html: str, parse_strict: bool = False) -> ParsedRecords:
+    """Extract `dataset` records from one page, trying its strategies in order until one yields rows.
 
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        if tag != "a":
-            return
-        attrs_dict = {k.lower(): (v or "") for k, v in attrs}
-        self._current_href = attrs_dict.get("href", "")
-        self._current_text = []
-        self._in_anchor = True
+    Top-level and free of source state so it can run in a parse worker process. The page is
+    tokenized once and shared by every strategy.
+    """
+    aliases, required, strategies = _PARSE_SPECS[dataset]
+    document = parse_document((html,))
+    for strategy in strategies:
+        columns = tuple(aliases)
+        if strategy == "table":
+            records = _records_from_tables(document, aliases, required, parse_strict)
+        elif strategy == "json":
+            records = _records_from_json(html, document, aliases, required)
+        else:
+            records = _team_records_from_links(document)
+            columns = _LINK_TEAM_COLUMNS
+        if records:
+            return ParsedRecords(
+                strategy=strategy,
+                columns=columns,
+                rows=[tuple(record.get(column, "") for column in columns) for record in records],
+            )
+    return ParsedRecords(strategy="", columns=(), rows=[])
 
-    def handle_endtag(self, tag: str) -> None:
-        if tag != "a" or not self._in_anchor:
+
+_PARSE_EXECUTORS: dict[int, ProcessPoolExecutor] = {}
+_PARSE_EXECUTORS_LOCK = threading.Lock()
+
+
+def _parse_executor(workers: int) -> ProcessPoolExecutor:
+    """Process pool shared by every source with the same `parse_workers`, created on first use.
+
+    Workers are spawned rather than forked because the pool is usually first needed from a
+    download thread.
+    """
+    with _PARSE_EXECUTORS_LOCK:
+        executor = _PARSE_EXECUTORS.get(workers)
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _PARSE_EXECUTORS[workers] = executor
+        return executor
+
+
+def _records_from_tables(
+    document: _ParsedDocument,
+    aliases: dict[str, list[str]],
+    required: Sequence[str],
+    parse_strict: bool,
+) -> list[dict[str, str]]:
+    for table in document.tables:
+        if not table.headers or not table.rows:
+            continue
+        mapped = _map_table_rows(table.headers, table.rows, aliases, required, parse_strict)
+        if mapped:
+            return mapped
+    return []
+
+
+def _map_table_rows(
+    headers: list[str],
+    rows: list[list[str]],
+    aliases: dict[str, list[str]],
+    required: Sequence[str],
+    parse_strict: bool,
+) -> list[dict[str, str]]:
+    index = _build_alias_index(headers, aliases)
+    missing = [key for key in required if key not in index]
+    if missing:
+        if parse_strict:
+            raise ValueError(f"missing required headers: {missing}")
+        return []
+
+    mapped: list[dict[str, str]] = []
+    for row in rows:
+        item: dict[str, str] = {}
+        for canonical, col in index.items():
+            if col < len(row):
+                item[canonical] = row[col]
+        if all(item.get(key, "").strip() for key in required):
+            mapped.append(item)
+    return mapped
+
+
+def _build_alias_index(headers: list[str], aliases: dict[str, list[str]]) -> dict[str, int]:
+    header_index = {h: idx for idx, h in enumerate(headers)}
+    return _alias_matcher(aliases).match(header_index)  # type: ignore[return-value]
+
+
+def _records_from_json(
+    html: str,
+    document: _ParsedDocument,
+    aliases: dict[str, list[str]],
+    required: Sequence[str],
+) -> list[dict[str, str]]:
+    for candidate in _json_candidates(html, document):
+        mapped = _map_json_candidate(candidate, aliases, required)
+        if mapped:
+            return mapped
+    return []
+
+
+def _json_candidates(html: str, document: _ParsedDocument) -> list[object]:
+    stripped = html.strip()
+    values: list[object] = []
+    if stripped.startswith("{") or stripped.startswith("["):
+        direct = _json_load(stripped)
+        if direct is not None:
+            values.append(direct)
+
+    for block in document.json_blocks:
+        obj = _json_load(block)
+        if obj is not None:
+            values.append(obj)
+
+    for block in document.script_blocks:
+        seen: set[str] = set()
+        for variable in (
+            "__NEXT_DATA__",
+            "__PRELOADED_STATE__",
+            "__INITIAL_STATE__",
+            "window.__NEXT_DATA__",
+            "window.PULSE.envPaths",
+            "PULSE.envPaths",
+            "window.PULSE.app",
+            "PULSE.app",
+        ):
+            raw = _extract_assigned_json(block, variable)
+            if raw is None or raw in seen:
+                continue
+            seen.add(raw)
+            obj = _json_load(raw)
+            if obj is not None:
+                values.append(obj)
+        values.extend(_extract_inline_json_objects(block, seen))
+    return values
+
+
+def _extract_assigned_json(script_block: str, variable: str) -> str | None:
+    marker_index = script_block.find(variable)
+    if marker_index < 0:
+        return None
+    eq_index = script_block.find("=", marker_index)
+    if eq_index < 0:
+        return None
+    start = eq_index + 1
+    while start < len(script_block) and script_block[start].isspace():
+        start += 1
+    if start >= len(script_block) or script_block[start] not in "{[":
+        return None
+    return _extract_balanced(script_block, start)
+
+
+def _extract_inline_json_objects(script_block: str, seen: set[str] | None = None) -> list[object]:
+    """Parse the outermost balanced spans; descend into a span only when it is not valid JSON."""
+    values: list[object] = []
+    seen = seen if seen is not None else set()
+    pending = list(reversed(_scan_json_spans(script_block)))
+    while pending:
+        span = pending.pop()
+        raw = script_block[span.start : span.end]
+        if raw in seen:
+            continue
+        seen.add(raw)
+        parsed = _json_load(raw)
+        if parsed is not None:
+            values.append(parsed)
+            continue
+        pending.extend(reversed(span.children))
+    return values
+
+
+def _extract_balanced(text: str, start: int) -> str | None:
+    opening = text[start]
+    closing = "}" if opening == "{" else "]"
+    stack = [closing]
+
+    in_string = False
+    escaped = False
+    for idx in range(start + 1, len(text)):
+        char = text[idx]
+        if escaped:
+            escaped = False
+            continue
+        if char == "\\":
+            escaped = True
+            continue
+        if char == '"':
+            in_string = not in_string
+            continue
+        if in_string:
+            continue
+        if char == "{":
+            stack.append("}")
+            continue
+        if char == "[":
+            stack.append("]")
+            continue
+        if char == stack[-1]:
+            stack.pop()
+            if not stack:
+                return text[start : idx + 1]
+    return None
+
+
+def _json_load(raw: str) -> object | None:
+    try:
+        return json.loads(raw)
+    except Exception:
+        return None
+
+
+def _map_json_candidate(
+    candidate: object,
+    aliases: dict[str, list[str]],
+    required: Sequence[str],
+) -> list[dict[str, str]]:
+    matcher = _alias_matcher(aliases)
+    mapped: list[dict[str, str]] = []
+    for record in _flatten_dict_records(candidate):
+        item: dict[str, str] = matcher.match(_flatten_record_values(record))  # type: ignore[assignment]
+        if all(item.get(key, "").strip() for key in required):
+            mapped.append(item)
+    return mapped
+
+
+def _flatten_record_values(record: dict[str, object]) -> dict[str, str]:
+    values: dict[str, str] = {}
+
+    def _set_value(path: str, value: object) -> None:
+        text = str(value).strip()
+        if not text:
             return
-        text = " ".join("".join(self._current_text).split()).strip()
-        self.links.append((self._current_href, text))
-        self._in_anchor = False
-        self._current_href = ""
-        self._current_text = []
+        if path not in values:
+            values[path] = text
+        tail_two, tail_one = _path_tails(path)
+        if tail_two and tail_two not in values:
+            values[tail_two] = text
+        if tail_one and tail_one not in values:
+            values[tail_one] = text
+
+    queue: deque[tuple[str, object]] = deque([("", record)])
+    while queue:
+        prefix, current = queue.popleft()
+        if isinstance(current, dict):
+            for raw_key, raw_value in current.items():
+                if raw_value is None:
+                    continue
+                key = _normalize_key(str(raw_key))
+                if not key:
+                    continue
+                next_prefix = f"{prefix}_{key}" if prefix else key
+                queue.append((next_prefix, raw_value))
+            continue
+        if isinstance(current, list):
+            for item in current:
+                if isinstance(item, (dict, list)):
+                    queue.append((prefix, item))
+                elif prefix:
+                    _set_value(prefix, item)
+            continue
+        if prefix:
+            _set_value(prefix, current)
+    return values
+
+
+def _flatten_dict_records(obj: object) -> list[dict[str, object]]:
+    queue: deque[object] = deque([obj])
+    records: list[dict[str, object]] = []
+    while queue:
+        current = queue.popleft()
+        if isinstance(current, dict):
+            has_scalar_value = any(
+                value is not None and not isinstance(value, (dict, list)) for value in current.values()
+            )
+            if has_scalar_value:
+                records.append(current)
+            for value in current.values():
+                if isinstance(value, (dict, list)):
+                    queue.append(value)
+        elif isinstance(current, list):
+            for value in current:
+                if isinstance(value, (dict, list)):
+                    queue.append(value)
+    return records
+
+
+def _team_records_from_links(document: _ParsedDocument) -> list[dict[str, str]]:
+    items: list[dict[str, str]] = []
+    seen_names: set[str] = set()
+
+    for href, text in document.links:
+        href_lower = href.lower()
+        if "/clubs/" not in href_lower:
+            continue
 
-    def handle_data(self, data: str) -> None:
-        if self._in_anchor:
-            self._current_text.append(data)
+        team_name = text.strip()
+        if not team_name or team_name.lower() in {"clubs", "all clubs", "club"}:
+            team_name = _name_from_club_href(href)
+        if not team_name:
+            continue
+
+        normalized_name = " ".join(team_name.split()).strip()
+        if not normalized_name:
+            continue
+        key = normalized_name.lower()
+        if key in seen_names:
+            continue
+        seen_names.add(key)
+
+        items.append(
+            {
+                "name": normalized_name,
+                "short_name": _derive_short_name(normalized_name),
+                "logo_url": "",
+                "stadium": "",
+                "manager": "",
+            }
+        )
+    return items
+
+
+def _name_from_club_href(href: str) -> str:
+    for pattern in _CLUB_HREF_PATTERNS:
+        matched = pattern.search(href)
+        if not matched:
+            continue
+        slug = matched.group(1).strip("-_ ")
+        if not slug:
+            continue
+        words = [segment for segment in _SLUG_SEPARATOR_RE.split(slug) if segment]
+        if not words:
+            continue
+        return " ".join(word.capitalize() for word in words)
+    return ""
 
 
 class PremierLeagueDataSource(DataSource):
     def __init__(self, config: SourceConfig) -> None:
         self.config = config
         self._team_id_to_short: dict[int, str] = {}
+        self._cache = HttpResponseCache(config.http_cache_dir) if config.http_cache_dir else None
+        self._archive = PageArchive(config.archive_dir) if config.archive_dir else None
+        self._body_digests: dict[str, str] = {}
+        self._unchanged_urls: set[str] = set()
+        self._prefetched: dict[str, Future[str]] = {}
+        self._parsing: dict[tuple[Dataset, str], Future[ParsedRecords]] = {}
+        self._parsing_lock = threading.Lock()
+        self._session = HttpSession(
+            timeout_seconds=config.timeout_seconds,
+            verify_ssl=config.verify_ssl,
+            ca_file=config.ca_file,
+            user_agent=USER_AGENT,
+        )
+        if not config.verify_ssl:
+            log_event("WARNING", "pl.http.ssl_verify_disabled")
+
+    def prefetch(self, datasets: Iterable[str] | None = None) -> None:
+        """Download dataset pages concurrently; `load_*` then waits on the matching future.
+
+        With `parse_workers > 0` each page is handed to the parse process pool as soon as it
+        arrives, so pages are tokenized in parallel. Rows are still mapped to payloads in the
+        caller's `load_*` order, so teams resolve before matches look up team ids, while a slow
+        page only delays the datasets that need it.
+        """
+        targets = {
+            "teams": (self.config.teams_url, "pl.fetch.teams"),
+            "players": (self.config.players_url, "pl.fetch.players"),
+            "matches": (self.config.matches_url, "pl.fetch.matches"),
+            "match_stats": (self.config.match_stats_url, "pl.fetch.match_stats"),
+        }
+        if self.config.match_events_url:
+            targets["match_events"] = (self.config.match_events_url, "pl.fetch.match_events")
+        if self.config.match_lineups_url:
+            targets["match_lineups"] = (self.config.match_lineups_url, "pl.fetch.match_lineups")
+        selected = [dataset for dataset in datasets if dataset in targets] if datasets is not None else list(targets)
+        pool = ThreadPoolExecutor(max_workers=self.config.fetch_concurrency, thread_name_prefix="pl-fetch")
+        for dataset in selected:
+            url, event_name = targets[dataset]
+            download = self._prefetched.get(url)
+            if download is None:
+                download = self._prefetched[url] = pool.submit(self._download_with_retry, url, event_name)
+            if self.config.parse_workers > 0:
+                # Datasets can share a page (e.g. players on the clubs page); each parses it its own way.
+                download.add_done_callback(partial(self._parse_when_downloaded, dataset, url))
+        pool.shutdown(wait=False)
+        log_event("INFO", "pl.fetch.prefetch", datasets=selected, concurrency=self.config.fetch_concurrency)
 
     def load_teams(self) -> list[TeamPayload]:
         html = self._fetch_html_for_dataset("teams", self.config.teams_url, "pl.fetch.teams")
@@ -280,17 +908,10 @@ class PremierLeagueDataSource(DataSource):
                 log_event("WARNING", "pl.parse.teams_seed_fallback", rows=len(seed_payload))
                 return seed_payload
             return []
-        records = self._extract_from_table(html=html, aliases=TEAM_ALIASES, required=["name"])
-        if records:
-            log_event("INFO", "pl.parse.strategy", dataset="teams", strategy="table", rows=len(records))
-        if not records:
-            records = self._extract_from_json(html=html, aliases=TEAM_ALIASES, required=["name"])
-            if records:
-                log_event("INFO", "pl.parse.strategy", dataset="teams", strategy="json", rows=len(records))
-        if not records:
-            records = self._extract_teams_from_links(html)
-            if records:
-                log_event("INFO", "pl.parse.strategy", dataset="teams", strategy="links", rows=len(records))
+        cached = self._cached_payload("teams", self.config.teams_url)
+        if cached is not None:
+            return cached
+        records = self._parsed_records("teams", self.config.teams_url, html)
         if not records:
             if self.config.teams_seed_fallback:
                 seed_payload = load_seed_teams()
@@ -315,74 +936,17 @@ class PremierLeagueDataSource(DataSource):
                 }
             )
         log_event("INFO", "pl.parse.teams", rows=len(payload))
+        self._store_payload("teams", self.config.teams_url, payload)
         return payload
 
-    def _extract_teams_from_links(self, html: str) -> list[dict[str, str]]:
-        parser = _AnchorParser()
-        parser.feed(html)
-        items: list[dict[str, str]] = []
-        seen_names: set[str] = set()
-
-        for href, text in parser.links:
-            href_lower = href.lower()
-            if "/clubs/" not in href_lower:
-                continue
-
-            team_name = text.strip()
-            if not team_name or team_name.lower() in {"clubs", "all clubs", "club"}:
-                team_name = self._name_from_club_href(href)
-            if not team_name:
-                continue
-
-            normalized_name = " ".join(team_name.split()).strip()
-            if not normalized_name:
-                continue
-            key = normalized_name.lower()
-            if key in seen_names:
-                continue
-            seen_names.add(key)
-
-            items.append(
-                {
-                    "name": normalized_name,
-                    "short_name": _derive_short_name(normalized_name),
-                    "logo_url": "",
-                    "stadium": "",
-                    "manager": "",
-                }
-            )
-        return items
-
-    def _name_from_club_href(self, href: str) -> str:
-        patterns = [
-            r"/clubs/\d+/([^/?#]+)/",
-            r"/clubs/\d+/([^/?#]+)$",
-            r"/clubs/([^/?#]+)/",
-            r"/clubs/([^/?#]+)$",
-        ]
-        for pattern in patterns:
-            matched = re.search(pattern, href, flags=re.IGNORECASE)
-            if not matched:
-                continue
-            slug = matched.group(1).strip("-_ ")
-            if not slug:
-                continue
-            words = [segment for segment in re.split(r"[-_]+", slug) if segment]
-            if not words:
-                continue
-            return " ".join(word.capitalize() for word in words)
-        return ""
-
     def load_players(self) -> list[PlayerPayload]:
         html = self._fetch_html_for_dataset("players", self.config.players_url, "pl.fetch.players")
         if html is None:
             return []
-        records = self._extract_records(
-            dataset="players",
-            html=html,
-            aliases=PLAYER_ALIASES,
-            required=["player_id", "team_short_name", "name", "position", "jersey_num", "nationality"],
-        )
+        cached = self._cached_payload("players", self.config.players_url)
+        if cached is not None:
+            return cached
+        records = self._extract_records("players", self.config.players_url, html)
         payload: list[PlayerPayload] = []
         for row in records:
             payload.append(
@@ -397,6 +961,7 @@ class PremierLeagueDataSource(DataSource):
                 }
             )
         log_event("INFO", "pl.parse.players", rows=len(payload))
+        self._store_payload("players", self.config.players_url, payload)
         return payload
 
     def load_matches(self) -> list[MatchPayload]:
@@ -409,22 +974,11 @@ class PremierLeagueDataSource(DataSource):
                 return seed_payload
             self._handle_dataset_issue("matches", reason=f"fetch_failed:{type(exc).__name__}")
             return []
+        cached = self._cached_payload("matches", self.config.matches_url)
+        if cached is not None:
+            return cached
 
-        records = self._extract_from_table(
-            html=html,
-            aliases=MATCH_ALIASES,
-            required=["round", "match_date"],
-        )
-        if records:
-            log_event("INFO", "pl.parse.strategy", dataset="matches", strategy="table", rows=len(records))
-        if not records:
-            records = self._extract_from_json(
-                html=html,
-                aliases=MATCH_ALIASES,
-                required=["round", "match_date"],
-            )
-            if records:
-                log_event("INFO", "pl.parse.strategy", dataset="matches", strategy="json", rows=len(records))
+        records = self._parsed_records("matches", self.config.matches_url, html)
         if not records and self.config.matches_seed_fallback:
             seed_payload = load_seed_matches()
             log_event("WARNING", "pl.parse.matches_seed_fallback", rows=len(seed_payload), reason="no_records_after_all_strategies")
@@ -469,28 +1023,17 @@ class PremierLeagueDataSource(DataSource):
                 }
             )
         log_event("INFO", "pl.parse.matches", rows=len(payload))
+        self._store_payload("matches", self.config.matches_url, payload)
         return payload
 
     def load_match_stats(self) -> list[MatchStatPayload]:
         html = self._fetch_html_for_dataset("match_stats", self.config.match_stats_url, "pl.fetch.match_stats")
         if html is None:
             return []
-        records = self._extract_records(
-            dataset="match_stats",
-            html=html,
-            aliases=MATCH_STATS_ALIASES,
-            required=[
-                "round",
-                "home_team_short_name",
-                "away_team_short_name",
-                "team_short_name",
-                "possession",
-                "shots",
-                "shots_on_target",
-                "fouls",
-                "corners",
-            ],
-        )
+        cached = self._cached_payload("match_stats", self.config.match_stats_url)
+        if cached is not None:
+            return cached
+        records = self._extract_records("match_stats", self.config.match_stats_url, html)
         payload: list[MatchStatPayload] = []
         for row in records:
             payload.append(
@@ -507,14 +1050,85 @@ class PremierLeagueDataSource(DataSource):
                 }
             )
         log_event("INFO", "pl.parse.match_stats", rows=len(payload))
+        self._store_payload("match_stats", self.config.match_stats_url, payload)
+        return payload
+
+    def load_match_events(self) -> list[EventPayload]:
+        if not self.config.match_events_url:
+            return []
+        html = self._fetch_html_for_dataset("match_events", self.config.match_events_url, "pl.fetch.match_events")
+        if html is None:
+            return []
+        cached = self._cached_payload("match_events", self.config.match_events_url)
+        if cached is not None:
+            return cached
+        records = self._extract_records("match_events", self.config.match_events_url, html)
+        # The page parses whole and the parse cache stores the full payload, so this stays a list.
+        payload: list[EventPayload] = []
+        for row in records:
+            minute = _MINUTE_RE.search(row["minute"])
+            payload.append(
+                {
+                    "source_event_id": row.get("source_event_id") or None,
+                    "round": _safe_int(row["round"]) or 0,
+                    "home_team_short_name": row["home_team_short_name"],
+                    "away_team_short_name": row["away_team_short_name"],
+                    "minute": int(minute.group(1)) if minute else 0,
+                    "event_type": _normalize_key(row["event_type"]).upper(),
+                    "team_short_name": row.get("team_short_name") or None,
+                    "player_id": _safe_int(row.get("player_id", "")),
+                    "player_name": row.get("player_name") or None,
+                    "detail": row.get("detail") or None,
+                }
+            )
+        log_event("INFO", "pl.parse.match_events", rows=len(payload))
+        self._store_payload("match_events", self.config.match_events_url, payload)
+        return payload
+
+    def load_match_lineups(self) -> list[LineupPayload]:
+        if not self.config.match_lineups_url:
+            return []
+        html = self._fetch_html_for_dataset("match_lineups", self.config.match_lineups_url, "pl.fetch.match_lineups")
+        if html is None:
+            return []
+        cached = self._cached_payload("match_lineups", self.config.match_lineups_url)
+        if cached is not None:
+            return cached
+        records = self._extract_records("match_lineups", self.config.match_lineups_url, html)
+        payload: list[LineupPayload] = []
+        for row in records:
+            player_id = _safe_int(row["player_id"])
+            if player_id is None:
+                continue
+            payload.append(
+                {
+                    "round": _safe_int(row["round"]) or 0,
+                    "home_team_short_name": row["home_team_short_name"],
+                    "away_team_short_name": row["away_team_short_name"],
+                    "team_short_name": row["team_short_name"],
+                    "player_id": player_id,
+                }
+            )
+        log_event("INFO", "pl.parse.match_lineups", rows=len(payload))
+        self._store_payload("match_lineups", self.config.match_lineups_url, payload)
         return payload
 
     def _fetch_with_retry(self, url: str, event_name: str) -> str:
+        future = self._prefetched.get(url)
+        if future is not None:
+            return future.result()
+        return self._download_with_retry(url, event_name)
+
+    def _download_with_retry(self, url: str, event_name: str) -> str:
         last_error: Exception | None = None
         for attempt in range(1, self.config.retry_count + 1):
             try:
-                html = self._http_get(url)
+                with span("fetch", url=url, attempt=attempt) as fetched:
+                    html = self._http_get(url)
+                    fetched.bytes = len(html.encode("utf-8"))
                 log_event("INFO", event_name, url=url, attempt=attempt, status="success")
+                if self._archive is not None:
+                    self._archive.put(url, html)
                 return html
             except Exception as exc:
                 last_error = exc
@@ -533,291 +1147,110 @@ class PremierLeagueDataSource(DataSource):
             return None
 
     def _http_get(self, url: str) -> str:
-        request = Request(url, headers={"User-Agent": "EPL-Information-Hub-Crawler/1.0"})
-        if self.config.verify_ssl:
-            context = ssl.create_default_context(cafile=self.config.ca_file)
+        cached = self._cache.get(url) if self._cache is not None else None
+        headers = cached.conditional_headers() if cached is not None else {}
+
+        if urlparse(url).scheme.lower() in {"http", "https"}:
+            response = self._session.get(url, headers=headers)
+            log_event(
+                "INFO",
+                "pl.http.timing",
+                url=url,
+                status=response.status,
+                bytes=len(response.body),
+                reused_connection=response.reused_connection,
+                **response.timings,
+            )
+            status = response.status
+            if status >= 400 or (status == 304 and cached is None):
+                raise HTTPError(url, status, response.reason, None, None)  # type: ignore[arg-type]
+            body = response.body.decode("utf-8", errors="replace")
+            etag = response.headers.get("etag")
+            last_modified = response.headers.get("last-modified")
         else:
-            context = ssl._create_unverified_context()
-            log_event("WARNING", "pl.http.ssl_verify_disabled", url=url)
-
-        with urlopen(request, timeout=self.config.timeout_seconds, context=context) as response:
-            return response.read().decode("utf-8", errors="replace")
-
-    def _extract_records(
-        self,
-        *,
-        dataset: Dataset,
-        html: str,
-        aliases: dict[str, list[str]],
-        required: list[str],
-    ) -> list[dict[str, str]]:
-        from_table = self._extract_from_table(html=html, aliases=aliases, required=required)
-        if from_table:
-            log_event("INFO", "pl.parse.strategy", dataset=dataset, strategy="table", rows=len(from_table))
-            return from_table
-
-        from_json = self._extract_from_json(html=html, aliases=aliases, required=required)
-        if from_json:
-            log_event("INFO", "pl.parse.strategy", dataset=dataset, strategy="json", rows=len(from_json))
-            return from_json
-
-        return self._handle_dataset_issue(dataset, reason="no_records_after_all_strategies")
-
-    def _extract_from_table(
-        self,
-        *,
-        html: str,
-        aliases: dict[str, list[str]],
-        required: list[str],
-    ) -> list[dict[str, str]]:
-        parser = _SimpleTableParser()
-        parser.feed(html)
-        for table in parser.tables:
-            if not table.headers or not table.rows:
-                continue
-            mapped = self._map_table_rows(table.headers, table.rows, aliases, required)
-            if mapped:
-                return mapped
-        return []
-
-    def _map_table_rows(
-        self,
-        headers: list[str],
-        rows: list[list[str]],
-        aliases: dict[str, list[str]],
-        required: list[str],
-    ) -> list[dict[str, str]]:
-        index = self._build_alias_index(headers, aliases)
-        missing = [key for key in required if key not in index]
-        if missing:
-            if self.config.parse_strict:
-                raise ValueError(f"missing required headers: {missing}")
-            return []
-
-        mapped: list[dict[str, str]] = []
-        for row in rows:
-            item: dict[str, str] = {}
-            for canonical, col in index.items():
-                if col < len(row):
-                    item[canonical] = row[col]
-            if all(item.get(key, "").strip() for key in required):
-                mapped.append(item)
-        return mapped
-
-    def _extract_from_json(
-        self,
-        *,
-        html: str,
-        aliases: dict[str, list[str]],
-        required: list[str],
-    ) -> list[dict[str, str]]:
-        candidates = self._extract_json_candidates(html)
-        mapped: list[dict[str, str]] = []
-        for candidate in candidates:
-            mapped.extend(self._map_json_candidate(candidate, aliases, required))
-            if mapped:
-                return mapped
-        return []
-
-    def _extract_json_candidates(self, html: str) -> list[object]:
-        stripped = html.strip()
-        values: list[object] = []
-        if stripped.startswith("{") or stripped.startswith("["):
-            direct = self._json_load(stripped)
-            if direct is not None:
-                values.append(direct)
-
-        parser = _ScriptJsonParser()
-        parser.feed(html)
-
-        for block in parser.json_blocks:
-            obj = self._json_load(block)
-            if obj is not None:
-                values.append(obj)
-
-        for block in parser.script_blocks:
-            for variable in (
-                "__NEXT_DATA__",
-                "__PRELOADED_STATE__",
-                "__INITIAL_STATE__",
-                "window.__NEXT_DATA__",
-                "window.PULSE.envPaths",
-                "PULSE.envPaths",
-                "window.PULSE.app",
-                "PULSE.app",
-            ):
-                raw = self._extract_assigned_json(block, variable)
-                if raw is None:
-                    continue
-                obj = self._json_load(raw)
-                if obj is not None:
-                    values.append(obj)
-            values.extend(self._extract_inline_json_objects(block))
-        return values
-
-    def _extract_assigned_json(self, script_block: str, variable: str) -> str | None:
-        marker_index = script_block.find(variable)
-        if marker_index < 0:
+            request = Request(url, headers={"User-Agent": USER_AGENT, **headers})
+            with urlopen(request, timeout=self.config.timeout_seconds) as raw:
+                status = int(getattr(raw, "status", None) or 200)
+                body = raw.read().decode("utf-8", errors="replace")
+                etag = raw.headers.get("ETag")
+                last_modified = raw.headers.get("Last-Modified")
+
+        if status == 304 and cached is not None:
+            log_event("INFO", "pl.http.not_modified", url=url)
+            self._body_digests[url] = cached.body_sha256
+            self._unchanged_urls.add(url)
+            return cached.body
+
+        if self._cache is None:
+            return body
+        digest = body_digest(body)
+        self._body_digests[url] = digest
+        if cached is not None and cached.body_sha256 == digest:
+            self._unchanged_urls.add(url)
+            log_event("INFO", "pl.http.body_unchanged", url=url)
+        self._cache.put(url, etag=etag, last_modified=last_modified, body=body)
+        return body
+
+    def _cached_payload(self, dataset: Dataset, url: str) -> list | None:
+        if self._cache is None or url not in self._unchanged_urls:
             return None
-        eq_index = script_block.find("=", marker_index)
-        if eq_index < 0:
+        parsed = self._cache.load_parsed(url, dataset, self._body_digests[url])
+        if parsed is None:
             return None
-        start = eq_index + 1
-        while start < len(script_block) and script_block[start].isspace():
-            start += 1
-        if start >= len(script_block) or script_block[start] not in "{[":
+        stored_team_ids = dict(parsed.get("team_id_to_short") or {})
+        if dataset == "teams":
+            for team_id, short_name in stored_team_ids.items():
+                self._team_id_to_short[int(team_id)] = str(short_name)
+        elif stored_team_ids != {str(k): v for k, v in self._team_id_to_short.items()}:
+            # Matches may resolve short names through team ids, so a remapped club invalidates them.
             return None
-        return self._extract_balanced(script_block, start)
-
-    def _extract_inline_json_objects(self, script_block: str) -> list[object]:
-        values: list[object] = []
-        for opening in ("{", "["):
-            start = 0
-            while start < len(script_block):
-                idx = script_block.find(opening, start)
-                if idx < 0:
-                    break
-                raw = self._extract_balanced(script_block, idx)
-                if raw is None:
-                    start = idx + 1
-                    continue
-                parsed = self._json_load(raw)
-                if parsed is not None:
-                    values.append(parsed)
-                start = idx + 1
-        return values
-
-    def _extract_balanced(self, text: str, start: int) -> str | None:
-        opening = text[start]
-        closing = "}" if opening == "{" else "]"
-        stack = [closing]
-
-        in_string = False
-        escaped = False
-        for idx in range(start + 1, len(text)):
-            char = text[idx]
-            if escaped:
-                escaped = False
-                continue
-            if char == "\\":
-                escaped = True
-                continue
-            if char == '"':
-                in_string = not in_string
-                continue
-            if in_string:
-                continue
-            if char == "{":
-                stack.append("}")
-                continue
-            if char == "[":
-                stack.append("]")
-                continue
-            if char == stack[-1]:
-                stack.pop()
-                if not stack:
-                    return text[start : idx + 1]
-        return None
+        payload = list(parsed.get("payload") or [])
+        log_event("INFO", "pl.parse.cache_hit", dataset=dataset, rows=len(payload))
+        return payload
 
-    def _json_load(self, raw: str) -> object | None:
-        try:
-            return json.loads(raw)
-        except Exception:
-            return None
+    def _store_payload(self, dataset: Dataset, url: str, payload: list) -> None:
+        if self._cache is None or url not in self._body_digests:
+            return
+        parsed = {
+            "payload": payload,
+            "team_id_to_short": {str(k): v for k, v in self._team_id_to_short.items()},
+        }
+        self._cache.store_parsed(url, dataset, self._body_digests[url], parsed)
+
+    def _extract_records(self, dataset: Dataset, url: str, html: str) -> list[dict[str, str]]:
+        records = self._parsed_records(dataset, url, html)
+        if records:
+            return records
+        return self._handle_dataset_issue(dataset, reason="no_records_after_all_strategies")
 
-    def _map_json_candidate(
-        self,
-        candidate: object,
-        aliases: dict[str, list[str]],
-        required: list[str],
-    ) -> list[dict[str, str]]:
-        records = self._flatten_dict_records(candidate)
-        mapped: list[dict[str, str]] = []
-        for record in records:
-            normalized = self._flatten_record_values(record)
-            item: dict[str, str] = {}
-            for canonical, candidates in aliases.items():
-                for alias in candidates:
-                    key = _normalize_key(alias)
-                    if key in normalized:
-                        item[canonical] = normalized[key]
-                        break
-            if all(item.get(key, "").strip() for key in required):
-                mapped.append(item)
-        return mapped
-
-    def _flatten_record_values(self, record: dict[str, object]) -> dict[str, str]:
-        values: dict[str, str] = {}
-
-        def _set_value(path: str, value: object) -> None:
-            text = str(value).strip()
-            if not text:
-                return
-            segments = [segment for segment in path.split("_") if segment]
-            if path not in values:
-                values[path] = text
-            if len(segments) >= 2:
-                tail_two = "_".join(segments[-2:])
-                if tail_two and tail_two not in values:
-                    values[tail_two] = text
-            tail_one = segments[-1] if segments else ""
-            if tail_one and tail_one not in values:
-                values[tail_one] = text
-
-        queue: list[tuple[str, object]] = [("", record)]
-        while queue:
-            prefix, current = queue.pop(0)
-            if isinstance(current, dict):
-                for raw_key, raw_value in current.items():
-                    if raw_value is None:
-                        continue
-                    key = _normalize_key(str(raw_key))
-                    if not key:
-                        continue
-                    next_prefix = f"{prefix}_{key}" if prefix else key
-                    queue.append((next_prefix, raw_value))
-                continue
-            if isinstance(current, list):
-                for item in current:
-                    if isinstance(item, (dict, list)):
-                        queue.append((prefix, item))
-                    elif prefix:
-                        _set_value(prefix, item)
-                continue
-            if prefix:
-                _set_value(prefix, current)
-        return values
-
-    def _flatten_dict_records(self, obj: object) -> list[dict[str, object]]:
-        queue = [obj]
-        records: list[dict[str, object]] = []
-        while queue:
-            current = queue.pop(0)
-            if isinstance(current, dict):
-                has_scalar_value = any(
-                    value is not None and not isinstance(value, (dict, list)) for value in current.values()
-                )
-                if has_scalar_value:
-                    records.append(current)
-                for value in current.values():
-                    if isinstance(value, (dict, list)):
-                        queue.append(value)
-            elif isinstance(current, list):
-                for value in current:
-                    if isinstance(value, (dict, list)):
-                        queue.append(value)
-        return records
-
-    def _build_alias_index(self, headers: list[str], aliases: dict[str, list[str]]) -> dict[str, int]:
-        index: dict[str, int] = {}
-        header_index = {h: idx for idx, h in enumerate(headers)}
-        for canonical, candidates in aliases.items():
-            for alias in candidates:
-                key = _normalize_key(alias)
-                if key in header_index:
-                    index[canonical] = header_index[key]
-                    break
-        return index
+    def _parsed_records(self, dataset: Dataset, url: str, html: str) -> list[dict[str, str]]:
+        with span("parse", dataset=dataset, workers=self.config.parse_workers) as parsing:
+            parsed = self._parse_records(dataset, url, html)
+            parsing.rows_parsed = len(parsed.rows)
+        if parsed.rows:
+            log_event("INFO", "pl.parse.strategy", dataset=dataset, strategy=parsed.strategy, rows=len(parsed.rows))
+        return parsed.records()
+
+    def _parse_records(self, dataset: Dataset, url: str, html: str) -> ParsedRecords:
+        if self.config.parse_workers <= 0:
+            return parse_page(dataset, html, self.config.parse_strict)
+        return self._submit_parse(dataset, url, html).result()
+
+    def _submit_parse(self, dataset: Dataset, url: str, html: str) -> Future[ParsedRecords]:
+        # The download callback and `load_*` can race to submit the same page; only the first does.
+        with self._parsing_lock:
+            future = self._parsing.get((dataset, url))
+            if future is None:
+                executor = _parse_executor(self.config.parse_workers)
+                future = executor.submit(parse_page, dataset, html, self.config.parse_strict)
+                self._parsing[(dataset, url)] = future
+            return future
+
+    def _parse_when_downloaded(self, dataset: Dataset, url: str, download: Future[str]) -> None:
+        # Unchanged bodies are served from the parsed-payload cache, so they skip the pool.
+        if download.cancelled() or download.exception() is not None or url in self._unchanged_urls:
+            return
+        self._submit_parse(dataset, url, download.result())
 
     def _handle_dataset_issue(self, dataset: Dataset, *, reason: str) -> list[dict[str, str]]:
         policy = self._policy_for(dataset)
@@ -835,4 +1268,8 @@ class PremierLeagueDataSource(DataSource):
             return self.config.dataset_policy_matches
         if dataset == "match_stats":
             return self.config.dataset_policy_match_stats
+        if dataset == "match_events":
+            return self.config.dataset_policy_match_events
+        if dataset == "match_lineups":
+            return self.config.dataset_policy_match_lineups
         return "abort"
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+from crawler.config import SourceConfig
+from crawler.logging_utils import log_event
+from crawler.sources.page_archive import PageArchive
+from crawler.sources.premier_league import PremierLeagueDataSource
+
+
+class ReplayDataSource(PremierLeagueDataSource):
+    """`PremierLeagueDataSource` that reads every page from a `PageArchive` instead of the network.
+
+    URLs are the same `PL_*_URL` settings the archiving crawl used; each resolves to the latest
+    archived body for that URL. Parsing and fallback policies are unchanged, so re-running
+    `ingest-all` against an archive reproduces the crawl with the current parser.
+    """
+
+    def __init__(self, config: SourceConfig) -> None:
+        if not config.archive_dir:
+            raise ValueError("PL_ARCHIVE_DIR is required for CRAWLER_DATA_SOURCE=replay")
+        super().__init__(replace(config, http_cache_dir=None, archive_dir=None, retry_count=1))
+        self._replay = PageArchive(config.archive_dir)
+
+    def _http_get(self, url: str) -> str:
+        entry = self._replay.latest(url)
+        if entry is None:
+            raise FileNotFoundError(f"page not archived: {url}")
+        log_event("INFO", "replay.page", url=url, sha256=entry.sha256, fetched_at=entry.fetched_at)
+        return self._replay.read(entry.sha256)
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from crawler.sources.base import DataSource
-from crawler.sources.types import MatchPayload, MatchStatPayload, PlayerPayload, TeamPayload
+from crawler.sources.types import (
+    EventPayload,
+    LineupPayload,
+    MatchPayload,
+    MatchStatPayload,
+    PlayerPayload,
+    TeamPayload,
+)
 
 
 TEAMS: list[TeamPayload] = [
@@ -104,8 +113,96 @@ MATCH_STATS: list[MatchStatPayload] = [
     },
 ]
 
+MATCH_EVENTS: list[EventPayload] = [
+    {
+        "source_event_id": "1-ARS-CHE-1",
+        "round": 1,
+        "home_team_short_name": "ARS",
+        "away_team_short_name": "CHE",
+        "minute": 24,
+        "event_type": "GOAL",
+        "team_short_name": "ARS",
+        "player_id": 101,
+        "player_name": "Bukayo Saka",
+        "detail": "Right-footed finish",
+    },
+    {
+        "source_event_id": "1-ARS-CHE-2",
+        "round": 1,
+        "home_team_short_name": "ARS",
+        "away_team_short_name": "CHE",
+        "minute": 24,
+        "event_type": "ASSIST",
+        "team_short_name": "ARS",
+        "player_id": 102,
+        "player_name": "Declan Rice",
+        "detail": None,
+    },
+    {
+        "source_event_id": "1-ARS-CHE-3",
+        "round": 1,
+        "home_team_short_name": "ARS",
+        "away_team_short_name": "CHE",
+        "minute": 58,
+        "event_type": "GOAL",
+        "team_short_name": "CHE",
+        "player_id": None,
+        "player_name": "Cole Palmer",
+        "detail": "Header",
+    },
+    {
+        "source_event_id": "1-ARS-CHE-4",
+        "round": 1,
+        "home_team_short_name": "ARS",
+        "away_team_short_name": "CHE",
+        "minute": 77,
+        "event_type": "PENALTY_GOAL",
+        "team_short_name": "ARS",
+        "player_id": 101,
+        "player_name": "Bukayo Saka",
+        "detail": None,
+    },
+]
+
+
+MATCH_LINEUPS: list[LineupPayload] = [
+    {
+        "round": 1,
+        "home_team_short_name": "ARS",
+        "away_team_short_name": "CHE",
+        "team_short_name": "ARS",
+        "player_id": 101,
+    },
+    {
+        "round": 1,
+        "home_team_short_name": "ARS",
+        "away_team_short_name": "CHE",
+        "team_short_name": "ARS",
+        "player_id": 102,
+    },
+]
+
+
+def next_data_fixtures(count: int) -> dict[str, object]:
+    """A `__NEXT_DATA__`-shaped document holding `count` finished fixtures, for flattening tests and benches."""
+    fixtures = [
+        {
+            "matchWeek": idx % 38 + 1,
+            "kickoff": {"label": f"2026-02-{idx % 28 + 1:02d} 20:00:00"},
+            "homeTeam": {"shortName": "ARS", "name": "Arsenal"},
+            "awayTeam": {"shortName": "CHE", "name": "Chelsea"},
+            "score": {"home": idx % 4, "away": idx % 3},
+            "matchStatus": "FINISHED",
+        }
+        for idx in range(count)
+    ]
+    return {"props": {"pageProps": {"fixtures": fixtures}}}
+
 
 class SampleDataSource(DataSource):
+    def prefetch(self, datasets: Iterable[str] | None = None) -> None:
+        return None
+
     def load_teams(self) -> list[TeamPayload]:
         return list(TEAMS)
 
@@ -117,3 +214,9 @@ class SampleDataSource(DataSource):
 
     def load_match_stats(self) -> list[MatchStatPayload]:
         return list(MATCH_STATS)
+
+    def load_match_events(self) -> Iterable[EventPayload]:
+        return iter(MATCH_EVENTS)
+
+    def load_match_lineups(self) -> list[LineupPayload]:
+        return list(MATCH_LINEUPS)
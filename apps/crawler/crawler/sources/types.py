@@ -41,3 +41,24 @@ class MatchStatPayload(TypedDict):
     shots_on_target: int
     fouls: int
     corners: int
+
+
+class LineupPayload(TypedDict):
+    round: int
+    home_team_short_name: str
+    away_team_short_name: str
+    team_short_name: str
+    player_id: int
+
+
+class EventPayload(TypedDict):
+    source_event_id: str | None
+    round: int
+    home_team_short_name: str
+    away_team_short_name: str
+    minute: int
+    event_type: str
+    team_short_name: str | None
+    player_id: int | None
+    player_name: str | None
+    detail: str | None
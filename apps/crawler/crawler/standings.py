@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from crawler.db import Database
+from crawler.ingest import UpsertResult, latest_match_season
+
+POINTS_FOR_WIN = 3
+POINTS_FOR_DRAW = 1
+
+_STANDING_COLUMNS = ("played", "won", "drawn", "lost", "goals_for", "goals_against", "goal_diff", "points")
+
+
+def teams_touched_by(results: dict[str, UpsertResult], db: Database) -> set[int]:
+    """Team ids whose table row may have changed given the upsert results of one ingest run."""
+    team_ids: set[int] = set()
+    match_result = results.get("matches")
+    if match_result is not None:
+        for _season, _round, home_team_id, away_team_id in match_result.changed_keys:
+            team_ids.update((int(home_team_id), int(away_team_id)))
+    team_result = results.get("teams")
+    if team_result is not None and team_result.changed_keys:
+        short_names = {str(key[0]) for key in team_result.changed_keys}
+        for team_id, short_name in db.itertuples("SELECT team_id, short_name FROM teams"):
+            if str(short_name) in short_names:
+                team_ids.add(int(team_id))
+    return team_ids
+
+
+def refresh_standings(
+    db: Database, team_ids: Iterable[int] | None = None, season: int | None = None
+) -> UpsertResult:
+    """Recompute one season's standings rows for `team_ids` from FINISHED matches, then re-rank that table.
+
+    The table holds the clubs with at least one fixture in `season`. `team_ids=None`
+    recomputes every one of them; clubs that have no standings row yet are always included,
+    so the first run after bootstrap (or a backfilled season) fills the whole table. Only rows
+    whose aggregates or rank actually changed are written. `season` defaults to the latest
+    season in `matches`.
+    """
+    season = season if season is not None else latest_match_season(db)
+    marker = "?" if db.config.engine == "sqlite" else "%s"
+    all_team_ids = {
+        int(team_id)
+        for (team_id,) in db.itertuples(
+            f"""
+            SELECT home_team_id FROM matches WHERE season = {marker}
+            UNION
+            SELECT away_team_id FROM matches WHERE season = {marker}
+            """,
+            (season, season),
+        )
+    }
+    current = {int(row["team_id"]): row for row in db.fetchall(_select_standings_sql(db), (season,))}
+
+    affected = set(all_team_ids) if team_ids is None else {int(team_id) for team_id in team_ids}
+    affected |= all_team_ids - set(current)
+    affected &= all_team_ids
+
+    result = UpsertResult()
+    changed_rows: list[tuple] = []
+    for team_id, totals in sorted(_aggregate(db, affected, season).items()):
+        previous = current.get(team_id)
+        if previous is not None and all(int(previous[column]) == totals[column] for column in _STANDING_COLUMNS):
+            result.skipped += 1
+            continue
+        rank = int(previous["rank"]) if previous is not None else 0
+        changed_rows.append((season, team_id, rank, *(totals[column] for column in _STANDING_COLUMNS)))
+        result.changed_keys.add((team_id,))
+        current[team_id] = {"team_id": team_id, "rank": rank, **totals}
+    db.executemany(_upsert_standings_sql(db), changed_rows)
+    result.written = len(changed_rows)
+
+    rank_updates = _rank_updates(db, current)
+    if rank_updates:
+        db.executemany(_update_rank_sql(db), [(rank, season, team_id) for rank, team_id in rank_updates])
+        result.changed_keys.update((team_id,) for _rank, team_id in rank_updates)
+    return result
+
+
+def _aggregate(db: Database, team_ids: set[int], season: int) -> dict[int, dict[str, int]]:
+    totals = {team_id: {column: 0 for column in _STANDING_COLUMNS} for team_id in team_ids}
+    if not team_ids:
+        return totals
+
+    marker = "?" if db.config.engine == "sqlite" else "%s"
+    placeholders = ", ".join(marker for _ in team_ids)
+    sql = f"""
+        SELECT team_id,
+               COUNT(*) AS played,
+               SUM(CASE WHEN goals_for > goals_against THEN 1 ELSE 0 END) AS won,
+               SUM(CASE WHEN goals_for = goals_against THEN 1 ELSE 0 END) AS drawn,
+               SUM(CASE WHEN goals_for < goals_against THEN 1 ELSE 0 END) AS lost,
+               SUM(goals_for) AS goals_for,
+               SUM(goals_against) AS goals_against
+        FROM (
+            SELECT home_team_id AS team_id, home_score AS goals_for, away_score AS goals_against
+            FROM matches
+            WHERE season = {marker} AND status = 'FINISHED' AND home_score IS NOT NULL AND away_score IS NOT NULL
+              AND home_team_id IN ({placeholders})
+            UNION ALL
+            SELECT away_team_id AS team_id, away_score AS goals_for, home_score AS goals_against
+            FROM matches
+            WHERE season = {marker} AND status = 'FINISHED' AND home_score IS NOT NULL AND away_score IS NOT NULL
+              AND away_team_id IN ({placeholders})
+        ) results
+        GROUP BY team_id
+        """
+    ordered = sorted(team_ids)
+    for row in db.fetchall(sql, (season, *ordered, season, *ordered)):
+        won, drawn = int(row["won"]), int(row["drawn"])
+        goals_for, goals_against = int(row["goals_for"]), int(row["goals_against"])
+        totals[int(row["team_id"])] = {
+            "played": int(row["played"]),
+            "won": won,
+            "drawn": drawn,
+            "lost": int(row["lost"]),
+            "goals_for": goals_for,
+            "goals_against": goals_against,
+            "goal_diff": goals_for - goals_against,
+            "points": won * POINTS_FOR_WIN + drawn * POINTS_FOR_DRAW,
+        }
+    return totals
+
+
+def _rank_updates(db: Database, rows: dict[int, dict]) -> list[tuple[int, int]]:
+    short_names = {int(team_id): str(short_name) for team_id, short_name in db.itertuples("SELECT team_id, short_name FROM teams")}
+    ordered = sorted(
+        rows,
+        key=lambda team_id: (
+            -int(rows[team_id]["points"]),
+            -int(rows[team_id]["goal_diff"]),
+            -int(rows[team_id]["goals_for"]),
+            short_names.get(team_id, ""),
+        ),
+    )
+    return [
+        (position, team_id)
+        for position, team_id in enumerate(ordered, start=1)
+        if int(rows[team_id]["rank"]) != position
+    ]
+
+
+def _select_standings_sql(db: Database) -> str:
+    rank, marker = ("rank", "?") if db.config.engine == "sqlite" else ("`rank`", "%s")
+    return f"SELECT team_id, {rank} AS rank, {', '.join(_STANDING_COLUMNS)} FROM standings WHERE season = {marker}"
+
+
+def _upsert_standings_sql(db: Database) -> str:
+    if db.config.engine == "sqlite":
+        return """
+            INSERT INTO standings(season, team_id, rank, played, won, drawn, lost, goals_for, goals_against, goal_diff, points)
+            VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(season, team_id) DO UPDATE SET
+              played=excluded.played,
+              won=excluded.won,
+              drawn=excluded.drawn,
+              lost=excluded.lost,
+              goals_for=excluded.goals_for,
+              goals_against=excluded.goals_against,
+              goal_diff=excluded.goal_diff,
+              points=excluded.points
+            """
+    return """
+        INSERT INTO standings(season, team_id, `rank`, played, won, drawn, lost, goals_for, goals_against, goal_diff, points)
+        VALUES(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+          played=VALUES(played),
+          won=VALUES(won),
+          drawn=VALUES(drawn),
+          lost=VALUES(lost),
+          goals_for=VALUES(goals_for),
+          goals_against=VALUES(goals_against),
+          goal_diff=VALUES(goal_diff),
+          points=VALUES(points)
+        """
+
+
+def _update_rank_sql(db: Database) -> str:
+    if db.config.engine == "sqlite":
+        return "UPDATE standings SET rank = ? WHERE season = ? AND team_id = ?"
+    return "UPDATE standings SET `rank` = %s WHERE season = %s AND team_id = %s"
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from crawler.logging_utils import log_event
+
+
+@dataclass
+class Span:
+    """Counters a stage fills in while its `span()` block runs."""
+
+    stage: str
+    context: dict[str, Any] = field(default_factory=dict)
+    bytes: int = 0
+    rows_parsed: int = 0
+    rows_written: int = 0
+
+
+@dataclass
+class StageTotals:
+    calls: int = 0
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0
+    bytes: int = 0
+    rows_parsed: int = 0
+    rows_written: int = 0
+
+    def add(self, span: Span, wall_ms: float, cpu_ms: float) -> None:
+        self.calls += 1
+        self.wall_ms += wall_ms
+        self.cpu_ms += cpu_ms
+        self.bytes += span.bytes
+        self.rows_parsed += span.rows_parsed
+        self.rows_written += span.rows_written
+
+    def as_dict(self) -> dict[str, float | int]:
+        rows = self.rows_written or self.rows_parsed
+        return {
+            "calls": self.calls,
+            "wall_ms": round(self.wall_ms, 1),
+            "cpu_ms": round(self.cpu_ms, 1),
+            "bytes": self.bytes,
+            "rows_parsed": self.rows_parsed,
+            "rows_written": self.rows_written,
+            "rows_per_sec": round(rows / (self.wall_ms / 1000), 1) if self.wall_ms > 0 else 0.0,
+        }
+
+
+class StageRecorder:
+    """Per-stage totals for one batch run. Spans from prefetch threads add to the same recorder."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.stages: dict[str, StageTotals] = {}
+        self._lock = threading.Lock()
+
+    def add(self, span: Span, wall_ms: float, cpu_ms: float) -> None:
+        with self._lock:
+            self.stages.setdefault(span.stage, StageTotals()).add(span, wall_ms, cpu_ms)
+
+    def summary(self) -> dict[str, object]:
+        with self._lock:
+            stages = {stage: totals.as_dict() for stage, totals in self.stages.items()}
+        return {"elapsed_ms": round((time.perf_counter() - self.started) * 1000, 1), "stages": stages}
+
+
+_recorder: StageRecorder | None = None
+
+
+@contextmanager
+def recording() -> Iterator[StageRecorder]:
+    """Collect every `span()` closed inside the block (from any thread) into one recorder."""
+    global _recorder
+    previous = _recorder
+    _recorder = StageRecorder()
+    try:
+        yield _recorder
+    finally:
+        _recorder = previous
+
+
+@contextmanager
+def span(stage: str, **context: Any) -> Iterator[Span]:
+    """Time a block and log it as a `stage.timing` event.
+
+    Wall time is `perf_counter`; CPU time is `thread_time`, i.e. the calling thread only, so a
+    fetch span waiting on the network shows a low CPU share. The totals roll into the active
+    `recording()`, if any. A span that raises is still logged, with `failed=True`.
+    """
+    current = Span(stage=stage, context=context)
+    wall_started = time.perf_counter()
+    cpu_started = time.thread_time()
+    failed = False
+    try:
+        yield current
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        wall_ms = (time.perf_counter() - wall_started) * 1000
+        cpu_ms = (time.thread_time() - cpu_started) * 1000
+        rows = current.rows_written or current.rows_parsed
+        log_event(
+            "INFO",
+            "stage.timing",
+            stage=stage,
+            **context,
+            wall_ms=round(wall_ms, 1),
+            cpu_ms=round(cpu_ms, 1),
+            bytes=current.bytes,
+            rows_parsed=current.rows_parsed,
+            rows_written=current.rows_written,
+            rows_per_sec=round(rows / (wall_ms / 1000), 1) if wall_ms > 0 else 0.0,
+            **({"failed": True} if failed else {}),
+        )
+        recorder = _recorder
+        if recorder is not None:
+            recorder.add(current, wall_ms, cpu_ms)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Peak Python heap while building the match-id lookup map: fetchall() dicts vs streamed tuples.
+
+Usage:
+    PYTHONPATH=apps/crawler python3 apps/crawler/scripts/bench_fetch_memory.py --matches 100000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from crawler.config import default_season, load_db_config
+from crawler.db import Database
+from crawler.ingest import _match_id_map
+
+TEAM_COUNT = 20
+SEASON = default_season()
+MATCH_SQL = "SELECT match_id, round, home_team_id, away_team_id FROM matches WHERE season = ?"
+
+
+def _seed(db: Database, match_count: int) -> None:
+    db.executemany(
+        "INSERT INTO teams(team_id, name, short_name) VALUES(?, ?, ?)",
+        [(idx, f"Team {idx}", f"T{idx:02d}") for idx in range(1, TEAM_COUNT + 1)],
+    )
+    fixtures = [(home, away) for home in range(1, TEAM_COUNT + 1) for away in range(1, TEAM_COUNT + 1) if home != away]
+    db.executemany(
+        """
+        INSERT INTO matches(season, round, match_date, home_team_id, away_team_id, home_score, away_score, status)
+        VALUES(?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (SEASON, idx // len(fixtures) + 1, "2025-08-10 20:00:00", *fixtures[idx % len(fixtures)], 1, 0, "FINISHED")
+            for idx in range(match_count)
+        ],
+    )
+    db.commit()
+
+
+def _legacy_match_id_map(db: Database) -> dict[tuple[int, int, int], int]:
+    rows = db.fetchall(MATCH_SQL, (SEASON,))
+    return {(int(r["round"]), int(r["home_team_id"]), int(r["away_team_id"])): int(r["match_id"]) for r in rows}
+
+
+def _measure(fn: Callable[[Database], dict], db: Database) -> dict[str, float]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = fn(db)
+    elapsed = time.perf_counter() - started
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {"peak_mb": round(peak / 1024 / 1024, 2), "seconds": round(elapsed, 4)}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark crawler lookup-map memory")
+    parser.add_argument("--matches", type=int, default=100_000, help="Rows in the synthetic matches table.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DB_URL"] = f"sqlite:///{(Path(tmp) / 'bench_fetch.db').as_posix()}"
+        db = Database.connect(load_db_config())
+        try:
+            db.bootstrap()
+            _seed(db, args.matches)
+            legacy = _measure(_legacy_match_id_map, db)
+            streamed = _measure(lambda conn: _match_id_map(conn, SEASON), db)
+        finally:
+            db.close()
+
+    print(
+        json.dumps(
+            {
+                "matches": args.matches,
+                "fetchall_dicts": legacy,
+                "itertuples": streamed,
+                "peak_reduction": round(legacy["peak_mb"] / streamed["peak_mb"], 1) if streamed["peak_mb"] else None,
+            },
+            ensure_ascii=False,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Throughput of mapping a large `__NEXT_DATA__` fixtures payload to flat match records.
+
+Usage:
+    PYTHONPATH=apps/crawler python3 apps/crawler/scripts/bench_json_flatten.py --records 50000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from crawler.sources.premier_league import MATCH_ALIASES, _map_json_candidate
+from crawler.sources.sample_data import next_data_fixtures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark PL JSON record flattening")
+    parser.add_argument("--records", type=int, default=50_000, help="Fixtures in the payload.")
+    args = parser.parse_args(argv)
+
+    payload = next_data_fixtures(args.records)
+    started = time.perf_counter()
+    mapped = _map_json_candidate(payload, MATCH_ALIASES, ["round"])
+    elapsed = time.perf_counter() - started
+    assert len(mapped) == args.records
+
+    print(
+        json.dumps(
+            {
+                "records": args.records,
+                "seconds": round(elapsed, 3),
+                "records_per_sec": round(args.records / elapsed) if elapsed else None,
+            },
+            ensure_ascii=False,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Compare the legacy per-brace JSON span scan with the single-pass scanner on a large page.
+
+The page is the `matches_official.html` fixture with `__NEXT_DATA__` grown to `--size-mb` and
+`--js-kb` of inline script (handlers, string literals with braces, a few unclosed blocks) around it.
+
+Usage:
+    PYTHONPATH=apps/crawler python3 apps/crawler/scripts/bench_json_scan.py --size-mb 3 --js-kb 256
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from crawler.sources.premier_league import _extract_inline_json_objects, parse_document
+
+FIXTURE = ROOT / "tests" / "fixtures" / "premier_league" / "matches_official.html"
+
+
+JS_LINES = (
+    "function onLoad(e){if(e&&e.detail){track('load',{id:e.detail.id})}}",
+    "var label = '{' + team + '}'; var quote = \"it's a \\\"derby\\\"\";",
+    "window.dataLayer = window.dataLayer || []; dataLayer.push({event: 'view', page: 'fixtures'});",
+    "if (typeof window.PULSE === 'undefined') {",
+    "for (var i = 0; i < items.length; i++) { render(items[i], {compact: true}); }",
+    "var cfg = {retry: [1, 2, 4], endpoints: {api: '/api/v1'}};",
+)
+
+
+def _js_noise(size_kb: int) -> str:
+    lines: list[str] = []
+    approx = 0
+    while approx < size_kb * 1024:
+        for line in JS_LINES:
+            lines.append(line)
+            approx += len(line) + 1
+    return "\n".join(lines) + "\n"
+
+
+def _synthetic_page(size_mb: float, js_kb: int) -> str:
+    html = FIXTURE.read_text(encoding="utf-8")
+    match = re.search(r"window\.__NEXT_DATA__\s*=\s*(\{.*\});", html, re.S)
+    if match is None:
+        raise SystemExit(f"__NEXT_DATA__ not found in {FIXTURE}")
+    payload = json.loads(match.group(1))
+    template = payload["props"]["pageProps"]["fixtures"]
+    fixtures: list[object] = []
+    target = int(size_mb * 1024 * 1024)
+    approx = 0
+    while approx < target:
+        for item in template:
+            fixtures.append(item)
+            approx += len(json.dumps(item, indent=2))
+    payload["props"]["pageProps"]["fixtures"] = fixtures
+    noise = _js_noise(js_kb)
+    data = html[match.start() : match.start(1)] + json.dumps(payload, indent=2) + ";\n"
+    return html[: match.start()] + noise + data + noise + html[match.end() :]
+
+
+def _legacy_extract_balanced(text: str, start: int) -> str | None:
+    stack = ["}" if text[start] == "{" else "]"]
+    in_string = False
+    escaped = False
+    for idx in range(start + 1, len(text)):
+        char = text[idx]
+        if escaped:
+            escaped = False
+            continue
+        if char == "\\":
+            escaped = True
+            continue
+        if char == '"':
+            in_string = not in_string
+            continue
+        if in_string:
+            continue
+        if char == "{":
+            stack.append("}")
+            continue
+        if char == "[":
+            stack.append("]")
+            continue
+        if char == stack[-1]:
+            stack.pop()
+            if not stack:
+                return text[start : idx + 1]
+    return None
+
+
+def _legacy_inline_json_objects(script_block: str) -> list[object]:
+    values: list[object] = []
+    for opening in ("{", "["):
+        start = 0
+        while start < len(script_block):
+            idx = script_block.find(opening, start)
+            if idx < 0:
+                break
+            raw = _legacy_extract_balanced(script_block, idx)
+            start = idx + 1
+            if raw is None:
+                continue
+            try:
+                values.append(json.loads(raw))
+            except json.JSONDecodeError:
+                continue
+    return values
+
+
+def _timed(fn, *args) -> tuple[float, object]:
+    started = time.perf_counter()
+    value = fn(*args)
+    return time.perf_counter() - started, value
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark inline JSON span scanning on a large PL page")
+    parser.add_argument("--size-mb", type=float, default=3.0, help="Approximate __NEXT_DATA__ size.")
+    parser.add_argument("--js-kb", type=int, default=256, help="Inline script before and after the JSON.")
+    parser.add_argument("--skip-legacy", action="store_true", help="Only time the single-pass scanner.")
+    args = parser.parse_args(argv)
+
+    html = _synthetic_page(args.size_mb, args.js_kb)
+    block = parse_document([html]).script_blocks[0]
+
+    results: dict[str, object] = {"bytes": len(html)}
+    new_seconds, new_values = _timed(_extract_inline_json_objects, block)
+    results["single_pass_seconds"] = round(new_seconds, 4)
+    results["single_pass_values"] = len(new_values)  # type: ignore[arg-type]
+    if not args.skip_legacy:
+        legacy_seconds, legacy_values = _timed(_legacy_inline_json_objects, block)
+        results["legacy_seconds"] = round(legacy_seconds, 4)
+        results["legacy_values"] = len(legacy_values)  # type: ignore[arg-type]
+        results["speedup"] = round(legacy_seconds / new_seconds, 1) if new_seconds else None
+    print(json.dumps(results, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Multi-page crawl throughput with in-process parsing vs the parse process pool.
+
+Writes `--pages` synthetic fixture pages (an inline `__NEXT_DATA__` payload each), then for every
+worker count loads them all the way a backfill or season crawl does: one source per page, all
+pages prefetched, then `load_matches()` on each. Speedup is relative to `parse_workers=0`.
+
+Usage:
+    PYTHONPATH=apps/crawler python3 apps/crawler/scripts/bench_parse_pool.py --pages 64 --workers 1 2 4 8
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from crawler.config import SourceConfig
+from crawler.sources.premier_league import PremierLeagueDataSource, _parse_executor, parse_page
+
+TEAMS = ("ARS", "AVL", "BOU", "BRE", "BHA", "CHE", "CRY", "EVE", "FUL", "LIV")
+
+
+def _page(page_no: int, fixtures: int) -> str:
+    payload = {
+        "props": {
+            "pageProps": {
+                "fixtures": [
+                    {
+                        "matchWeek": page_no % 38 + 1,
+                        "kickoff": {"label": f"2025-{idx % 9 + 1:02d}-{idx % 28 + 1:02d} 15:00:00"},
+                        "homeTeam": {"shortName": TEAMS[idx % len(TEAMS)], "name": f"Club {idx % len(TEAMS)}"},
+                        "awayTeam": {"shortName": TEAMS[(idx + 1) % len(TEAMS)], "name": "Away"},
+                        "score": {"home": idx % 4, "away": idx % 3},
+                        "matchStatus": "FINISHED",
+                        "venue": {"name": "Stadium", "city": {"name": "London"}},
+                    }
+                    for idx in range(fixtures)
+                ]
+            }
+        }
+    }
+    return f"<html><body><script>window.__NEXT_DATA__ = {json.dumps(payload)};</script></body></html>"
+
+
+def _config(parse_workers: int) -> SourceConfig:
+    return SourceConfig(
+        source="pl",
+        teams_url="",
+        players_url="",
+        matches_url="",
+        match_stats_url="",
+        timeout_seconds=5,
+        verify_ssl=True,
+        ca_file=None,
+        retry_count=1,
+        retry_backoff_seconds=0.0,
+        parse_strict=False,
+        dataset_policy_teams="skip",
+        dataset_policy_players="skip",
+        dataset_policy_matches="abort",
+        dataset_policy_match_stats="skip",
+        teams_seed_fallback=False,
+        matches_seed_fallback=False,
+        fetch_concurrency=4,
+        parse_workers=parse_workers,
+    )
+
+
+def _crawl(urls: list[str], parse_workers: int) -> tuple[float, int]:
+    base = _config(parse_workers)
+    sources = [PremierLeagueDataSource(replace(base, matches_url=url)) for url in urls]
+    started = time.perf_counter()
+    for source in sources:
+        source.prefetch(["matches"])
+    rows = sum(len(source.load_matches()) for source in sources)
+    return time.perf_counter() - started, rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark PL page parsing across worker processes")
+    parser.add_argument("--pages", type=int, default=64, help="Fixture pages to crawl.")
+    parser.add_argument("--fixtures", type=int, default=400, help="Fixtures per page.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="parse_workers values to time.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        urls = []
+        for page_no in range(args.pages):
+            path = Path(tmp) / f"fixtures_{page_no}.html"
+            path.write_text(_page(page_no, args.fixtures), encoding="utf-8")
+            urls.append(path.as_uri())
+
+        sys.stdout = open(os.devnull, "w")  # silence per-page log events while timing
+        try:
+            baseline, rows = _crawl(urls, 0)
+            runs: dict[str, dict[str, float]] = {}
+            for workers in args.workers:
+                # Spawn the pool and import the parser in every worker before timing.
+                executor = _parse_executor(workers)
+                list(executor.map(parse_page, ["matches"] * workers, ["<html></html>"] * workers))
+                seconds, worker_rows = _crawl(urls, workers)
+                assert worker_rows == rows
+                runs[str(workers)] = {
+                    "seconds": round(seconds, 3),
+                    "pages_per_sec": round(args.pages / seconds, 1),
+                    "speedup": round(baseline / seconds, 2),
+                }
+        finally:
+            sys.stdout.close()
+            sys.stdout = sys.__stdout__
+
+    print(
+        json.dumps(
+            {
+                "cpu_count": os.cpu_count(),
+                "pages": args.pages,
+                "rows": rows,
+                "in_process": {"seconds": round(baseline, 3), "pages_per_sec": round(args.pages / baseline, 1)},
+                "parse_workers": runs,
+            },
+            ensure_ascii=False,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from crawler.config import SourceConfig, load_db_config
+from crawler.db import Database
+
+
+@pytest.fixture()
+def make_source_config() -> Callable[..., SourceConfig]:
+    """Factory for a `pl` `SourceConfig` that fails fast; keyword arguments override any field."""
+
+    def _make(**overrides: Any) -> SourceConfig:
+        defaults: dict[str, Any] = {
+            "source": "pl",
+            "teams_url": "https://example.com/teams",
+            "players_url": "https://example.com/players",
+            "matches_url": "https://example.com/matches",
+            "match_stats_url": "https://example.com/match-stats",
+            "timeout_seconds": 1,
+            "verify_ssl": True,
+            "ca_file": None,
+            "retry_count": 1,
+            "retry_backoff_seconds": 0.0,
+            "parse_strict": False,
+            "dataset_policy_teams": "abort",
+            "dataset_policy_players": "skip",
+            "dataset_policy_matches": "abort",
+            "dataset_policy_match_stats": "skip",
+            "teams_seed_fallback": False,
+            "matches_seed_fallback": False,
+        }
+        return SourceConfig(**{**defaults, **overrides})
+
+    return _make
+
+
+@pytest.fixture()
+def connect_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Callable[[str], Database]:
+    """Factory that points `DB_URL` at `tmp_path / name` and returns the bootstrapped sqlite database."""
+
+    def _connect(name: str) -> Database:
+        monkeypatch.setenv("DB_URL", f"sqlite:///{(tmp_path / name).as_posix()}")
+        db = Database.connect(load_db_config())
+        db.bootstrap()
+        return db
+
+    return _connect
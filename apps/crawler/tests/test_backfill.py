@@ -0,0 +1,227 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from crawler import backfill
+from crawler.backfill import ShardResult, parse_range, plan_shards, run_backfill
+from crawler.config import BackfillConfig, SourceConfig
+from crawler.db import Database
+from crawler.ingest import upsert_teams
+from crawler.sources.sample_data import TEAMS
+
+
+def _backfill_config(
+    matches_url_template: str = "", flush_rows: int = 1000, match_stats_url_template: str = ""
+) -> BackfillConfig:
+    return BackfillConfig(
+        matches_url_template=matches_url_template,
+        match_stats_url_template=match_stats_url_template,
+        match_events_url_template="",
+        workers=0,
+        flush_rows=flush_rows,
+    )
+
+
+def _with_teams(db: Database) -> Database:
+    upsert_teams(db, TEAMS)
+    db.commit()
+    return db
+
+
+def _checkpoints(db: Database) -> list[tuple]:
+    return list(db.itertuples("SELECT season, round, matches FROM backfill_checkpoints ORDER BY season, round"))
+
+
+def test_parse_range_and_plan_shards_skip_checkpoints() -> None:
+    assert parse_range("2023-2024") == range(2023, 2025)
+    assert parse_range("7") == range(7, 8)
+    with pytest.raises(ValueError):
+        parse_range("2024-2023")
+
+    assert plan_shards(range(2023, 2025), range(1, 3), {(2023, 2)}) == [(2023, 1), (2024, 1), (2024, 2)]
+
+
+def test_backfill_writes_each_season_and_resumes_from_checkpoints(
+    connect_db: Callable[[str], Database], make_source_config: Callable[..., SourceConfig]
+) -> None:
+    sample = make_source_config(source="sample")
+    db = _with_teams(connect_db("backfill.db"))
+    try:
+        first = run_backfill(
+            db, range(2023, 2025), range(1, 3), source_config=sample, backfill_config=_backfill_config()
+        )
+        second = run_backfill(
+            db, range(2023, 2025), range(1, 3), source_config=sample, backfill_config=_backfill_config()
+        )
+        seasons = dict(db.itertuples("SELECT season, COUNT(*) FROM matches GROUP BY season"))
+        standings = dict(db.itertuples("SELECT season, COUNT(*) FROM standings GROUP BY season"))
+        checkpoints = _checkpoints(db)
+    finally:
+        db.close()
+
+    assert first["matches"].written == 4
+    assert first["standings"].written == 6
+    assert all(result.written == 0 for result in second.values())
+    assert seasons == {2023: 2, 2024: 2}
+    assert standings == {2023: 3, 2024: 3}
+    assert checkpoints == [(2023, 1, 2), (2023, 2, 0), (2024, 1, 2), (2024, 2, 0)]
+
+
+def test_backfill_keeps_finished_shards_when_a_shard_fails(
+    connect_db: Callable[[str], Database],
+    make_source_config: Callable[..., SourceConfig],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sample = make_source_config(source="sample")
+    db = _with_teams(connect_db("backfill_resume.db"))
+    original = backfill.load_shard
+    loaded: list[tuple[int, int]] = []
+
+    def flaky(source: SourceConfig, config: BackfillConfig, shard: tuple[int, int]) -> ShardResult:
+        if shard == (2024, 1) and not loaded:
+            raise RuntimeError("network down")
+        return original(source, config, shard)
+
+    def record(source: SourceConfig, config: BackfillConfig, shard: tuple[int, int]) -> ShardResult:
+        loaded.append(shard)
+        return original(source, config, shard)
+
+    try:
+        monkeypatch.setattr(backfill, "load_shard", flaky)
+        with pytest.raises(RuntimeError):
+            run_backfill(db, range(2023, 2025), range(1, 2), source_config=sample, backfill_config=_backfill_config())
+        after_failure = _checkpoints(db)
+
+        monkeypatch.setattr(backfill, "load_shard", record)
+        run_backfill(db, range(2023, 2025), range(1, 2), source_config=sample, backfill_config=_backfill_config())
+        after_resume = _checkpoints(db)
+    finally:
+        db.close()
+
+    assert after_failure == [(2023, 1, 2)]
+    assert loaded == [(2024, 1)]
+    assert after_resume == [(2023, 1, 2), (2024, 1, 2)]
+
+
+def test_backfill_derives_each_season_with_its_checkpoints(
+    connect_db: Callable[[str], Database],
+    make_source_config: Callable[..., SourceConfig],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sample = make_source_config(source="sample")
+    db = _with_teams(connect_db("backfill_killed.db"))
+    original = backfill.load_shard
+
+    def killed(source: SourceConfig, config: BackfillConfig, shard: tuple[int, int]) -> ShardResult:
+        if shard == (2024, 1):
+            raise KeyboardInterrupt
+        return original(source, config, shard)
+
+    def standings() -> dict[int, int]:
+        return dict(db.itertuples("SELECT season, COUNT(*) FROM standings GROUP BY season"))
+
+    try:
+        monkeypatch.setattr(backfill, "load_shard", killed)
+        with pytest.raises(KeyboardInterrupt):
+            run_backfill(
+                db,
+                range(2023, 2025),
+                range(1, 2),
+                source_config=sample,
+                backfill_config=_backfill_config(flush_rows=1),
+            )
+        after_kill = (_checkpoints(db), standings())
+
+        monkeypatch.setattr(backfill, "load_shard", original)
+        run_backfill(db, range(2023, 2025), range(1, 2), source_config=sample, backfill_config=_backfill_config())
+        after_resume = standings()
+    finally:
+        db.close()
+
+    assert after_kill == ([(2023, 1, 2)], {2023: 3})
+    assert after_resume == {2023: 3, 2024: 3}
+
+
+def _write_round_page(directory: Path, season: int, round_no: int, fixtures: list[tuple[str, str, int, int]]) -> None:
+    rows = "".join(
+        f"<tr><td>{round_no}</td><td>{season}-08-{10 + round_no} 15:00:00</td><td>{home}</td><td>{away}</td>"
+        f"<td>{home_score}</td><td>{away_score}</td><td>FINISHED</td></tr>"
+        for home, away, home_score, away_score in fixtures
+    )
+    (directory / f"matches_{season}_{round_no}.html").write_text(
+        "<html><body><table>"
+        "<tr><th>Round</th><th>Date</th><th>Home Team</th><th>Away Team</th>"
+        "<th>Home Score</th><th>Away Score</th><th>Status</th></tr>"
+        f"{rows}</table></body></html>",
+        encoding="utf-8",
+    )
+
+
+def test_backfill_parses_shards_in_worker_processes(
+    tmp_path: Path, connect_db: Callable[[str], Database], make_source_config: Callable[..., SourceConfig]
+) -> None:
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    for season in (2022, 2023):
+        _write_round_page(pages, season, 1, [("ARS", "CHE", 2, 0), ("LIV", "MCI", 1, 1)])
+        _write_round_page(pages, season, 2, [("CHE", "LIV", 0, 3)])
+    template = f"{pages.as_uri()}/matches_{{season}}_{{round}}.html"
+    db = _with_teams(connect_db("backfill_pool.db"))
+    try:
+        results = run_backfill(
+            db,
+            range(2022, 2024),
+            range(1, 3),
+            workers=2,
+            source_config=make_source_config(),
+            backfill_config=_backfill_config(template, flush_rows=2),
+        )
+        rows = list(
+            db.itertuples(
+                """
+                SELECT m.season, m.round, h.short_name, a.short_name
+                FROM matches m
+                JOIN teams h ON h.team_id = m.home_team_id
+                JOIN teams a ON a.team_id = m.away_team_id
+                ORDER BY m.season, m.round, h.short_name
+                """
+            )
+        )
+        checkpoints = _checkpoints(db)
+    finally:
+        db.close()
+
+    assert results["matches"].written == 4
+    assert rows == [
+        (2022, 1, "ARS", "CHE"),
+        (2022, 2, "CHE", "LIV"),
+        (2023, 1, "ARS", "CHE"),
+        (2023, 2, "CHE", "LIV"),
+    ]
+    # Round 1 names MCI, which is not in `teams`, so it stays open for a later run.
+    assert checkpoints == [(2022, 2, 1), (2023, 2, 1)]
+
+
+def test_backfill_leaves_a_shard_open_when_a_configured_dataset_fails(
+    tmp_path: Path, connect_db: Callable[[str], Database], make_source_config: Callable[..., SourceConfig]
+) -> None:
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    _write_round_page(pages, 2023, 1, [("ARS", "CHE", 2, 0)])
+    config = _backfill_config(
+        f"{pages.as_uri()}/matches_{{season}}_{{round}}.html",
+        match_stats_url_template=f"{pages.as_uri()}/missing_stats_{{season}}_{{round}}.html",
+    )
+    db = _with_teams(connect_db("backfill_partial.db"))
+    try:
+        # The default config skips match_stats failures; a backfill shard must not.
+        with pytest.raises(ValueError, match="match_stats parse failed"):
+            run_backfill(db, range(2023, 2024), range(1, 2), source_config=make_source_config(), backfill_config=config)
+        checkpoints = _checkpoints(db)
+        matches = db.fetchone("SELECT COUNT(*) AS n FROM matches")
+    finally:
+        db.close()
+
+    assert checkpoints == []
+    assert matches == {"n": 0}
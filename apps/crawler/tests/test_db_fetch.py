@@ -0,0 +1,48 @@
+from collections.abc import Callable
+
+from crawler.db import Database
+
+
+def _with_teams(db: Database) -> Database:
+    db.executemany(
+        "INSERT INTO teams(team_id, name, short_name) VALUES(?, ?, ?)",
+        [(idx, f"Team {idx}", f"T{idx:02d}") for idx in range(1, 8)],
+    )
+    return db
+
+
+def test_fetchone_returns_first_row_without_reading_the_rest(connect_db: Callable[[str], Database]) -> None:
+    db = _with_teams(connect_db("fetchone.db"))
+    try:
+        row = db.fetchone("SELECT team_id, short_name FROM teams ORDER BY team_id")
+        missing = db.fetchone("SELECT team_id FROM teams WHERE team_id = ?", (99,))
+    finally:
+        db.close()
+
+    assert row == {"team_id": 1, "short_name": "T01"}
+    assert missing is None
+
+
+def test_iterfetch_pulls_rows_in_chunks(connect_db: Callable[[str], Database]) -> None:
+    db = _with_teams(connect_db("iterfetch.db"))
+    try:
+        rows = db.iterfetch("SELECT team_id FROM teams ORDER BY team_id", size=3)
+        first = next(rows)
+        rest = list(rows)
+    finally:
+        db.close()
+
+    assert first == {"team_id": 1}
+    assert [row["team_id"] for row in rest] == [2, 3, 4, 5, 6, 7]
+
+
+def test_itertuples_yields_plain_tuples_and_keeps_dict_rows_elsewhere(connect_db: Callable[[str], Database]) -> None:
+    db = _with_teams(connect_db("itertuples.db"))
+    try:
+        rows = list(db.itertuples("SELECT team_id, short_name FROM teams WHERE team_id <= ?", (2,), size=1))
+        after = db.fetchall("SELECT team_id FROM teams WHERE team_id = 1")
+    finally:
+        db.close()
+
+    assert rows == [(1, "T01"), (2, "T02")]
+    assert after == [{"team_id": 1}]
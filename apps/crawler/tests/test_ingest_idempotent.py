@@ -1,6 +1,9 @@
 import os
+from collections.abc import Callable
 from pathlib import Path
 
+import pytest
+
 from crawler.cli import main
 from crawler.config import load_db_config
 from crawler.db import Database
@@ -38,3 +41,61 @@ def test_ingest_all_is_idempotent(tmp_path: Path) -> None:
     assert first["players"] >= 1
     assert first["matches"] >= 1
     assert first["match_stats"] >= 1
+
+
+def test_executemany_splits_rows_into_batches(connect_db: Callable[[str], Database]) -> None:
+    db = connect_db("batched.db")
+    try:
+        rows = [(f"Team {idx}", f"T{idx:02d}", "", "", "") for idx in range(7)]
+        affected = db.executemany(
+            "INSERT INTO teams(name, short_name, logo_url, stadium, manager) VALUES(?, ?, ?, ?, ?)",
+            rows,
+            batch_size=3,
+        )
+        db.commit()
+        assert affected == 7
+        assert summary(db)["teams"] == 7
+    finally:
+        db.close()
+
+
+def test_incremental_ingest_writes_only_changed_rows(
+    connect_db: Callable[[str], Database], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from crawler.ingest import upsert_matches, upsert_teams
+    from crawler.sources.sample_data import MATCHES, TEAMS
+
+    monkeypatch.delenv("CRAWLER_INCREMENTAL_INGEST", raising=False)
+    db = connect_db("incremental.db")
+    try:
+        upsert_teams(db, list(TEAMS))
+        first = upsert_matches(db, list(MATCHES))
+        assert (first.written, first.skipped) == (len(MATCHES), 0)
+
+        updated = [dict(match) for match in MATCHES]
+        updated[1].update(home_score=3, away_score=0, status="FINISHED")
+        second = upsert_matches(db, updated)
+        db.commit()
+
+        assert (second.written, second.skipped) == (1, len(MATCHES) - 1)
+        assert len(second.changed_keys) == 1
+        counts = summary(db, {"matches": second})
+        assert counts["matches"] == len(MATCHES)
+        assert counts["matches_written"] == 1
+    finally:
+        db.close()
+
+
+def test_data_version_bumps_only_when_rows_are_written(tmp_path: Path) -> None:
+    db_path = tmp_path / "data_version.db"
+    _run_ingest_all_with_sqlite(db_path)
+    _run_ingest_all_with_sqlite(db_path)
+
+    db = Database.connect(load_db_config())
+    try:
+        row = db.fetchone("SELECT version FROM data_version WHERE id = 1")
+    finally:
+        db.close()
+
+    assert row is not None
+    assert row["version"] == 1
@@ -0,0 +1,180 @@
+from collections.abc import Callable
+
+import pytest
+
+from crawler.config import SourceConfig
+from crawler.db import Database
+from crawler.ingest import upsert_match_events, upsert_matches, upsert_players, upsert_teams
+from crawler.player_stats import players_touched_by, refresh_player_season_stats
+from crawler.sources.premier_league import PremierLeagueDataSource
+from crawler.sources.sample_data import MATCH_EVENTS, MATCHES, PLAYERS, TEAMS
+from crawler.sources.types import EventPayload
+
+
+def _seed(db: Database) -> Database:
+    upsert_teams(db, TEAMS)
+    upsert_players(db, PLAYERS)
+    upsert_matches(db, MATCHES)
+    return db
+
+
+def _event(minute: int, event_type: str, player_name: str, source_event_id: str | None = None) -> EventPayload:
+    return {
+        "source_event_id": source_event_id,
+        "round": 1,
+        "home_team_short_name": "ARS",
+        "away_team_short_name": "CHE",
+        "minute": minute,
+        "event_type": event_type,
+        "team_short_name": "ARS",
+        "player_id": None,
+        "player_name": player_name,
+        "detail": None,
+    }
+
+
+def _event_count(db: Database) -> int:
+    row = db.fetchone("SELECT COUNT(*) AS cnt FROM match_events")
+    return int(row["cnt"]) if row else 0
+
+
+def test_upsert_match_events_skips_events_already_stored(connect_db: Callable[[str], Database]) -> None:
+    db = _seed(connect_db("events.db"))
+    try:
+        first = upsert_match_events(db, iter(MATCH_EVENTS))
+        second = upsert_match_events(db, iter(MATCH_EVENTS))
+        count = _event_count(db)
+        credited = db.fetchone("SELECT COUNT(*) AS cnt FROM match_events WHERE player_id = 101")
+    finally:
+        db.close()
+
+    assert (first.written, first.skipped) == (len(MATCH_EVENTS), 0)
+    assert len(first.changed_keys) == 1
+    assert (second.written, second.skipped) == (0, len(MATCH_EVENTS))
+    assert not second.changed_keys
+    assert count == len(MATCH_EVENTS)
+    assert credited is not None and int(credited["cnt"]) == 2
+
+
+def test_upsert_match_events_dedupes_by_fields_without_source_id(connect_db: Callable[[str], Database]) -> None:
+    db = _seed(connect_db("events_fallback.db"))
+    try:
+        upsert_match_events(db, [_event(10, "GOAL", "Bukayo Saka", source_event_id="evt-1")])
+        result = upsert_match_events(
+            db,
+            [
+                _event(10, "GOAL", "Bukayo Saka"),
+                _event(33, "YELLOW_CARD", "Declan Rice"),
+                _event(33, "YELLOW_CARD", "Declan Rice"),
+            ],
+        )
+        count = _event_count(db)
+    finally:
+        db.close()
+
+    assert (result.written, result.skipped) == (1, 2)
+    assert count == 2
+
+
+def test_upsert_match_events_streams_in_batches(
+    connect_db: Callable[[str], Database], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("DB_BATCH_SIZE", "2")
+    db = _seed(connect_db("events_batched.db"))
+    flushed: list[int] = []
+    consumed: list[int] = []
+    original = db.executemany
+
+    def record(sql: str, rows, batch_size=None) -> int:
+        if "match_events" in sql:
+            flushed.append(len(rows))
+            assert len(consumed) == sum(flushed) or not rows
+        return original(sql, rows, batch_size)
+
+    def feed():
+        for minute in range(1, 6):
+            consumed.append(minute)
+            yield _event(minute, "SHOT", "Bukayo Saka")
+
+    monkeypatch.setattr(db, "executemany", record)
+    try:
+        result = upsert_match_events(db, feed())
+    finally:
+        db.close()
+
+    assert result.written == 5
+    assert flushed == [2, 2, 1]
+
+
+def test_ingested_events_feed_player_season_stats(connect_db: Callable[[str], Database]) -> None:
+    db = _seed(connect_db("events_stats.db"))
+    try:
+        results = {"match_events": upsert_match_events(db, iter(MATCH_EVENTS))}
+        refresh_player_season_stats(db, players_touched_by(results, db))
+        rows = db.fetchall("SELECT player_id, goals, assists FROM player_season_stats ORDER BY player_id")
+    finally:
+        db.close()
+
+    assert [tuple(row.values()) for row in rows] == [(101, 2, 0), (102, 0, 1)]
+
+
+def test_premierleague_parse_match_events_from_json(
+    monkeypatch: pytest.MonkeyPatch, make_source_config: Callable[..., SourceConfig]
+) -> None:
+    source = PremierLeagueDataSource(make_source_config(match_events_url="https://example.com/match-events"))
+    html = """
+    <html><body><script type="application/json">
+      {"events": [
+        {"eventId": "e-1", "matchWeek": 24, "homeTeam": {"shortName": "ARS"}, "awayTeam": {"shortName": "CHE"},
+         "clock": {"label": "45+2'"}, "type": "Penalty Goal", "team": {"shortName": "ARS"},
+         "playerId": 101, "scorer": "Bukayo Saka"}
+      ]}
+    </script></body></html>
+    """
+    monkeypatch.setattr(source, "_http_get", lambda _: html)
+
+    events = source.load_match_events()
+
+    assert events == [
+        {
+            "source_event_id": "e-1",
+            "round": 24,
+            "home_team_short_name": "ARS",
+            "away_team_short_name": "CHE",
+            "minute": 45,
+            "event_type": "PENALTY_GOAL",
+            "team_short_name": "ARS",
+            "player_id": 101,
+            "player_name": "Bukayo Saka",
+            "detail": None,
+        }
+    ]
+
+
+def test_premierleague_match_events_disabled_without_url(make_source_config: Callable[..., SourceConfig]) -> None:
+    assert PremierLeagueDataSource(make_source_config()).load_match_events() == []
+
+
+def test_upsert_match_events_matches_sourced_events_to_stored_rows_without_id(
+    connect_db: Callable[[str], Database],
+) -> None:
+    db = _seed(connect_db("events_mixed.db"))
+    try:
+        upsert_match_events(db, [_event(10, "GOAL", "Bukayo Saka"), _event(33, "YELLOW_CARD", "Declan Rice")])
+        result = upsert_match_events(
+            db,
+            [
+                _event(10, "GOAL", "Bukayo Saka", source_event_id="evt-1"),
+                _event(33, "YELLOW_CARD", "Declan Rice", source_event_id="evt-2"),
+                _event(33, "YELLOW_CARD", "Declan Rice", source_event_id="evt-2"),
+                _event(71, "GOAL", "Kai Havertz", source_event_id="evt-3"),
+                _event(71, "GOAL", "Kai Havertz", source_event_id="evt-4"),
+                _event(71, "GOAL", "Kai Havertz"),
+            ],
+        )
+        count = _event_count(db)
+    finally:
+        db.close()
+
+    assert (result.written, result.skipped) == (2, 4)
+    assert count == 4
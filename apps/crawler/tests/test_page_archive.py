@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import gzip
+import shutil
+from collections.abc import Callable
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from crawler.config import SourceConfig
+from crawler.sources.page_archive import PageArchive
+from crawler.sources.premier_league import PremierLeagueDataSource
+from crawler.sources.replay import ReplayDataSource
+
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "premier_league"
+
+
+def _page_urls(pages: Path) -> dict[str, str]:
+    return {
+        "teams_url": (pages / "teams_official.html").as_uri(),
+        "players_url": (pages / "teams_official.html").as_uri(),
+        "matches_url": (pages / "matches_official.html").as_uri(),
+        "match_stats_url": (pages / "match_stats_official.html").as_uri(),
+    }
+
+
+def test_archive_stores_each_body_once_and_serves_latest(tmp_path: Path) -> None:
+    archive = PageArchive(tmp_path / "archive")
+
+    first = archive.put("https://example.com/clubs", "<html>v1</html>", fetched_at="2025-08-01T00:00:00Z")
+    archive.put("https://example.com/clubs", "<html>v1</html>", fetched_at="2025-08-02T00:00:00Z")
+    archive.put("https://example.com/other", "<html>v1</html>")
+    latest = archive.put("https://example.com/clubs", "<html>v2</html>", fetched_at="2025-08-03T00:00:00Z")
+
+    objects = sorted((tmp_path / "archive" / "objects").rglob("*.gz"))
+    assert [path.stem for path in objects] == sorted([first.sha256, latest.sha256])
+    assert gzip.decompress(objects[0].read_bytes()).decode("utf-8").startswith("<html>v")
+    assert len(list(archive.entries())) == 4
+
+    reopened = PageArchive(tmp_path / "archive")
+    assert reopened.get("https://example.com/clubs") == "<html>v2</html>"
+    assert reopened.latest("https://example.com/clubs").fetched_at == "2025-08-03T00:00:00Z"
+    assert reopened.read(first.sha256) == "<html>v1</html>"
+    assert reopened.get("https://example.com/missing") is None
+
+
+def test_replay_reproduces_archived_crawl_without_the_pages(
+    tmp_path: Path, make_source_config: Callable[..., SourceConfig]
+) -> None:
+    pages = tmp_path / "pages"
+    shutil.copytree(FIXTURE_DIR, pages)
+    archive_dir = tmp_path / "archive"
+
+    config = make_source_config(**_page_urls(pages), archive_dir=str(archive_dir))
+    crawled = PremierLeagueDataSource(config)
+    expected = (crawled.load_teams(), crawled.load_matches(), crawled.load_match_stats())
+    shutil.rmtree(pages)
+
+    replayed = ReplayDataSource(replace(config, source="replay"))
+    assert (replayed.load_teams(), replayed.load_matches(), replayed.load_match_stats()) == expected
+    assert expected[1]
+
+
+def test_replay_requires_archive_dir_and_archived_pages(
+    tmp_path: Path, make_source_config: Callable[..., SourceConfig]
+) -> None:
+    config = make_source_config(**_page_urls(tmp_path / "pages"), source="replay", archive_dir=str(tmp_path / "empty"))
+    with pytest.raises(ValueError):
+        ReplayDataSource(replace(config, archive_dir=None))
+    with pytest.raises(ValueError, match="matches parse failed"):
+        ReplayDataSource(config).load_matches()
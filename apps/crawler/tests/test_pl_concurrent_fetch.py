@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from crawler.config import SourceConfig
+from crawler.sources.premier_league import PremierLeagueDataSource
+
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "premier_league"
+SLOW_SECONDS = 0.4
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802
+        time.sleep(SLOW_SECONDS)
+        fixture = "teams_official.html" if self.path.startswith("/teams") else "matches_official.html"
+        body = (FIXTURE_DIR / fixture).read_bytes()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+@pytest.fixture()
+def slow_server() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _server_urls(base_url: str) -> dict[str, str]:
+    return {
+        "teams_url": f"{base_url}/teams",
+        "players_url": f"{base_url}/players",
+        "matches_url": f"{base_url}/matches",
+        "match_stats_url": f"{base_url}/match-stats",
+    }
+
+
+def _load_all(source: PremierLeagueDataSource) -> float:
+    started = time.perf_counter()
+    source.prefetch()
+    source.load_teams()
+    source.load_players()
+    source.load_matches()
+    source.load_match_stats()
+    return time.perf_counter() - started
+
+
+def test_prefetch_wall_time_tracks_slowest_fetch(
+    slow_server: str, make_source_config: Callable[..., SourceConfig]
+) -> None:
+    source = PremierLeagueDataSource(
+        make_source_config(**_server_urls(slow_server), timeout_seconds=5, fetch_concurrency=4)
+    )
+
+    elapsed = _load_all(source)
+
+    assert elapsed < SLOW_SECONDS * 2
+    assert len(source.load_matches()) == 2
+
+
+def test_prefetch_concurrency_cap_of_one_serializes_fetches(
+    slow_server: str, make_source_config: Callable[..., SourceConfig]
+) -> None:
+    source = PremierLeagueDataSource(
+        make_source_config(**_server_urls(slow_server), timeout_seconds=5, fetch_concurrency=1)
+    )
+
+    elapsed = _load_all(source)
+
+    assert elapsed >= SLOW_SECONDS * 4
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from crawler.config import SourceConfig
+from crawler.sources.premier_league import ParsedRecords, PremierLeagueDataSource
+
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "premier_league"
+TEAMS_ETAG = '"teams-v1"'
+
+
+class _ConditionalHandler(BaseHTTPRequestHandler):
+    requests_seen: list[dict[str, str | None]] = []
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.requests_seen.append(
+            {
+                "path": self.path,
+                "if_none_match": self.headers.get("If-None-Match"),
+            }
+        )
+        if self.headers.get("If-None-Match") == TEAMS_ETAG:
+            self.send_response(304)
+            self.send_header("ETag", TEAMS_ETAG)
+            self.end_headers()
+            return
+        body = (FIXTURE_DIR / "teams_official.html").read_bytes()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", TEAMS_ETAG)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+@pytest.fixture()
+def teams_server() -> Iterator[str]:
+    _ConditionalHandler.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ConditionalHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/clubs"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_not_modified_response_reuses_cached_body_and_parse(
+    teams_server: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, make_source_config: Callable[..., SourceConfig]
+) -> None:
+    config = make_source_config(teams_url=teams_server, timeout_seconds=5, http_cache_dir=str(tmp_path / "cache"))
+    first = PremierLeagueDataSource(config)
+    teams = first.load_teams()
+    assert len(teams) == 2
+
+    second = PremierLeagueDataSource(config)
+
+    def fail_parse(*_: object) -> ParsedRecords:
+        raise AssertionError("unchanged page must not be re-parsed")
+
+    monkeypatch.setattr(second, "_parse_records", fail_parse)
+    cached_teams = second.load_teams()
+
+    assert cached_teams == teams
+    assert [seen["if_none_match"] for seen in _ConditionalHandler.requests_seen] == [None, TEAMS_ETAG]
+
+
+def test_unchanged_body_without_validators_skips_parse(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, make_source_config: Callable[..., SourceConfig]
+) -> None:
+    teams_url = (FIXTURE_DIR / "teams_official.html").resolve().as_uri()
+    config = make_source_config(teams_url=teams_url, http_cache_dir=str(tmp_path / "cache"))
+    first = PremierLeagueDataSource(config)
+    teams = first.load_teams()
+
+    second = PremierLeagueDataSource(config)
+    monkeypatch.setattr(second, "_parse_records", lambda *_: ParsedRecords(strategy="", columns=(), rows=[]))
+
+    assert second.load_teams() == teams
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import gzip
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import URLError
+
+import pytest
+
+from crawler.sources.http_session import HttpSession
+
+
+BODY = b"<html><body>" + b"<p>keep-alive</p>" * 200 + b"</body></html>"
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports: list[int] = []
+    if_none_match: dict[str, str | None] = {}
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.client_ports.append(self.client_address[1])
+        self.if_none_match[self.path] = self.headers.get("If-None-Match")
+        if self.path == "/loop":
+            self.send_response(302)
+            self.send_header("Location", "/loop")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/page")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = BODY
+        self.send_response(200)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(BODY)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+
+@pytest.fixture()
+def keep_alive_server() -> Iterator[str]:
+    _KeepAliveHandler.client_ports = []
+    _KeepAliveHandler.if_none_match = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _session() -> HttpSession:
+    return HttpSession(timeout_seconds=5, verify_ssl=True, ca_file=None, user_agent="test-agent")
+
+
+def test_session_reuses_connection_and_decodes_gzip(keep_alive_server: str) -> None:
+    session = _session()
+    try:
+        first = session.get(f"{keep_alive_server}/page")
+        second = session.get(f"{keep_alive_server}/page")
+    finally:
+        session.close()
+
+    assert first.body == BODY
+    assert second.body == BODY
+    assert first.reused_connection is False
+    assert second.reused_connection is True
+    assert len(set(_KeepAliveHandler.client_ports)) == 1
+    assert set(first.timings) == {"dns_ms", "connect_ms", "tls_ms", "ttfb_ms", "body_ms", "total_ms"}
+    assert first.timings["connect_ms"] > 0
+    assert second.timings["connect_ms"] == 0
+
+
+def test_session_follows_redirects(keep_alive_server: str) -> None:
+    session = _session()
+    try:
+        response = session.get(f"{keep_alive_server}/moved", headers={"If-None-Match": '"v1"'})
+    finally:
+        session.close()
+
+    assert response.status == 200
+    assert response.url.endswith("/page")
+    assert response.body == BODY
+    assert _KeepAliveHandler.if_none_match == {"/moved": '"v1"', "/page": None}
+
+
+def test_session_gives_up_on_redirect_loops(keep_alive_server: str) -> None:
+    session = _session()
+    try:
+        with pytest.raises(URLError, match="too many redirects"):
+            session.get(f"{keep_alive_server}/loop")
+    finally:
+        session.close()
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from crawler.sources.premier_league import MATCH_ALIASES, _map_json_candidate
+from crawler.sources.sample_data import next_data_fixtures
+
+
+RECORD_COUNT = 1_000
+
+
+def test_json_record_flattening_maps_every_fixture() -> None:
+    mapped = _map_json_candidate(next_data_fixtures(RECORD_COUNT), MATCH_ALIASES, ["round"])
+
+    assert len(mapped) == RECORD_COUNT
+    assert mapped[0]["round"] == "1"
+    assert mapped[-1]["round"] == str((RECORD_COUNT - 1) % 38 + 1)
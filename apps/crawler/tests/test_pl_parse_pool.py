@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pickle
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from crawler.config import SourceConfig
+from crawler.sources import premier_league
+from crawler.sources.premier_league import PremierLeagueDataSource, parse_page
+
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "premier_league"
+FIXTURE_URLS = {
+    "teams_url": (FIXTURE_DIR / "teams_official.html").resolve().as_uri(),
+    "players_url": "file:///dev/null",
+    "matches_url": (FIXTURE_DIR / "matches_official.html").resolve().as_uri(),
+    "match_stats_url": (FIXTURE_DIR / "match_stats_official.html").resolve().as_uri(),
+}
+
+
+def _load(source: PremierLeagueDataSource) -> tuple[list, list, list]:
+    source.prefetch(["teams", "matches", "match_stats"])
+    return source.load_teams(), source.load_matches(), source.load_match_stats()
+
+
+def test_parse_page_returns_compact_picklable_rows() -> None:
+    html = (FIXTURE_DIR / "matches_official.html").read_text(encoding="utf-8")
+
+    parsed = parse_page("matches", html)
+    restored = pickle.loads(pickle.dumps(parsed))
+
+    assert parsed.strategy == "json"
+    assert all(isinstance(row, tuple) and len(row) == len(parsed.columns) for row in parsed.rows)
+    assert restored == parsed
+    assert restored.records()[0]["home_team_short_name"] == "ARS"
+
+
+def test_parse_workers_match_in_process_parsing(make_source_config: Callable[..., SourceConfig]) -> None:
+    assert _load(PremierLeagueDataSource(make_source_config(**FIXTURE_URLS, parse_workers=2))) == _load(
+        PremierLeagueDataSource(make_source_config(**FIXTURE_URLS, parse_workers=0))
+    )
+
+
+def test_prefetched_pages_are_submitted_for_parsing_once(
+    monkeypatch: pytest.MonkeyPatch, make_source_config: Callable[..., SourceConfig]
+) -> None:
+    submitted: list[str] = []
+    executor = ThreadPoolExecutor(max_workers=2)
+    original_submit = executor.submit
+
+    def counting_submit(fn, dataset, *args):
+        submitted.append(dataset)
+        return original_submit(fn, dataset, *args)
+
+    monkeypatch.setattr(executor, "submit", counting_submit)
+    monkeypatch.setattr(premier_league, "_parse_executor", lambda _workers: executor)
+    try:
+        teams, matches, stats = _load(PremierLeagueDataSource(make_source_config(**FIXTURE_URLS, parse_workers=2)))
+    finally:
+        executor.shutdown()
+
+    assert sorted(submitted) == ["match_stats", "matches", "teams"]
+    assert teams and matches and stats
+
+
+def test_datasets_sharing_a_page_parse_it_separately(
+    tmp_path: Path, make_source_config: Callable[..., SourceConfig]
+) -> None:
+    shared = tmp_path / "round.html"
+    shared.write_text(
+        (FIXTURE_DIR / "matches_official.html").read_text(encoding="utf-8")
+        + (FIXTURE_DIR / "match_stats_official.html").read_text(encoding="utf-8"),
+        encoding="utf-8",
+    )
+
+    def load(parse_workers: int) -> tuple[list, list, list]:
+        urls = {**FIXTURE_URLS, "matches_url": shared.as_uri(), "match_stats_url": shared.as_uri()}
+        config = make_source_config(**urls, parse_workers=parse_workers)
+        return _load(PremierLeagueDataSource(config))
+
+    teams, matches, stats = load(parse_workers=2)
+
+    assert (teams, matches, stats) == load(parse_workers=0)
+    assert matches and stats
+    assert "home_team_short_name" in matches[0] and "team_short_name" in stats[0]
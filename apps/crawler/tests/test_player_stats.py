@@ -0,0 +1,164 @@
+from collections.abc import Callable
+from pathlib import Path
+
+from crawler.db import Database
+from crawler.ingest import upsert_matches, upsert_players, upsert_teams
+from crawler.player_stats import players_touched_by, refresh_player_season_stats
+from crawler.sources.sample_data import MATCHES, PLAYERS, TEAMS
+
+
+def _seed(db: Database) -> dict[tuple[str, str], int]:
+    upsert_teams(db, TEAMS)
+    upsert_players(db, PLAYERS)
+    upsert_matches(db, MATCHES)
+    rows = db.fetchall(
+        """
+        SELECT m.match_id, h.short_name AS home, a.short_name AS away
+        FROM matches m
+        JOIN teams h ON h.team_id = m.home_team_id
+        JOIN teams a ON a.team_id = m.away_team_id
+        """
+    )
+    return {(str(row["home"]), str(row["away"])): int(row["match_id"]) for row in rows}
+
+
+def _team_id(db: Database, short_name: str) -> int:
+    row = db.fetchone("SELECT team_id FROM teams WHERE short_name = ?", (short_name,))
+    assert row is not None
+    return int(row["team_id"])
+
+
+def _stats(db: Database) -> dict[int, dict]:
+    rows = db.fetchall("SELECT player_id, goals, assists, attack_points, clean_sheets FROM player_season_stats")
+    return {int(row["player_id"]): dict(row) for row in rows}
+
+
+def test_refresh_player_season_stats_from_events_and_lineups(connect_db: Callable[[str], Database]) -> None:
+    db = connect_db("player_stats.db")
+    try:
+        matches = _seed(db)
+        ars, liv = _team_id(db, "ARS"), _team_id(db, "LIV")
+        ars_che, liv_ars = matches[("ARS", "CHE")], matches[("LIV", "ARS")]
+        db.executemany(
+            "INSERT INTO match_lineups(match_id, team_id, player_id) VALUES(?, ?, ?)",
+            [(ars_che, ars, 101), (ars_che, ars, 102), (liv_ars, liv, 201)],
+        )
+        db.executemany(
+            "INSERT INTO match_events(match_id, minute, event_type, team_id, player_id) VALUES(?, ?, ?, ?, ?)",
+            [
+                (ars_che, 12, "GOAL", ars, 101),
+                (ars_che, 12, "ASSIST", ars, 102),
+                (ars_che, 70, "PENALTY_GOAL", ars, 101),
+                (ars_che, 70, "YELLOW_CARD", ars, 102),
+            ],
+        )
+        result = refresh_player_season_stats(db)
+        stats = _stats(db)
+    finally:
+        db.close()
+
+    assert result.written == 2
+    assert stats[101] == {"player_id": 101, "goals": 2, "assists": 0, "attack_points": 2, "clean_sheets": 0}
+    assert stats[102] == {"player_id": 102, "goals": 0, "assists": 1, "attack_points": 1, "clean_sheets": 0}
+    assert 201 not in stats
+
+
+def test_refresh_player_season_stats_recomputes_only_touched_players(connect_db: Callable[[str], Database]) -> None:
+    db = connect_db("player_stats_incremental.db")
+    try:
+        matches = _seed(db)
+        ars, liv = _team_id(db, "ARS"), _team_id(db, "LIV")
+        ars_che, liv_ars = matches[("ARS", "CHE")], matches[("LIV", "ARS")]
+        db.executemany(
+            "INSERT INTO match_lineups(match_id, team_id, player_id) VALUES(?, ?, ?)",
+            [(ars_che, ars, 101), (liv_ars, ars, 102), (liv_ars, liv, 201)],
+        )
+        db.execute(
+            "INSERT INTO match_events(match_id, minute, event_type, team_id, player_id) VALUES(?, ?, ?, ?, ?)",
+            (ars_che, 30, "GOAL", ars, 101),
+        )
+        refresh_player_season_stats(db)
+
+        finished = [{**MATCHES[1], "home_score": 1, "away_score": 0, "status": "FINISHED"}]
+        results = {"matches": upsert_matches(db, [MATCHES[0], *finished])}
+        touched = players_touched_by(results, db)
+        refreshed = refresh_player_season_stats(db, touched)
+        stats = _stats(db)
+    finally:
+        db.close()
+
+    assert touched == {102, 201}
+    assert (refreshed.written, refreshed.skipped) == (1, 0)
+    assert refreshed.changed_keys == {(201,)}
+    assert stats[201]["clean_sheets"] == 1
+    assert stats[101]["goals"] == 1
+
+
+def test_ingested_lineups_drive_clean_sheets_for_lineup_only_players(connect_db: Callable[[str], Database]) -> None:
+    from crawler.ingest import upsert_match_lineups
+
+    db = connect_db("player_stats_lineups.db")
+    try:
+        upsert_teams(db, TEAMS)
+        upsert_players(db, PLAYERS)
+        upsert_matches(db, [MATCHES[0], {**MATCHES[1], "home_score": 0, "away_score": 1, "status": "FINISHED"}])
+        lineup = {"round": 1, "home_team_short_name": "LIV", "away_team_short_name": "ARS", "team_short_name": "ARS"}
+        results = {
+            "match_lineups": upsert_match_lineups(
+                db, [{**lineup, "player_id": 102}, {**lineup, "player_id": 999}]
+            )
+        }
+        touched = players_touched_by(results, db)
+        refresh_player_season_stats(db, touched)
+        again = upsert_match_lineups(db, [{**lineup, "player_id": 102}])
+        stats = _stats(db)
+    finally:
+        db.close()
+
+    assert (results["match_lineups"].written, results["match_lineups"].skipped) == (1, 1)
+    assert touched == {102}
+    assert stats[102]["clean_sheets"] == 1
+    assert (again.written, again.skipped) == (0, 1)
+
+
+def test_pl_source_parses_lineup_tables(tmp_path: Path) -> None:
+    from crawler.config import SourceConfig
+    from crawler.sources.premier_league import PremierLeagueDataSource
+
+    page = tmp_path / "lineups.html"
+    page.write_text(
+        "<table><tr><th>Matchweek</th><th>Home</th><th>Away</th><th>Team</th><th>Player ID</th></tr>"
+        "<tr><td>1</td><td>ARS</td><td>CHE</td><td>ARS</td><td>101</td></tr>"
+        "<tr><td>1</td><td>ARS</td><td>CHE</td><td>ARS</td><td>n/a</td></tr></table>",
+        encoding="utf-8",
+    )
+    config = SourceConfig(
+        source="pl",
+        teams_url="file:///dev/null",
+        players_url="file:///dev/null",
+        matches_url="file:///dev/null",
+        match_stats_url="file:///dev/null",
+        timeout_seconds=1,
+        verify_ssl=True,
+        ca_file=None,
+        retry_count=1,
+        retry_backoff_seconds=0.0,
+        parse_strict=False,
+        dataset_policy_teams="skip",
+        dataset_policy_players="skip",
+        dataset_policy_matches="skip",
+        dataset_policy_match_stats="skip",
+        teams_seed_fallback=False,
+        matches_seed_fallback=False,
+        match_lineups_url=page.as_uri(),
+    )
+
+    assert PremierLeagueDataSource(config).load_match_lineups() == [
+        {
+            "round": 1,
+            "home_team_short_name": "ARS",
+            "away_team_short_name": "CHE",
+            "team_short_name": "ARS",
+            "player_id": 101,
+        }
+    ]
@@ -264,3 +264,74 @@ def test_premierleague_fetch_retry(monkeypatch: pytest.MonkeyPatch) -> None:
     teams = source.load_teams()
     assert len(teams) == 2
     assert attempts["count"] == 3
+
+
+def test_document_parser_single_pass_across_strategies(monkeypatch: pytest.MonkeyPatch) -> None:
+    from crawler.sources import premier_league
+
+    calls = {"count": 0}
+    original = premier_league.parse_document
+
+    def counting_parse(chunks):
+        calls["count"] += 1
+        return original(chunks)
+
+    monkeypatch.setattr(premier_league, "parse_document", counting_parse)
+    source = PremierLeagueDataSource(_source_config())
+    monkeypatch.setattr(source, "_http_get", lambda _: _fixture_html("teams_links_fallback.html"))
+
+    teams = source.load_teams()
+
+    assert len(teams) == 3
+    assert calls["count"] == 1
+
+
+def test_document_parser_accepts_incremental_chunks() -> None:
+    from crawler.sources.premier_league import parse_document
+
+    html = _fixture_html("matches_official.html")
+    whole = parse_document([html])
+    chunked = parse_document(html[idx : idx + 17] for idx in range(0, len(html), 17))
+
+    assert chunked == whole
+    assert chunked.script_blocks
+
+
+def test_inline_json_scan_falls_back_to_nested_spans_and_skips_duplicates() -> None:
+    from crawler.sources.premier_league import _extract_inline_json_objects
+
+    script = (
+        'init({mode: "x", data: {"teams": [{"shortName": "ARS"}]}, note: "}"});'
+        ' var tail = [1, "a\\"]", 2]; broken({'
+        ' other({"shortName": "CHE"});'
+    )
+
+    values = _extract_inline_json_objects(script)
+
+    assert values == [
+        {"teams": [{"shortName": "ARS"}]},
+        [1, 'a"]', 2],
+        {"shortName": "CHE"},
+    ]
+    assert _extract_inline_json_objects(script, {'{"shortName": "CHE"}'})[-1] == [1, 'a"]', 2]
+    assert _extract_inline_json_objects('var s = "{"; var d = {"teams":[{"shortName":"ARS"}]};') == [
+        {"teams": [{"shortName": "ARS"}]}
+    ]
+    assert _extract_inline_json_objects("var q = '[x'; f({\"shortName\": \"LIV\"});") == [{"shortName": "LIV"}]
+
+
+@pytest.mark.parametrize("filler", ["function g(){return '{'}\n", "if (a) {\n", "x = [{]\n"])
+def test_inline_json_scan_stays_linear_on_unclosed_js_blocks(filler: str) -> None:
+    import time
+
+    from crawler.sources.premier_league import _extract_inline_json_objects
+
+    script = filler * (200_000 // len(filler)) + 'var d = {"shortName": "ARS"};'
+
+    started = time.perf_counter()
+    values = _extract_inline_json_objects(script)
+    elapsed = time.perf_counter() - started
+
+    assert values[-1] == {"shortName": "ARS"}
+    # A rescan per unclosed opener took tens of seconds here; one pass takes well under one.
+    assert elapsed < 2.0
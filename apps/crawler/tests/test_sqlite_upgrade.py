@@ -0,0 +1,168 @@
+import sqlite3
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from crawler.db import Database
+from crawler.ingest import ingest_all, upsert_matches, upsert_teams
+from crawler.sources.sample_data import MATCH_STATS, MATCHES, TEAMS
+
+# Tables as the crawler created them before matches, standings and player stats carried a season.
+PRE_SEASON_SCHEMA = """
+CREATE TABLE teams (
+    team_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    short_name TEXT NOT NULL UNIQUE,
+    logo_url TEXT,
+    stadium TEXT,
+    manager TEXT
+);
+CREATE TABLE players (
+    player_id INTEGER PRIMARY KEY,
+    team_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    position TEXT NOT NULL,
+    jersey_num INTEGER,
+    nationality TEXT,
+    photo_url TEXT,
+    FOREIGN KEY (team_id) REFERENCES teams(team_id)
+);
+CREATE TABLE matches (
+    match_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    round INTEGER NOT NULL,
+    match_date TEXT NOT NULL,
+    home_team_id INTEGER NOT NULL,
+    away_team_id INTEGER NOT NULL,
+    home_score INTEGER,
+    away_score INTEGER,
+    status TEXT NOT NULL,
+    FOREIGN KEY (home_team_id) REFERENCES teams(team_id),
+    FOREIGN KEY (away_team_id) REFERENCES teams(team_id),
+    UNIQUE(round, home_team_id, away_team_id)
+);
+CREATE INDEX idx_matches_round ON matches(round);
+CREATE TABLE match_stats (
+    stat_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    match_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    possession REAL,
+    shots INTEGER,
+    shots_on_target INTEGER,
+    fouls INTEGER,
+    corners INTEGER,
+    FOREIGN KEY (match_id) REFERENCES matches(match_id),
+    FOREIGN KEY (team_id) REFERENCES teams(team_id),
+    UNIQUE(match_id, team_id)
+);
+CREATE TABLE match_events (
+    event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    match_id INTEGER NOT NULL,
+    minute INTEGER NOT NULL,
+    event_type TEXT NOT NULL,
+    team_id INTEGER,
+    player_id INTEGER,
+    player_name TEXT,
+    detail TEXT,
+    FOREIGN KEY (match_id) REFERENCES matches(match_id)
+);
+CREATE TABLE standings (
+    team_id INTEGER PRIMARY KEY,
+    rank INTEGER NOT NULL,
+    played INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    drawn INTEGER NOT NULL,
+    lost INTEGER NOT NULL,
+    goals_for INTEGER NOT NULL,
+    goals_against INTEGER NOT NULL,
+    goal_diff INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+    FOREIGN KEY (team_id) REFERENCES teams(team_id)
+);
+"""
+PRE_SEASON_ROWS = """
+INSERT INTO teams(team_id, name, short_name) VALUES (1, 'Arsenal', 'ARS'), (2, 'Chelsea', 'CHE');
+INSERT INTO matches(match_id, round, match_date, home_team_id, away_team_id, home_score, away_score, status)
+VALUES (7, 38, '2025-05-25 16:00:00', 1, 2, 1, 0, 'FINISHED'),
+       (9, 1, '2025-08-16 15:00:00', 2, 1, 2, 2, 'FINISHED');
+INSERT INTO match_stats(match_id, team_id, shots) VALUES (9, 1, 11);
+INSERT INTO match_events(match_id, minute, event_type, team_id) VALUES (9, 12, 'GOAL', 2);
+INSERT INTO standings VALUES (1, 1, 1, 0, 1, 0, 2, 2, 0, 1);
+"""
+
+
+def test_bootstrap_upgrades_a_pre_season_database_in_place(
+    tmp_path: Path, connect_db: Callable[[str], Database]
+) -> None:
+    db_path = tmp_path / "pre_season.db"
+    legacy = sqlite3.connect(db_path)
+    legacy.executescript(PRE_SEASON_SCHEMA + PRE_SEASON_ROWS)
+    legacy.close()
+
+    db = connect_db("pre_season.db")
+    try:
+        db.bootstrap()
+        seasons = {row["match_id"]: row["season"] for row in db.fetchall("SELECT match_id, season FROM matches")}
+        standings = db.fetchall("SELECT season, team_id, points FROM standings")
+        stats_match = db.fetchone("SELECT m.season FROM match_stats s JOIN matches m ON m.match_id = s.match_id")
+        events = db.fetchall("SELECT source_event_id FROM match_events")
+
+        upsert_teams(db, TEAMS)
+        upsert_matches(db, MATCHES, season=2025)
+        added = db.fetchone("SELECT COUNT(*) AS n FROM matches WHERE season = 2025")
+        violations = db.fetchall("PRAGMA foreign_key_check")
+    finally:
+        db.close()
+
+    assert seasons == {7: 2024, 9: 2025}
+    assert standings == [{"season": 2025, "team_id": 1, "points": 1}]
+    assert stats_match == {"season": 2025}
+    assert events == [{"source_event_id": None}]
+    assert added == {"n": 1 + len(MATCHES)}
+    assert violations == []
+
+
+def test_reingesting_after_the_upgrade_updates_fixtures_in_place(
+    tmp_path: Path, connect_db: Callable[[str], Database], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    legacy = sqlite3.connect(tmp_path / "reingest.db")
+    legacy.executescript(PRE_SEASON_SCHEMA)
+    legacy.executemany(
+        "INSERT INTO teams(name, short_name, logo_url, stadium, manager) VALUES(?, ?, ?, ?, ?)",
+        [(team["name"], team["short_name"], team["logo_url"], team["stadium"], team["manager"]) for team in TEAMS],
+    )
+    legacy.executemany(
+        """
+        INSERT INTO matches(round, match_date, home_team_id, away_team_id, home_score, away_score, status)
+        SELECT ?, ?, h.team_id, a.team_id, ?, ?, ? FROM teams h, teams a WHERE h.short_name = ? AND a.short_name = ?
+        """,
+        [
+            (
+                match["round"],
+                match["match_date"],
+                match["home_score"],
+                match["away_score"],
+                match["status"],
+                match["home_team_short_name"],
+                match["away_team_short_name"],
+            )
+            for match in MATCHES
+        ],
+    )
+    legacy.commit()
+    legacy.close()
+    monkeypatch.setenv("CRAWLER_DATA_SOURCE", "sample")
+    monkeypatch.delenv("CRAWLER_SEASON", raising=False)
+
+    db = connect_db("reingest.db")
+    try:
+        before = dict(db.itertuples("SELECT match_id, season FROM matches"))
+        ingest_all(db)
+        after = dict(db.itertuples("SELECT match_id, season FROM matches"))
+        stats = db.fetchone("SELECT COUNT(*) AS n FROM match_stats")
+    finally:
+        db.close()
+
+    assert before == after
+    assert set(after.values()) == {2025}
+    assert stats == {"n": len(MATCH_STATS)}
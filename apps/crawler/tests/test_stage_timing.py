@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+import pstats
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from crawler.batch_runner import _run_batch, _run_daily
+from crawler.config import SourceConfig
+from crawler.sources.premier_league import PremierLeagueDataSource
+from crawler.timing import recording, span
+
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "premier_league"
+
+
+def _events(output: str, name: str) -> list[dict]:
+    events = [json.loads(line) for line in output.splitlines() if line.startswith("{")]
+    return [event["context"] for event in events if event["event"] == name]
+
+
+def test_span_rolls_into_recording_and_logs_failures(capsys: pytest.CaptureFixture[str]) -> None:
+    with recording() as recorder:
+        with span("write", dataset="teams") as writing:
+            writing.rows_written = 20
+        with pytest.raises(RuntimeError):
+            with span("write", dataset="matches"):
+                raise RuntimeError("boom")
+
+    stages = recorder.summary()["stages"]
+    assert stages["write"]["calls"] == 2
+    assert stages["write"]["rows_written"] == 20
+    timings = _events(capsys.readouterr().out, "stage.timing")
+    assert [event["dataset"] for event in timings] == ["teams", "matches"]
+    assert timings[1]["failed"] is True
+
+
+def test_pl_source_records_fetch_bytes_and_parsed_rows(make_source_config: Callable[..., SourceConfig]) -> None:
+    config = make_source_config(
+        teams_url=(FIXTURE_DIR / "teams_official.html").resolve().as_uri(),
+        matches_url=(FIXTURE_DIR / "matches_official.html").resolve().as_uri(),
+    )
+    with recording() as recorder:
+        source = PremierLeagueDataSource(config)
+        source.load_teams()
+        source.load_matches()
+
+    stages = recorder.summary()["stages"]
+    assert stages["fetch"]["calls"] == 2
+    assert stages["fetch"]["bytes"] > 0
+    assert stages["parse"]["rows_parsed"] > 0
+
+
+def test_batch_success_summarizes_stages_and_dumps_profile(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    profile_path = tmp_path / "daily.prof"
+    monkeypatch.setenv("DB_URL", f"sqlite:///{(tmp_path / 'timing.db').as_posix()}")
+    monkeypatch.setenv("CRAWLER_DATA_SOURCE", "sample")
+    monkeypatch.setenv("BATCH_PROFILE_OUT", str(profile_path))
+
+    assert _run_batch(job_name="daily_update", run_fn=_run_daily) == 0
+
+    (success,) = _events(capsys.readouterr().out, "batch.success")
+    stages = success["timings"]["stages"]
+    assert {"bootstrap", "write", "derive", "commit"} <= set(stages)
+    assert stages["write"]["calls"] == 6
+    assert stages["write"]["rows_written"] == sum(
+        success["summary"][f"{dataset}_written"]
+        for dataset in ("teams", "players", "matches", "match_stats", "match_events", "match_lineups")
+    )
+    assert success["timings"]["elapsed_ms"] >= stages["write"]["wall_ms"]
+    assert pstats.Stats(str(profile_path)).total_calls > 0
@@ -0,0 +1,119 @@
+from collections.abc import Callable
+
+import pytest
+
+from crawler.db import Database
+from crawler.ingest import upsert_matches, upsert_teams
+from crawler.sources.sample_data import MATCHES, TEAMS
+from crawler.standings import refresh_standings, teams_touched_by
+
+
+def _table(db: Database) -> dict[str, dict]:
+    rows = db.fetchall(
+        """
+        SELECT t.short_name, s.rank, s.played, s.won, s.drawn, s.lost, s.goals_for, s.goals_against, s.goal_diff, s.points
+        FROM standings s JOIN teams t ON t.team_id = s.team_id
+        """
+    )
+    return {str(row["short_name"]): dict(row) for row in rows}
+
+
+def test_refresh_standings_builds_table_from_finished_matches(connect_db: Callable[[str], Database]) -> None:
+    db = connect_db("standings.db")
+    try:
+        results = {"teams": upsert_teams(db, TEAMS), "matches": upsert_matches(db, MATCHES)}
+        refresh_standings(db, teams_touched_by(results, db))
+        table = _table(db)
+    finally:
+        db.close()
+
+    assert table["ARS"] == {
+        "short_name": "ARS",
+        "rank": 1,
+        "played": 1,
+        "won": 1,
+        "drawn": 0,
+        "lost": 0,
+        "goals_for": 2,
+        "goals_against": 1,
+        "goal_diff": 1,
+        "points": 3,
+    }
+    assert table["LIV"]["played"] == 0
+    assert (table["LIV"]["rank"], table["CHE"]["rank"]) == (2, 3)
+
+
+def test_refresh_standings_recomputes_only_touched_teams(connect_db: Callable[[str], Database]) -> None:
+    db = connect_db("standings_incremental.db")
+    try:
+        upsert_teams(db, TEAMS)
+        upsert_matches(db, MATCHES)
+        refresh_standings(db)
+
+        finished = [{**MATCHES[1], "home_score": 3, "away_score": 0, "status": "FINISHED"}]
+        results = {"matches": upsert_matches(db, [MATCHES[0], *finished])}
+        touched = teams_touched_by(results, db)
+        refreshed = refresh_standings(db, touched)
+        table = _table(db)
+    finally:
+        db.close()
+
+    assert len(touched) == 2
+    assert refreshed.written == 2
+    assert table["LIV"]["points"] == 3
+    assert table["LIV"]["goal_diff"] == 3
+    assert table["ARS"]["lost"] == 1
+    assert table["CHE"]["played"] == 1
+    assert [name for name, _ in sorted(table.items(), key=lambda item: item[1]["rank"])] == ["LIV", "ARS", "CHE"]
+
+
+def test_refresh_standings_keeps_seasons_apart(connect_db: Callable[[str], Database]) -> None:
+    db = connect_db("standings_seasons.db")
+    try:
+        upsert_teams(db, TEAMS)
+        upsert_matches(db, MATCHES, season=2024)
+        reversed_result = [{**MATCHES[0], "home_score": 0, "away_score": 2}]
+        second = upsert_matches(db, reversed_result, season=2025)
+        refresh_standings(db, season=2024)
+        refresh_standings(db, season=2025)
+        match_count = db.fetchone("SELECT COUNT(*) AS cnt FROM matches")
+        rows = db.fetchall(
+            """
+            SELECT s.season, s.rank, s.points
+            FROM standings s JOIN teams t ON t.team_id = s.team_id
+            WHERE t.short_name = 'ARS'
+            ORDER BY s.season
+            """
+        )
+    finally:
+        db.close()
+
+    assert second.written == 1
+    assert match_count is not None and int(match_count["cnt"]) == len(MATCHES) + 1
+    assert [tuple(row.values()) for row in rows] == [(2024, 1, 3), (2025, 2, 0)]
+
+
+def test_weekly_sync_refreshes_standings_before_the_next_daily_run(
+    connect_db: Callable[[str], Database], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from crawler import batch_runner
+    from crawler.sources import sample_data
+
+    connect_db("weekly_then_daily.db").close()
+    monkeypatch.setenv("CRAWLER_DATA_SOURCE", "sample")
+    monkeypatch.setenv("BATCH_RETRY_COUNT", "1")
+
+    assert batch_runner.daily_update() == 0
+    finished = {**sample_data.MATCHES[1], "home_score": 3, "away_score": 0, "status": "FINISHED"}
+    monkeypatch.setattr(sample_data, "MATCHES", [sample_data.MATCHES[0], finished])
+    assert batch_runner.weekly_sync() == 0
+    assert batch_runner.daily_update() == 0
+
+    db = connect_db("weekly_then_daily.db")
+    try:
+        table = _table(db)
+    finally:
+        db.close()
+
+    assert (finished["home_team_short_name"], finished["away_team_short_name"]) == ("LIV", "ARS")
+    assert (table["LIV"]["played"], table["LIV"]["points"], table["LIV"]["rank"]) == (1, 3, 1)
@@ -67,6 +67,7 @@ export async function listMatches(params: {
   team_id?: number;
   limit?: number;
   offset?: number;
+  cursor?: string;
 }): Promise<MatchListResponse> {
   return fetchJson<MatchListResponse>(
     withQuery("/matches", {
@@ -74,7 +75,8 @@ export async function listMatches(params: {
       month: params.month,
       team_id: params.team_id,
       limit: params.limit,
-      offset: params.offset
+      offset: params.offset,
+      cursor: params.cursor
     })
   );
 }
@@ -10,8 +10,9 @@ export interface MatchListItem {
 }
 
 export interface MatchListResponse {
-  total: number;
+  total: number | null;
   items: MatchListItem[];
+  next_cursor: string | null;
 }
 
 export interface MatchEventItem {